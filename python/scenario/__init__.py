@@ -93,34 +93,106 @@ Integration with Testing Frameworks:
 For more examples and detailed documentation, visit: https://github.com/langwatch/scenario
 """
 
-# First import non-dependent modules
-from .types import ScenarioResult, AgentInput, AgentRole, AgentReturnTypes
-from .config import ScenarioConfig
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .types import ScenarioResult, AgentInput, AgentRole, AgentReturnTypes
+    from .config import ScenarioConfig
+    from .scenario_executor import run
+    from .scenario_state import ScenarioState
+    from .scenario_runtime import ScenarioRuntime
+    from .batch_runner import run_many, ScenarioSpec
+    from .agent_adapter import AgentAdapter
+    from .judge_agent import JudgeAgent
+    from .user_simulator_agent import UserSimulatorAgent
+    from .cache import scenario_cache
+    from ._events import flush_events, pending_events
+    from .script import message, user, agent, judge, proceed, succeed, fail
+
+    configure = ScenarioConfig.configure
+
+    default_config = ScenarioConfig.default_config
+
+    cache = scenario_cache
+
+# The public API is imported lazily, on first access, so that `import scenario`
+# doesn't pay for importing litellm, langwatch and the generated API client
+# until they are actually needed, e.g. in each pytest-xdist worker
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    # Functions
+    "run": (".scenario_executor", "run"),
+    "run_many": (".batch_runner", "run_many"),
+    "configure": (".config", "ScenarioConfig.configure"),
+    "cache": (".cache", "scenario_cache"),
+    "flush_events": ("._events", "flush_events"),
+    "pending_events": ("._events", "pending_events"),
+    # Script
+    "message": (".script", "message"),
+    "proceed": (".script", "proceed"),
+    "succeed": (".script", "succeed"),
+    "fail": (".script", "fail"),
+    "judge": (".script", "judge"),
+    "agent": (".script", "agent"),
+    "user": (".script", "user"),
+    # Types
+    "ScenarioResult": (".types", "ScenarioResult"),
+    "AgentInput": (".types", "AgentInput"),
+    "AgentRole": (".types", "AgentRole"),
+    "ScenarioConfig": (".config", "ScenarioConfig"),
+    "ScenarioSpec": (".batch_runner", "ScenarioSpec"),
+    "AgentReturnTypes": (".types", "AgentReturnTypes"),
+    # Classes
+    "ScenarioState": (".scenario_state", "ScenarioState"),
+    "ScenarioRuntime": (".scenario_runtime", "ScenarioRuntime"),
+    "AgentAdapter": (".agent_adapter", "AgentAdapter"),
+    "UserSimulatorAgent": (".user_simulator_agent", "UserSimulatorAgent"),
+    "JudgeAgent": (".judge_agent", "JudgeAgent"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "default_config":
+        # Not cached, so it always reflects the current global configuration
+        return importlib.import_module(".config", __name__).ScenarioConfig.default_config
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute_path = _LAZY_ATTRIBUTES[name]
+    value: Any = importlib.import_module(module_name, __name__)
+    for attribute in attribute_path.split("."):
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
 
-# Then import modules with dependencies
-from .scenario_executor import run
-from .scenario_state import ScenarioState
-from .agent_adapter import AgentAdapter
-from .judge_agent import JudgeAgent
-from .user_simulator_agent import UserSimulatorAgent
-from .cache import scenario_cache
-from .script import message, user, agent, judge, proceed, succeed, fail
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES, "default_config"])
 
-# Import pytest plugin components
-# from .pytest_plugin import pytest_configure, scenario_reporter
 
-configure = ScenarioConfig.configure
+class _ScenarioModule(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # `scenario.cache` is the caching decorator, don't let importing the
+        # `scenario.cache` submodule it comes from replace it with the module
+        if name == "cache" and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
 
-default_config = ScenarioConfig.default_config
 
-cache = scenario_cache
+sys.modules[__name__].__class__ = _ScenarioModule
 
 __all__ = [
     # Functions
     "run",
+    "run_many",
     "configure",
     "default_config",
     "cache",
+    "flush_events",
+    "pending_events",
     # Script
     "message",
     "proceed",
@@ -134,9 +206,11 @@ __all__ = [
     "AgentInput",
     "AgentRole",
     "ScenarioConfig",
+    "ScenarioSpec",
     "AgentReturnTypes",
     # Classes
     "ScenarioState",
+    "ScenarioRuntime",
     "AgentAdapter",
     "UserSimulatorAgent",
     "JudgeAgent",
@@ -0,0 +1,110 @@
+"""
+Token and cost budgets of scenario runs.
+
+Budgets are enforced before every agent call, against what was spent so far
+by the scenario, and by all the scenarios of the process, the session budget,
+as recorded from the usage and estimated cost of the litellm completions made
+during the agent calls. Once a budget is used up, the scenario ends with a
+failed ScenarioResult instead of calling the next agent.
+
+Completions are recorded through `litellm.completion` and `litellm.acompletion`,
+see `scenario._timings`, so calls made to a provider SDK directly, or through
+litellm functions imported before they were patched, don't count towards
+budgets.
+"""
+
+import threading
+from typing import ClassVar, Optional
+
+from scenario.config import ScenarioConfig
+
+
+class BudgetExceededError(Exception):
+    """
+    Raised by the executor when a token or cost budget is used up, ending the
+    scenario with a failed result.
+    """
+
+    pass
+
+
+class SessionSpend:
+    """
+    Tokens and estimated cost spent by all the scenarios run in this process,
+    checked against the session budgets.
+
+    With `run_many(mode="process")`, the spend of the scenarios run by the
+    worker processes is added up in the parent process as their results come
+    back, and each scenario starts from the spend of the parent. Scenarios
+    still running in other workers are only counted once they finish.
+
+    Example:
+        ```
+        spend = SessionSpend.get()
+        print(f"{spend.tokens} tokens, ${spend.cost:.4f}")
+        ```
+    """
+
+    default_spend: ClassVar[Optional["SessionSpend"]] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, tokens: int = 0, cost: float = 0.0):
+        self.tokens = tokens
+        self.cost = cost
+        self._lock = threading.Lock()
+
+    def add(self, tokens: int, cost: float) -> None:
+        """Add the spend of an agent call"""
+        with self._lock:
+            self.tokens += tokens
+            self.cost += cost
+
+    @classmethod
+    def get(cls) -> "SessionSpend":
+        """Get the spend of the process, shared by all the scenario executors"""
+        with cls._default_lock:
+            if cls.default_spend is None:
+                cls.default_spend = cls()
+            return cls.default_spend
+
+
+def check_budgets(
+    config: ScenarioConfig,
+    scenario_tokens: int,
+    scenario_cost: float,
+    session: SessionSpend,
+) -> None:
+    """
+    Check the spend of a scenario, and of the session, against the budgets.
+
+    Args:
+        config: Configuration of the scenario, holding its budgets
+        scenario_tokens: Tokens spent by the scenario so far
+        scenario_cost: Estimated cost in USD of the scenario so far
+        session: Spend of all the scenarios of the process
+
+    Raises:
+        BudgetExceededError: If any of the budgets is used up
+    """
+    if config.token_budget is not None and scenario_tokens >= config.token_budget:
+        raise BudgetExceededError(
+            f"Scenario token budget exceeded: {scenario_tokens} tokens used, the budget is {config.token_budget}"
+        )
+    if config.cost_budget is not None and scenario_cost >= config.cost_budget:
+        raise BudgetExceededError(
+            f"Scenario cost budget exceeded: ${scenario_cost:.4f} spent, the budget is ${config.cost_budget:.4f}"
+        )
+    if (
+        config.session_token_budget is not None
+        and session.tokens >= config.session_token_budget
+    ):
+        raise BudgetExceededError(
+            f"Session token budget exceeded: {session.tokens} tokens used by all scenarios, the budget is {config.session_token_budget}"
+        )
+    if (
+        config.session_cost_budget is not None
+        and session.cost >= config.session_cost_budget
+    ):
+        raise BudgetExceededError(
+            f"Session cost budget exceeded: ${session.cost:.4f} spent by all scenarios, the budget is ${config.session_cost_budget:.4f}"
+        )
@@ -0,0 +1,18 @@
+"""
+Cache storage backends for the `scenario.cache` decorator.
+
+This module provides the pluggable storage interface behind scenario caching,
+the default single-file SQLite implementation with size limits and LRU
+eviction, and the in-memory LRU tier that sits in front of it.
+"""
+
+from .cache_backend import CacheBackend
+from .memory_cache_backend import CacheStats, MemoryCacheBackend
+from .sqlite_cache_backend import SQLiteCacheBackend
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+]
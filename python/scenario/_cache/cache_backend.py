@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """
+    Abstract base class for the storage behind `scenario.cache`.
+
+    Single responsibility: Store and retrieve serialized values by key. Keys are
+    content-addressed digests computed by the caching layer, and values are
+    already pickled, so backends only ever deal with strings and bytes.
+
+    Implement this interface to plug in a different storage, for example a
+    shared network cache for CI runners.
+
+    Example:
+        ```
+        class DictCacheBackend(CacheBackend):
+            def __init__(self):
+                self.entries = {}
+
+            def get(self, key: str) -> Optional[bytes]:
+                return self.entries.get(key)
+
+            def set(self, key: str, value: bytes) -> None:
+                self.entries[key] = value
+
+            def clear(self) -> None:
+                self.entries.clear()
+        ```
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a value in the cache.
+
+        Args:
+            key: Content-addressed cache key
+
+        Returns:
+            The stored bytes, or None on a cache miss
+        """
+        pass
+
+    def get_entry(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        """
+        Look up a value in the cache, along with when it expires.
+
+        Backends with a TTL should override this, so that tiers in front of
+        them don't keep serving their entries past it.
+
+        Args:
+            key: Content-addressed cache key
+
+        Returns:
+            The stored bytes and their expiry time as a time.time() timestamp,
+            None if they never expire, or None on a cache miss
+        """
+        value = self.get(key)
+        return (value, None) if value is not None else None
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value in the cache, replacing any previous value for the key.
+
+        Args:
+            key: Content-addressed cache key
+            value: Serialized value to store
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        pass
+
+    def close(self) -> None:
+        """Release any resource held by the backend, such as open connections."""
+        pass
@@ -0,0 +1,175 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, TypedDict
+
+from .cache_backend import CacheBackend
+
+
+class CacheStats(TypedDict):
+    """
+    Counters of a MemoryCacheBackend, since it was created or last cleared.
+
+    Attributes:
+        hits: Lookups served from memory
+        backend_hits: Lookups missed in memory but served by the backend behind it
+        misses: Lookups found neither in memory nor in the backend
+        entries: Number of entries currently held in memory
+        size_bytes: Total size of the values currently held in memory
+    """
+
+    hits: int
+    backend_hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Bounded in-process LRU cache, optionally in front of a persistent backend.
+
+    Values are kept in memory up to `max_entries` entries and `max_size_bytes`
+    bytes, evicting the least recently used ones beyond that. Writes go through
+    to the backend behind it, and backend hits are kept in memory for the next
+    lookups, so repeated runs of the same conversations within one process
+    don't pay for disk I/O.
+
+    Each entry keeps its expiry time, the one of the backend entry it was read
+    from, or `ttl_seconds` after it was written, and expired entries are
+    treated as misses.
+
+    A single lock guards the entries, so the same instance can be shared by all
+    the worker threads of the ScenarioRuntime.
+
+    Args:
+        backend: Persistent backend to read from and write through to, if any
+        max_entries: Maximum number of entries held in memory
+        max_size_bytes: Maximum total size of the values held in memory
+        ttl_seconds: Maximum age of an entry written through this tier before it
+                    expires, None to never expire
+
+    Example:
+        ```
+        backend = MemoryCacheBackend(
+            backend=SQLiteCacheBackend(path="/tmp/scenario/cache.sqlite3"),
+            max_size_bytes=64 * 1024 * 1024,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_entries: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+
+        # Values with their expiry time, as a time.time() timestamp
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._backend_hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.time() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                self._remove(key)
+
+        entry = self.backend.get_entry(key) if self.backend is not None else None
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+            self._backend_hits += 1
+            current = self._entries.get(key)
+            if current is not None:
+                # Written by a set() while the backend was being read, which
+                # is newer than what the backend returned
+                self._entries.move_to_end(key)
+                return current[0]
+            self._put(key, *entry)
+        return entry[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        expires_at = (
+            time.time() + self.ttl_seconds if self.ttl_seconds is not None else None
+        )
+        with self._lock:
+            self._put(key, value, expires_at)
+
+        if self.backend is not None:
+            self.backend.set(key, value)
+
+    def _remove(self, key: str) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= len(previous[0])
+
+    def _put(self, key: str, value: bytes, expires_at: Optional[float]) -> None:
+        if self.max_size_bytes is not None and len(value) > self.max_size_bytes:
+            # Too large to ever fit in memory, only the backend keeps it
+            return
+
+        self._remove(key)
+
+        self._entries[key] = (value, expires_at)
+        self._size_bytes += len(value)
+
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (
+                self.max_size_bytes is not None
+                and self._size_bytes > self.max_size_bytes
+            )
+        ):
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._size_bytes -= len(evicted)
+
+    def stats(self) -> CacheStats:
+        """
+        Get the hit and miss counters of the cache.
+
+        Returns:
+            The current cache statistics
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                backend_hits=self._backend_hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._backend_hits = 0
+            self._misses = 0
+
+        if self.backend is not None:
+            self.backend.clear()
+
+    def close(self) -> None:
+        if self.backend is not None:
+            self.backend.close()
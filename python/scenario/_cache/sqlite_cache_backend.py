@@ -0,0 +1,275 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Callable, List, Optional, Tuple
+
+from .cache_backend import CacheBackend
+
+
+# Last access times are only refreshed once they are older than this many
+# seconds, so that reads don't turn into a write on every single cache hit
+_ACCESS_TIME_RESOLUTION = 60.0
+
+# When over the size limit, evict down to this fraction of it, so that
+# eviction runs once in a while instead of on every write
+_EVICTION_LOW_WATERMARK = 0.9
+_EVICTION_BATCH_SIZE = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    total_size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (id, total_size) VALUES (0, 0);
+
+CREATE TRIGGER IF NOT EXISTS entries_after_insert AFTER INSERT ON entries BEGIN
+    UPDATE stats SET total_size = total_size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_after_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE stats SET total_size = total_size - OLD.size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_after_delete AFTER DELETE ON entries BEGIN
+    UPDATE stats SET total_size = total_size - OLD.size WHERE id = 0;
+END;
+"""
+
+
+def _close_process_connections(
+    connections: List[Tuple[int, threading.Thread, sqlite3.Connection]],
+) -> None:
+    pid = os.getpid()
+    for connection_pid, _, conn in connections:
+        # Connections inherited through a fork belong to the parent process
+        if connection_pid == pid:
+            conn.close()
+    connections.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Single-file SQLite cache backend with a size limit and LRU eviction.
+
+    All entries live in one SQLite database, in WAL mode, so the cache stays a
+    single file no matter how many calls are cached, lookups are a primary key
+    index hit even with millions of entries, and concurrent readers and
+    writers, across threads or processes, never see partial writes.
+
+    The total size of the stored values is tracked by triggers in the same
+    transaction as each write, and once it grows beyond `max_size_bytes`, the
+    least recently used entries are evicted. Entries older than `ttl_seconds`,
+    when set, are treated as misses and removed.
+
+    Args:
+        path: Path to the SQLite database file, parent directories are created
+        max_size_bytes: Maximum total size of the cached values, None for unbounded
+        ttl_seconds: Maximum age of an entry before it expires, None to never expire
+
+    Example:
+        ```
+        backend = SQLiteCacheBackend(
+            path="/tmp/scenario/cache.sqlite3",
+            max_size_bytes=500 * 1024 * 1024,
+            ttl_seconds=7 * 24 * 60 * 60,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger("scenario")
+
+        # One connection per thread and process, as sqlite3 connections must not
+        # be shared across threads, nor inherited through a fork
+        self._local = threading.local()
+        # Every connection opened, with the process and thread it belongs to,
+        # so that the ones of threads that exited can be closed too
+        self._connections: List[
+            Tuple[int, threading.Thread, sqlite3.Connection]
+        ] = []
+        self._connections_lock = threading.Lock()
+        # Closes whatever connections are still open once the backend is
+        # garbage collected, so long-lived threads don't keep them around
+        weakref.finalize(self, _close_process_connections, self._connections)
+
+        parent_dir = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent_dir, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[Tuple[int, sqlite3.Connection]] = getattr(
+            self._local, "connection", None
+        )
+        if connection is not None and connection[0] == os.getpid():
+            return connection[1]
+
+        # Only ever used by the thread opening it, check_same_thread is off so
+        # that the connections of threads that exited can be closed from
+        # another thread
+        conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._close_connections(
+            lambda thread: not thread.is_alive(),
+            add=(os.getpid(), threading.current_thread(), conn),
+        )
+        self._local.connection = (os.getpid(), conn)
+        return conn
+
+    def _close_connections(
+        self,
+        predicate: Callable[[threading.Thread], bool],
+        add: Optional[Tuple[int, threading.Thread, sqlite3.Connection]] = None,
+    ) -> None:
+        """
+        Close the connections of this process whose thread matches predicate,
+        optionally tracking a new connection at the same time.
+        """
+        pid = os.getpid()
+        with self._connections_lock:
+            # Connections inherited through a fork belong to the parent process
+            closing = [
+                connection
+                for connection in self._connections
+                if connection[0] == pid and predicate(connection[1])
+            ]
+            # Updated in place, as the finalizer holds on to the same list
+            self._connections[:] = [
+                connection
+                for connection in self._connections
+                if connection not in closing
+            ] + ([add] if add is not None else [])
+
+        for _, _, conn in closing:
+            conn.close()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, created_at, accessed_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, created_at, accessed_at = row
+        now = time.time()
+
+        if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+        if now - accessed_at > _ACCESS_TIME_RESOLUTION:
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+
+        expires_at = (
+            created_at + self.ttl_seconds if self.ttl_seconds is not None else None
+        )
+        return value, expires_at
+
+    def set(self, key: str, value: bytes) -> None:
+        conn = self._connection()
+        now = time.time()
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """
+                INSERT INTO entries (key, value, size, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value,
+                    size = excluded.size,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (key, sqlite3.Binary(value), len(value), now, now),
+            )
+            self._evict_if_needed(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict_if_needed(self, conn: sqlite3.Connection) -> None:
+        if self.max_size_bytes is None:
+            return
+
+        total_size = self.total_size(conn)
+        if total_size <= self.max_size_bytes:
+            return
+
+        target_size = int(self.max_size_bytes * _EVICTION_LOW_WATERMARK)
+        self.logger.debug(
+            f"Cache size {total_size} over limit {self.max_size_bytes}, evicting down to {target_size}"
+        )
+        # Walk the entries from least to most recently used, through the
+        # accessed_at index, until enough space would be freed
+        to_free = total_size - target_size
+        keys: List[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ):
+            keys.append(key)
+            to_free -= size
+            if to_free <= 0:
+                break
+
+        for i in range(0, len(keys), _EVICTION_BATCH_SIZE):
+            batch = keys[i : i + _EVICTION_BATCH_SIZE]
+            conn.execute(
+                f"DELETE FROM entries WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+
+    def total_size(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Get the total size in bytes of all the values currently cached.
+
+        Returns:
+            The sum of the sizes of all cached values
+        """
+        conn = conn or self._connection()
+        row = conn.execute("SELECT total_size FROM stats WHERE id = 0").fetchone()
+        return row[0] if row else 0
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """
+        Close the connection of the calling thread, and those of the threads
+        that exited. Connections other threads are still using are left open,
+        and closed once the backend is garbage collected or the interpreter
+        exits.
+        """
+        current_thread = threading.current_thread()
+        self._close_connections(
+            lambda thread: thread is current_thread or not thread.is_alive()
+        )
+        self._local.connection = None
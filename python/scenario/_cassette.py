@@ -0,0 +1,545 @@
+"""
+Record/replay of the LLM traffic made during scenario runs.
+
+This module captures every litellm and OpenAI chat completion request made while
+a scenario runs, whether by the judge, the user simulator or the agent under
+test, together with its response, into a per-scenario cassette file. Cassettes
+can then be served back without any network access, making test suites fully
+offline, fast and deterministic.
+
+The behavior is controlled by the SCENARIO_RECORD_MODE environment variable:
+
+- record: every request goes to the provider, and the cassette is rewritten
+  with the interactions of the run
+- replay: requests are only ever served from the cassette, a request missing
+  from it fails the scenario
+- new_episodes: requests found in the cassette are served from it, the others
+  go to the provider and are appended to the cassette
+
+Cassettes are stored in the SCENARIO_CASSETTE_DIR directory, which defaults to
+`cassettes` in the current working directory, so they can be committed along
+with the tests.
+
+litellm functions are patched on the `litellm` module, so calls made through
+names imported beforehand, e.g. `from litellm import acompletion`, bypass the
+cassette. Requests to OpenAI models made that way are still caught at the
+OpenAI client level, while requests to other providers are neither recorded
+nor replayed, and fail in replay mode rather than reaching the network.
+
+A cassette is only meant to be recorded by one run of its scenario at a time.
+Runs of the same scenario recording at the same time each save the cassette
+as a whole when they end, so the last one to finish wins and the interactions
+recorded by the others are lost.
+"""
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    cast,
+)
+
+import litellm
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+from litellm.types.utils import ModelResponse
+from openai.resources.chat import AsyncCompletions, Completions
+from openai.types.chat import ChatCompletion
+
+from scenario._utils.utils import SerializableWithStringFallback
+from ._error_messages import (
+    cassette_escape_error_message,
+    cassette_miss_error_message,
+)
+
+
+logger = logging.getLogger("scenario")
+
+RecordMode = Literal["record", "replay", "new_episodes"]
+
+_RECORD_MODES = ("record", "replay", "new_episodes")
+
+CASSETTE_FORMAT_VERSION = 1
+
+# Request parameters that don't change the response, or are secrets, and are
+# therefore left out when matching requests against the cassette
+_IGNORED_REQUEST_PARAMS = {
+    "api_key",
+    "api_base",
+    "base_url",
+    "api_version",
+    "organization",
+    "timeout",
+    "request_timeout",
+    "max_retries",
+    "num_retries",
+    "metadata",
+    "extra_headers",
+}
+
+ResponseType = Literal["litellm", "openai"]
+
+
+def get_record_mode() -> Optional[RecordMode]:
+    """
+    Get the record mode from the SCENARIO_RECORD_MODE environment variable.
+
+    Returns:
+        The record mode, or None when recording is disabled
+
+    Raises:
+        ValueError: If the environment variable is set to an unknown mode
+    """
+    mode = os.environ.get("SCENARIO_RECORD_MODE", "").strip().lower()
+    if not mode or mode == "none":
+        return None
+    if mode not in _RECORD_MODES:
+        raise ValueError(
+            f"Unknown SCENARIO_RECORD_MODE {mode!r}, expected one of: {', '.join(_RECORD_MODES)}"
+        )
+    return cast(RecordMode, mode)
+
+
+def get_cassette_dir() -> str:
+    """Get the directory cassettes are stored in, from SCENARIO_CASSETTE_DIR"""
+    return os.environ.get("SCENARIO_CASSETTE_DIR") or os.path.join(
+        os.getcwd(), "cassettes"
+    )
+
+
+def request_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """
+    Compute the key matching a completion request against the cassette.
+
+    Secrets and transport settings are left out, as well as the `trace_id` and
+    `id` fields scenario adds to messages, which differ on every run.
+    """
+    params = {
+        key: value
+        for key, value in kwargs.items()
+        if key not in _IGNORED_REQUEST_PARAMS
+    }
+    if "messages" in params:
+        params["messages"] = [
+            (
+                {
+                    key: value
+                    for key, value in message.items()
+                    if key not in ("trace_id", "id")
+                }
+                if isinstance(message, dict)
+                else message
+            )
+            for message in params["messages"]
+        ]
+
+    serialized = json.dumps(
+        {"args": args, "params": params},
+        sort_keys=True,
+        cls=SerializableWithStringFallback,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    Recorded completion requests and responses of a single scenario.
+
+    Cassettes are stored as JSON lines: a header line followed by one line per
+    interaction, which keeps them compact and easy to review in diffs. The same
+    request can be recorded several times, in which case the responses are
+    replayed in the order they were recorded. Saving replaces the whole file,
+    so only one run should record a given cassette at a time.
+
+    Attributes:
+        path: Path of the cassette file
+        mode: Record mode the cassette is used with
+    """
+
+    def __init__(self, path: str, mode: RecordMode):
+        self.path = path
+        self.mode = mode
+
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._last_recorded: Dict[str, Dict[str, Any]] = {}
+        self._interactions: List[Dict[str, Any]] = []
+        self._new_interactions = 0
+
+        if mode != "record" and os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+
+        for line in lines[1:]:
+            interaction = json.loads(line)
+            self._recorded.setdefault(interaction["request"], deque()).append(
+                interaction
+            )
+            self._last_recorded[interaction["request"]] = interaction
+            if self.mode == "new_episodes":
+                self._interactions.append(interaction)
+
+    def play(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the next recorded interaction for a request.
+
+        Once all the recorded responses to a request were played, the last one
+        keeps being served.
+
+        Returns:
+            The recorded interaction, or None if the request was never recorded
+        """
+        with self._lock:
+            recorded = self._recorded.get(key)
+            if recorded:
+                return recorded.popleft()
+            return self._last_recorded.get(key)
+
+    def record(
+        self, key: str, response_type: ResponseType, model: Any, response: Any
+    ) -> None:
+        """Add a new interaction to the cassette"""
+        with self._lock:
+            self._interactions.append(
+                {
+                    "request": key,
+                    "type": response_type,
+                    "model": model,
+                    "response": response,
+                }
+            )
+            self._new_interactions += 1
+
+    def save(self) -> None:
+        """Write the cassette to disk, if anything new was recorded"""
+        with self._lock:
+            if self._new_interactions == 0:
+                return
+            interactions = list(self._interactions)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # Write to a temporary file of our own first, so a crash never leaves a
+        # truncated cassette, and concurrent saves never write to the same file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.path)),
+            prefix=f"{os.path.basename(self.path)}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": CASSETTE_FORMAT_VERSION}) + "\n")
+                for interaction in interactions:
+                    f.write(
+                        json.dumps(
+                            interaction,
+                            separators=(",", ":"),
+                            cls=SerializableWithStringFallback,
+                        )
+                        + "\n"
+                    )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.debug(
+            f"Saved {len(interactions)} interactions to cassette {self.path}"
+        )
+
+
+current_cassette: ContextVar[Optional[Cassette]] = ContextVar(
+    "scenario_cassette", default=None
+)
+
+# Set while a request is being handled, so that the OpenAI client used under
+# the hood by litellm doesn't record the same request a second time
+_handling_request: ContextVar[bool] = ContextVar(
+    "scenario_cassette_handling_request", default=False
+)
+
+
+def cassette_path(name: str, description: str) -> str:
+    """Get the path of the cassette file for a scenario"""
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:80] or "scenario"
+    digest = hashlib.sha256(f"{name}\n{description}".encode("utf-8")).hexdigest()
+    return os.path.join(get_cassette_dir(), f"{slug}-{digest[:8]}.jsonl")
+
+
+@contextmanager
+def scenario_cassette(name: str, description: str) -> Iterator[Optional[Cassette]]:
+    """
+    Record or replay the completion requests made within the block, according
+    to SCENARIO_RECORD_MODE, using the cassette of the given scenario.
+
+    Args:
+        name: Name of the scenario
+        description: Description of the scenario
+
+    Yields:
+        The cassette in use, or None when recording is disabled
+    """
+    mode = get_record_mode()
+    if mode is None:
+        yield None
+        return
+
+    install_cassette_patches()
+
+    cassette = Cassette(cassette_path(name, description), mode)
+    token = current_cassette.set(cassette)
+    try:
+        yield cassette
+    finally:
+        current_cassette.reset(token)
+        cassette.save()
+
+
+def _bind_params(
+    signature: Optional[inspect.Signature], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Turn positional arguments into keyword ones, so a request matches the
+    cassette the same way however its arguments were passed.
+    """
+    if signature is None or not args:
+        return args, kwargs
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return args, kwargs
+
+    params: Dict[str, Any] = {}
+    for name, value in bound.arguments.items():
+        kind = signature.parameters[name].kind
+        if kind == inspect.Parameter.VAR_KEYWORD:
+            params.update(value)
+        elif kind == inspect.Parameter.VAR_POSITIONAL:
+            if value:
+                return args, kwargs
+        else:
+            params[name] = value
+    return (), params
+
+
+def _signature(function: Callable) -> Optional[inspect.Signature]:
+    try:
+        return inspect.signature(function)
+    except (TypeError, ValueError):
+        return None
+
+
+def _should_handle(kwargs: Dict[str, Any]) -> Optional[Cassette]:
+    cassette = current_cassette.get()
+    if cassette is None or _handling_request.get():
+        return None
+    # Streaming responses are passed through, they can't be replayed as a whole
+    if kwargs.get("stream"):
+        return None
+    return cassette
+
+
+def _replay(
+    cassette: Cassette, key: str, kwargs: Dict[str, Any]
+) -> Tuple[bool, Any]:
+    if cassette.mode == "record":
+        return False, None
+
+    interaction = cassette.play(key)
+    if interaction is not None:
+        return True, _deserialize_response(interaction)
+
+    if cassette.mode == "replay":
+        raise Exception(
+            cassette_miss_error_message(str(kwargs.get("model")), cassette.path)
+        )
+    return False, None
+
+
+def _serialize_response(response: Any) -> Optional[Tuple[ResponseType, Any]]:
+    if isinstance(response, ModelResponse):
+        return "litellm", response.model_dump()
+    if isinstance(response, ChatCompletion):
+        return "openai", response.model_dump(mode="json")
+    return None
+
+
+def _deserialize_response(interaction: Dict[str, Any]) -> Any:
+    if interaction["type"] == "openai":
+        return ChatCompletion.model_validate(interaction["response"])
+    return ModelResponse(**interaction["response"])
+
+
+def _record(cassette: Cassette, key: str, kwargs: Dict[str, Any], response: Any):
+    serialized = _serialize_response(response)
+    if serialized is None:
+        logger.debug(
+            f"Not recording unsupported response type {type(response).__name__}"
+        )
+        return
+    response_type, data = serialized
+    cassette.record(key, response_type, kwargs.get("model"), data)
+
+
+def _patch_sync(
+    original: Callable,
+    is_method: bool = False,
+    signature_of: Optional[Callable] = None,
+) -> Callable:
+    signature = _signature(signature_of or original)
+
+    @functools.wraps(original)
+    def patched(*args, **kwargs):
+        call_args, params = _bind_params(signature, args, kwargs)
+        cassette = _should_handle(params)
+        if cassette is None:
+            return original(*args, **kwargs)
+
+        params.pop("self", None)
+        key = request_key(call_args[1:] if is_method else call_args, params)
+        hit, response = _replay(cassette, key, params)
+        if hit:
+            return response
+
+        token = _handling_request.set(True)
+        try:
+            response = original(*args, **kwargs)
+        finally:
+            _handling_request.reset(token)
+
+        _record(cassette, key, params, response)
+        return response
+
+    patched._scenario_cassette_original = original  # type: ignore
+    return patched
+
+
+def _patch_async(
+    original: Callable,
+    is_method: bool = False,
+    signature_of: Optional[Callable] = None,
+) -> Callable:
+    signature = _signature(signature_of or original)
+
+    @functools.wraps(original)
+    async def patched(*args, **kwargs):
+        call_args, params = _bind_params(signature, args, kwargs)
+        cassette = _should_handle(params)
+        if cassette is None:
+            return await original(*args, **kwargs)
+
+        params.pop("self", None)
+        key = request_key(call_args[1:] if is_method else call_args, params)
+        hit, response = _replay(cassette, key, params)
+        if hit:
+            return response
+
+        token = _handling_request.set(True)
+        try:
+            response = await original(*args, **kwargs)
+        finally:
+            _handling_request.reset(token)
+
+        _record(cassette, key, params, response)
+        return response
+
+    patched._scenario_cassette_original = original  # type: ignore
+    return patched
+
+
+def _guard_sync(original: Callable) -> Callable:
+    @functools.wraps(original)
+    def guarded(self, url: str, *args, **kwargs):
+        _check_escaped_request(url)
+        return original(self, url, *args, **kwargs)
+
+    guarded._scenario_cassette_original = original  # type: ignore
+    return guarded
+
+
+def _guard_async(original: Callable) -> Callable:
+    @functools.wraps(original)
+    async def guarded(self, url: str, *args, **kwargs):
+        _check_escaped_request(url)
+        return await original(self, url, *args, **kwargs)
+
+    guarded._scenario_cassette_original = original  # type: ignore
+    return guarded
+
+
+def _check_escaped_request(url: str) -> None:
+    """
+    Stop litellm requests that didn't go through the cassette, e.g. made with
+    functions imported before the patches were installed, from reaching the
+    network in replay mode.
+    """
+    cassette = current_cassette.get()
+    if cassette is None or _handling_request.get():
+        return
+    if cassette.mode == "replay":
+        raise Exception(cassette_escape_error_message(url, cassette.path))
+    logger.warning(
+        f"Request to {url} bypassed the cassette {cassette.path}, it won't be recorded"
+    )
+
+
+_patches_lock = threading.Lock()
+_patches_installed = False
+
+
+def install_cassette_patches() -> None:
+    """
+    Patch litellm and the OpenAI client to go through the current cassette.
+
+    Calls made outside of a scenario run with recording enabled are passed
+    through untouched. Safe to call multiple times.
+    """
+    global _patches_installed
+
+    with _patches_lock:
+        if _patches_installed:
+            return
+
+        # The module functions may already be wrapped without their signature,
+        # e.g. by langwatch's tracing, so arguments are bound with the
+        # signatures of the functions they end up calling
+        litellm_main = importlib.import_module("litellm.main")
+        litellm.completion = _patch_sync(  # type: ignore
+            litellm.completion, signature_of=litellm_main.completion
+        )
+        litellm.acompletion = _patch_async(  # type: ignore
+            litellm.acompletion, signature_of=litellm_main.acompletion
+        )
+
+        Completions.create = _patch_sync(Completions.create, is_method=True)  # type: ignore
+        AsyncCompletions.create = _patch_async(  # type: ignore
+            AsyncCompletions.create, is_method=True
+        )
+
+        # Lower level requests of litellm to providers other than OpenAI
+        HTTPHandler.post = _guard_sync(HTTPHandler.post)  # type: ignore
+        AsyncHTTPHandler.post = _guard_async(AsyncHTTPHandler.post)  # type: ignore
+
+        _patches_installed = True
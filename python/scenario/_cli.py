@@ -0,0 +1,77 @@
+"""
+Command line interface of scenario.
+
+Usage:
+
+    scenario events replay [SPOOL_DIR] [--endpoint URL] [--api-key KEY]
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from ._events.event_reporter import EventReporter
+from ._events.event_sink import get_events_spool_dir, replay_spooled_events
+
+
+def _replay(args: argparse.Namespace) -> int:
+    directory = args.directory or get_events_spool_dir()
+    if not directory:
+        print(
+            "No spool directory given, pass it as an argument or set SCENARIO_EVENTS_SPOOL_DIR",
+            file=sys.stderr,
+        )
+        return 2
+
+    event_reporter = EventReporter(endpoint=args.endpoint, api_key=args.api_key)
+    try:
+        delivered, undelivered = asyncio.run(
+            replay_spooled_events(directory, event_reporter)
+        )
+    except ValueError as error:
+        print(str(error), file=sys.stderr)
+        return 2
+
+    print(f"Replayed {delivered} events from {directory}")
+    if undelivered:
+        print(f"{undelivered} events could not be delivered and are kept in the spool")
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the `scenario` command.
+
+    Args:
+        argv: Command line arguments, defaults to the ones of the process
+
+    Returns:
+        The exit code
+    """
+    parser = argparse.ArgumentParser(prog="scenario")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    events = commands.add_parser("events", help="Manage the reported scenario events")
+    events_commands = events.add_subparsers(dest="events_command", required=True)
+
+    replay = events_commands.add_parser(
+        "replay",
+        help="Re-send the events spooled while the LangWatch endpoint was unreachable",
+    )
+    replay.add_argument(
+        "directory",
+        nargs="?",
+        help="Spool directory, defaults to SCENARIO_EVENTS_SPOOL_DIR",
+    )
+    replay.add_argument(
+        "--endpoint", help="LangWatch endpoint, defaults to LANGWATCH_ENDPOINT"
+    )
+    replay.add_argument(
+        "--api-key", help="LangWatch API key, defaults to LANGWATCH_API_KEY"
+    )
+    replay.set_defaults(handler=_replay)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -102,3 +102,30 @@ def agent_response_not_awaitable(class_name: str):
 
             return response.output_text
 """
+
+
+def cassette_miss_error_message(model: str, cassette_path: str):
+    return f"""
+ {termcolor.colored("->", "cyan")} A request to {termcolor.colored(model, "green")} was made in {termcolor.colored("replay", "green")} mode, but it was not found in the cassette:
+
+    {cassette_path}
+
+ {termcolor.colored("->", "cyan")} The conversation probably changed since the cassette was recorded. Record it again, or only record the missing requests, with:
+
+    SCENARIO_RECORD_MODE=new_episodes pytest
+    {termcolor.colored("^" * 32, "green")}
+"""
+
+
+def cassette_escape_error_message(url: str, cassette_path: str):
+    return f"""
+ {termcolor.colored("->", "cyan")} A request to {termcolor.colored(url, "green")} was about to be sent in {termcolor.colored("replay", "green")} mode, without going through the cassette:
+
+    {cassette_path}
+
+ {termcolor.colored("->", "cyan")} This happens when litellm functions are imported before the first scenario runs, make sure your code calls them through the module instead:
+
+    import litellm
+    response = await litellm.acompletion(...)
+    {termcolor.colored("^" * 8, "green")}
+"""
@@ -15,11 +15,12 @@ from .events import (
     ScenarioRunFinishedEventVerdict,
     ScenarioRunFinishedEventStatus,
     ScenarioMessageSnapshotEvent,
+    ScenarioMessageDeltaEvent,
     MessageType,
 )
 
 # Event processing infrastructure
-from .event_bus import ScenarioEventBus
+from .event_bus import ScenarioEventBus, flush_events, pending_events
 from .event_reporter import EventReporter
 
 # Message utilities and types
@@ -45,10 +46,13 @@ __all__ = [
     "ScenarioRunFinishedEventVerdict",
     "ScenarioRunFinishedEventStatus",
     "ScenarioMessageSnapshotEvent",
+    "ScenarioMessageDeltaEvent",
 
     # Event processing
     "ScenarioEventBus",
     "EventReporter",
+    "flush_events",
+    "pending_events",
 
     # Messages
     "MessageType",
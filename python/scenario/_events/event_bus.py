@@ -1,14 +1,138 @@
 from rx.core.observable.observable import Observable
-from typing import Optional, Any, Dict
-from .events import ScenarioEvent
+from typing import ClassVar, Optional, Any, Dict, List, Set, Tuple, Union
+from .events import ScenarioEvent, ScenarioMessageSnapshotEvent
 from .event_reporter import EventReporter
+from .event_serializer import serialize_event
+from .event_sink import EventSink, default_event_sinks, default_event_spool
 from .event_alert_message_logger import EventAlertMessageLogger
+from .utils import merge_message_snapshots
 from ..config.scenario import ScenarioConfig
 
 import asyncio
-import queue
+import httpx
+import concurrent.futures.thread  # Registers its exit hook before ours, see _register_bus
 import threading
+import time
 import logging
+import weakref
+
+
+logger = logging.getLogger(__name__)
+
+# How long events still pending are waited for at interpreter or pytest exit
+DEFAULT_FLUSH_TIMEOUT = 30.0
+
+
+class _SnapshotSlot:
+    """
+    Place of a run's message snapshot in the event queue.
+
+    Snapshots carry the whole conversation, so while a slot waits to be posted,
+    newer snapshots of the same run simply replace its event instead of being
+    queued behind it, and deltas are merged into it.
+    """
+
+    def __init__(self, event: ScenarioMessageSnapshotEvent, ready_at: float):
+        self.event = event
+        self.ready_at = ready_at
+        self.queued = False
+        self.superseded = 0
+
+
+QueueItem = Union[ScenarioEvent, _SnapshotSlot]
+
+
+def _item_run_id(item: QueueItem) -> str:
+    if isinstance(item, _SnapshotSlot):
+        return item.event.scenario_run_id
+    return item.scenario_run_id
+
+
+_live_buses: "weakref.WeakSet[ScenarioEventBus]" = weakref.WeakSet()
+_live_buses_lock = threading.Lock()
+_exit_flush_registered = False
+
+
+def _register_bus(bus: "ScenarioEventBus") -> None:
+    global _exit_flush_registered
+
+    with _live_buses_lock:
+        _live_buses.add(bus)
+        if _exit_flush_registered:
+            return
+        _exit_flush_registered = True
+
+    # Registered as a threading exit hook rather than with atexit, so it runs
+    # before the default executor, used by the HTTP client for DNS lookups, is
+    # shut down, which concurrent.futures.thread registers the same way first
+    try:
+        threading._register_atexit(_flush_at_exit)  # type: ignore[attr-defined]
+    except (AttributeError, RuntimeError):
+        pass
+
+
+def _flush_at_exit() -> None:
+    if not flush_events(timeout=DEFAULT_FLUSH_TIMEOUT):
+        logger.warning(
+            f"Exiting with {pending_events()} scenario events not delivered after {DEFAULT_FLUSH_TIMEOUT}s"
+        )
+
+    with _live_buses_lock:
+        buses = list(_live_buses)
+    for bus in buses:
+        # Stopping the worker closes the reporter's HTTP client on its loop
+        bus._shutdown_worker(timeout=1.0)
+        bus.close_sinks()
+
+
+def flush_events(timeout: Optional[float] = None) -> bool:
+    """
+    Wait for the events of all the event buses of the process to be delivered.
+
+    Scenario runs return as soon as they finish, while their events keep being
+    posted in the background. This is called automatically at the end of a
+    pytest session and at interpreter exit, and can be called directly, e.g.
+    at the end of a script, to make sure everything was reported.
+
+    Args:
+        timeout: Maximum time in seconds to wait, None to wait until all the
+                events are delivered
+
+    Returns:
+        True if all the events were delivered, False if the timeout expired first
+
+    Example:
+        ```
+        results = await asyncio.gather(*[scenario.run(**spec) for spec in specs])
+
+        if not scenario.flush_events(timeout=10):
+            print(f"{scenario.pending_events()} events were not reported")
+        ```
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    with _live_buses_lock:
+        buses = list(_live_buses)
+
+    for bus in buses:
+        remaining = (
+            max(0.0, deadline - time.monotonic()) if deadline is not None else None
+        )
+        if not bus.flush(timeout=remaining):
+            return False
+    return True
+
+
+def pending_events() -> int:
+    """
+    Get the number of events received by the event buses of the process and
+    not delivered yet.
+
+    Returns:
+        The number of events still pending
+    """
+    with _live_buses_lock:
+        buses = list(_live_buses)
+    return sum(bus.pending_events for bus in buses)
 
 
 class ScenarioEventBus:
@@ -19,26 +143,77 @@ class ScenarioEventBus:
     posting them to external APIs. It uses a queue-based threading model
     where events are processed by a dedicated worker thread.
 
+    One bus is shared by the whole process, see `ScenarioEventBus.get()`, and
+    multiplexes the event streams of all the scenario executors, so there is a
+    single worker thread and a single EventReporter no matter how many
+    scenarios run.
+
     Key design principles:
-    - Single worker thread handles all HTTP posting (simplifies concurrency)
+    - Single worker thread handles all HTTP posting, on one event loop it owns
+      for its lifetime, so the reporter's pooled HTTP connections are reused
+      across events
     - Thread created lazily when first event arrives
-    - Thread terminates when queue empty and stream completed
-    - Non-daemon thread ensures all events posted before program exit
+    - Events are handed over to the worker's loop thread-safely, and the worker
+      waits on its queue without polling
+    - Up to `max_in_flight` batches are posted concurrently, while the events
+      of a same run are always posted in order
+    - Thread lives until the bus is drained, closing the reporter's HTTP client
+    - Scenario runs don't wait for their events to be delivered, events still
+      pending are flushed at the end of the pytest session or at interpreter
+      exit, with `flush_events()`, up to a timeout
+    - Posted events are also written to the bus' sinks, e.g. local JSONL files,
+      and events that can't be delivered are written to its spool, if any,
+      instead of being dropped. While the endpoint is down, events go straight
+      to the spool, so an outage neither slows down runs nor piles events up
+      in memory, and once more than `max_queued_events` events wait to be
+      posted, the overflow goes to the spool too
+    - Spooled events are NOT re-sent automatically once the endpoint recovers,
+      they must be replayed with `scenario events replay`, which the bus
+      reminds of with a warning when it closes its spool
+    - Queued events are drained into batches, bounded by count, bytes and
+      linger time, and posted in bulk, falling back to posting them one by
+      one when the endpoint doesn't support batches
+    - Queued message snapshots of a run are superseded by its newest one, and
+      can be debounced per run, while run started and finished events are
+      never dropped or reordered
 
     Attributes:
         _event_reporter: EventReporter instance for HTTP posting of events
         _event_alert_message_logger: EventAlertMessageLogger for user-friendly console output
         _max_retries: Maximum number of retry attempts for failed event processing
-        _event_queue: Thread-safe queue for passing events to worker thread
-        _completed: Whether the event stream has completed
-        _subscription: RxPY subscription to the event stream
+        _max_batch_size: Maximum number of events posted in a single request
+        _max_batch_bytes: Maximum serialized size of the events posted in a single request
+        _max_linger: Maximum time in seconds to wait for more events to fill a batch
+        _max_in_flight: Maximum number of batches being posted at the same time
+        _snapshot_debounce: Minimum time in seconds between two posted snapshots of the same run
+        _pending_snapshots: Snapshot slots of each run, waiting to be posted
+        _pending_events: Number of events received but not processed yet
+        _max_queued_events: Number of events waiting to be posted beyond which new ones are spooled
+        _spooled_events: Number of events spooled since the spool was last closed
+        _event_queue: Queue of the worker's event loop, where events are handed over
+        _completed: Whether all the event streams subscribed to have completed
+        _open_streams: Ids of the event streams subscribed to that are still open
         _worker_thread: Dedicated thread for processing events
+        _worker_loop_instance: Event loop owned by the worker thread while it runs
     """
 
+    default_bus: ClassVar[Optional["ScenarioEventBus"]] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         event_reporter: Optional[EventReporter] = None,
         max_retries: int = 3,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
+        max_linger: float = 0.05,
+        snapshot_debounce: float = 0.0,
+        max_in_flight: int = 4,
+        sinks: Optional[List[EventSink]] = None,
+        spool: Optional[EventSink] = None,
+        spool_cooldown: float = 30.0,
+        max_connections: Optional[int] = None,
+        max_queued_events: int = 10_000,
     ):
         """
         Initialize the event bus with optional event reporter and retry configuration.
@@ -48,80 +223,478 @@ class ScenarioEventBus:
                           If not provided, a default EventReporter will be created.
             max_retries: Maximum number of retry attempts for failed event processing.
                        Defaults to 3 attempts with exponential backoff.
+            max_batch_size: Maximum number of events posted in a single request.
+                          Set it to 1 to disable batching.
+            max_batch_bytes: Maximum serialized size of the events posted in a
+                           single request. Defaults to 1 MiB.
+            max_linger: Maximum time in seconds to wait for more events before
+                       posting a batch that is not full. Defaults to 50ms.
+            snapshot_debounce: Minimum time in seconds between two message
+                             snapshots posted for the same run. Snapshots
+                             arriving in between are held back and superseded
+                             by the newest one. Defaults to 0, where snapshots
+                             are only superseded while waiting in the queue.
+            max_in_flight: Maximum number of batches posted concurrently.
+                         Defaults to 4.
+            sinks: Sinks every posted event is also written to. Defaults to a
+                  JSONL sink in SCENARIO_EVENTS_DIR, if set.
+            spool: Sink events that could not be delivered are written to, so
+                  they can be replayed later with `scenario events replay`,
+                  they are not re-sent automatically. Defaults to a JSONL
+                  spool in SCENARIO_EVENTS_SPOOL_DIR, if set.
+            spool_cooldown: Time in seconds events go straight to the spool for,
+                          without being posted, after a delivery failed.
+                          Defaults to 30s.
+            max_connections: Size of the connection pool of the default
+                           EventReporter, ignored if event_reporter is given.
+                           Defaults to the `events_max_connections` setting,
+                           or SCENARIO_EVENTS_MAX_CONNECTIONS, or 20.
+            max_queued_events: Maximum number of events held in memory waiting
+                             to be posted, the next ones are written to the
+                             spool instead. Without a spool, events are kept
+                             in memory regardless. Defaults to 10000.
         """
-        self._event_reporter: EventReporter = event_reporter or EventReporter()
+        self._event_reporter: EventReporter = event_reporter or EventReporter(
+            max_connections=max_connections
+        )
         self._event_alert_message_logger = EventAlertMessageLogger()
         self._max_retries = max_retries
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_batch_bytes = max_batch_bytes
+        self._max_linger = max_linger
+        self._max_in_flight = max(1, max_in_flight)
+        self._snapshot_debounce = snapshot_debounce
+        self._sinks = sinks if sinks is not None else default_event_sinks()
+        self._spool = spool if spool is not None else default_event_spool()
+        self._spool_cooldown = spool_cooldown
+        self._spool_until = 0.0
+        self._max_queued_events = max(1, max_queued_events)
+        self._spooled_events = 0
 
         # Custom logger for this class
         self.logger = logging.getLogger(__name__)
 
-        # Threading infrastructure
-        self._event_queue: queue.Queue[ScenarioEvent] = queue.Queue()
+        # Held back snapshots count as pending events too, so the worker is
+        # kept alive until they are posted
+        self._pending_events = 0
+        self._pending_condition = threading.Condition()
+        self._pending_snapshots: Dict[str, _SnapshotSlot] = {}
+        self._last_snapshot_at: Dict[str, float] = {}
+        self._snapshots_lock = threading.Lock()
         self._completed = False
-        self._subscription: Optional[Any] = None
+        self._open_streams: Set[int] = set()
+        self._streams_lock = threading.Lock()
+
+        # Threading infrastructure
+        self._worker_lock = threading.Lock()
         self._worker_thread: Optional[threading.Thread] = None
-        self._shutdown_event = threading.Event()  # Signal worker to shutdown
+        self._stopped_worker_thread: Optional[threading.Thread] = None
+        self._worker_loop_instance: Optional[asyncio.AbstractEventLoop] = None
+        self._event_queue: Optional["asyncio.Queue[Optional[QueueItem]]"] = None
+
+        _register_bus(self)
 
-    def _get_or_create_worker(self) -> None:
-        """Lazily create worker thread when first event arrives"""
-        if self._worker_thread is None or not self._worker_thread.is_alive():
+    def _get_or_create_worker(
+        self,
+    ) -> Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Optional[QueueItem]]"]:
+        """Lazily create worker thread when first event arrives, must hold _worker_lock"""
+        if self._worker_loop_instance is None or self._event_queue is None:
             self.logger.debug("Creating new worker thread")
+            loop = asyncio.new_event_loop()
+            event_queue: "asyncio.Queue[Optional[QueueItem]]" = asyncio.Queue()
+            self._worker_loop_instance = loop
+            self._event_queue = event_queue
             self._worker_thread = threading.Thread(
-                target=self._worker_loop, daemon=False, name="ScenarioEventBus-Worker"
+                target=self._worker_loop,
+                args=(loop, event_queue),
+                # Pending events are flushed at exit with a timeout, so an
+                # unreachable endpoint can't hang the interpreter forever
+                daemon=True,
+                name="ScenarioEventBus-Worker",
             )
             self._worker_thread.start()
             self.logger.debug("Worker thread started")
+        return self._worker_loop_instance, self._event_queue
 
-    def _worker_loop(self) -> None:
+    def _worker_loop(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        event_queue: "asyncio.Queue[Optional[QueueItem]]",
+    ) -> None:
         """Main worker thread loop - processes events from queue until shutdown"""
         self.logger.debug("Worker thread loop started")
-        while True:
-            try:
-                if self._shutdown_event.wait(timeout=0.1):
-                    self.logger.debug("Worker thread received shutdown signal")
-                    break
-
-                try:
-                    event = self._event_queue.get(timeout=0.1)
-                    self.logger.debug(
-                        f"Worker picked up event: {event.type_} ({event.scenario_run_id})"
+        try:
+            loop.run_until_complete(self._process_queue(event_queue))
+        finally:
+            self._close_worker_loop(loop)
+        self.logger.debug("Worker thread loop ended")
+
+    def _close_worker_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Release the reporter's HTTP connections and close the worker's loop"""
+        self.close_sinks()
+        try:
+            loop.run_until_complete(self._event_reporter.aclose())
+        except Exception as e:
+            self.logger.error(f"Error closing event reporter: {e}")
+        finally:
+            loop.close()
+
+    def _put(self, item: Optional[QueueItem]) -> None:
+        """Hand an item over to the worker's queue, from any thread"""
+        with self._worker_lock:
+            loop, event_queue = self._get_or_create_worker()
+            loop.call_soon_threadsafe(event_queue.put_nowait, item)
+
+    def _call_on_worker(self, delay: float, callback: Any) -> None:
+        """Schedule a callback on the worker's loop after a delay, from any thread"""
+        with self._worker_lock:
+            loop, _ = self._get_or_create_worker()
+            loop.call_soon_threadsafe(loop.call_later, delay, callback)
+
+    def _stop_worker(self) -> None:
+        """
+        Signal the worker to stop, if no events are pending.
+
+        The worker is detached right away, so events arriving afterwards start
+        a new one instead of being queued behind the shutdown signal.
+        """
+        with self._worker_lock:
+            with self._pending_condition:
+                if self._pending_events > 0:
+                    return
+
+            loop, event_queue = self._worker_loop_instance, self._event_queue
+            if loop is None or event_queue is None:
+                return
+
+            self._stopped_worker_thread = self._worker_thread
+            self._worker_loop_instance = None
+            self._event_queue = None
+            self._worker_thread = None
+            loop.call_soon_threadsafe(event_queue.put_nowait, None)
+
+    def _add_pending(self, count: int = 1) -> None:
+        with self._pending_condition:
+            self._pending_events += count
+
+    def _events_done(self, count: int) -> None:
+        with self._pending_condition:
+            self._pending_events -= count
+            if self._pending_events == 0:
+                self._pending_condition.notify_all()
+
+    async def _process_queue(
+        self, event_queue: "asyncio.Queue[Optional[QueueItem]]"
+    ) -> None:
+        in_flight = asyncio.Semaphore(self._max_in_flight)
+        tasks: Set["asyncio.Task[None]"] = set()
+        # Last task posting events of each run, the next ones wait for it
+        run_tails: Dict[str, "asyncio.Task[None]"] = {}
+
+        # Events of the batches waiting to be posted or being posted
+        queued = 0
+        overflowing = False
+
+        stopping = False
+        while not stopping:
+            item = await event_queue.get()
+            if item is None:
+                self.logger.debug("Worker thread received shutdown signal")
+                break
+
+            batch, stopping = await self._collect_batch(event_queue, item)
+            self.logger.debug(f"Worker picked up batch of {len(batch)} events")
+
+            if self._spool is not None and queued >= self._max_queued_events:
+                if not overflowing:
+                    self.logger.warning(
+                        f"More than {self._max_queued_events} events waiting to be posted, spooling the next ones"
                     )
-                    self._process_event_sync(event)
-                    self._event_queue.task_done()
-                except queue.Empty:
-                    # Exit if stream completed and no more events
-                    if self._completed:
-                        self.logger.debug(
-                            "Stream completed and no more events, worker thread exiting"
-                        )
+                    overflowing = True
+                self._spool_batch(batch)
+                continue
+            overflowing = False
+            queued += len(batch)
+
+            run_ids = {_item_run_id(batch_item) for batch_item in batch}
+            previous = {
+                run_tails[run_id]
+                for run_id in run_ids
+                if run_id in run_tails and not run_tails[run_id].done()
+            }
+            task = asyncio.ensure_future(self._post_batch(batch, previous, in_flight))
+            tasks.add(task)
+            for run_id in run_ids:
+                run_tails[run_id] = task
+
+            def forget(
+                task: "asyncio.Task[None]",
+                run_ids: Set[str] = run_ids,
+                size: int = len(batch),
+            ) -> None:
+                nonlocal queued
+                queued -= size
+                tasks.discard(task)
+                for run_id in run_ids:
+                    if run_tails.get(run_id) is task:
+                        del run_tails[run_id]
+
+            task.add_done_callback(forget)
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_batch(
+        self,
+        event_queue: "asyncio.Queue[Optional[QueueItem]]",
+        first_item: QueueItem,
+    ) -> Tuple[List[QueueItem], bool]:
+        """
+        Drain more queued events after the first one into a batch, until the
+        batch is full or the linger time is over.
+
+        Returns:
+            The batch, and whether the shutdown signal was found in the queue
+        """
+        batch = [first_item]
+        if self._max_batch_size <= 1:
+            return batch, False
+
+        loop = asyncio.get_running_loop()
+        batch_bytes = self._item_size(first_item)
+        deadline = loop.time() + self._max_linger
+
+        while len(batch) < self._max_batch_size:
+            try:
+                if not event_queue.empty():
+                    item = event_queue.get_nowait()
+                else:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
                         break
+                    item = await asyncio.wait_for(event_queue.get(), remaining)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+
+            if item is None:
+                return batch, True
+
+            batch.append(item)
+            batch_bytes += self._item_size(item)
+            if batch_bytes >= self._max_batch_bytes:
+                break
+
+        return batch, False
+
+    async def _post_batch(
+        self,
+        batch: List[QueueItem],
+        previous: Set["asyncio.Task[None]"],
+        in_flight: asyncio.Semaphore,
+    ) -> None:
+        try:
+            if previous:
+                await asyncio.wait(previous)
+            async with in_flight:
+                # Snapshots are resolved only now, so they keep being superseded
+                # while waiting for an earlier batch of their run
+                await self._process_batch([self._take_event(item) for item in batch])
+        except Exception as e:
+            self.logger.error(f"Worker thread error: {e}")
+        finally:
+            self._events_done(len(batch))
+
+    def _spool_batch(self, batch: List[QueueItem]) -> None:
+        """Write a batch straight to the sinks and the spool, without posting it"""
+        try:
+            events = [self._take_event(item) for item in batch]
+            self._write_to_sinks(self._sinks, events)
+            self._spool_events(events)
+        except Exception as e:
+            self.logger.error(f"Worker thread error: {e}")
+        finally:
+            self._events_done(len(batch))
+
+    def _spool_events(self, events: List[ScenarioEvent]) -> None:
+        assert self._spool is not None
+        self._spooled_events += len(events)
+        self._write_to_sinks([self._spool], events)
+
+    def _take_event(self, item: QueueItem) -> ScenarioEvent:
+        """
+        Resolve an item taken from the queue into the event to post, which for
+        a snapshot slot is the newest snapshot of its run.
+        """
+        if not isinstance(item, _SnapshotSlot):
+            return item
+
+        with self._snapshots_lock:
+            run_id = item.event.scenario_run_id
+            if self._pending_snapshots.get(run_id) is item:
+                del self._pending_snapshots[run_id]
+            self._last_snapshot_at[run_id] = time.monotonic()
+
+        if item.superseded:
+            self.logger.debug(
+                f"Posting latest snapshot, superseding {item.superseded} older ones ({run_id})"
+            )
+        return item.event
+
+    def _queue_snapshot(self, event: ScenarioMessageSnapshotEvent) -> None:
+        """
+        Queue a message snapshot, superseding, or for a delta merging into, the
+        run's snapshot already waiting to be posted, if any.
+        """
+        run_id = event.scenario_run_id
+        with self._snapshots_lock:
+            slot = self._pending_snapshots.get(run_id)
+            if slot is not None:
+                slot.event = merge_message_snapshots(slot.event, event)
+                slot.superseded += 1
+                return
+
+            ready_at = time.monotonic()
+            last_snapshot_at = self._last_snapshot_at.get(run_id)
+            if self._snapshot_debounce > 0 and last_snapshot_at is not None:
+                ready_at = max(ready_at, last_snapshot_at + self._snapshot_debounce)
+
+            slot = _SnapshotSlot(event, ready_at)
+            self._pending_snapshots[run_id] = slot
+            self._add_pending()
+
+            delay = ready_at - time.monotonic()
+            if delay <= 0:
+                slot.queued = True
+                self._put(slot)
+            else:
+                self._call_on_worker(delay, self._release_held_snapshots)
+
+    def _release_held_snapshots(self, run_id: Optional[str] = None) -> None:
+        """
+        Queue the snapshots held back by the debounce, either the ones whose
+        debounce interval is over, or all the ones of the given run.
+        """
+        now = time.monotonic()
+        with self._snapshots_lock:
+            for slot_run_id, slot in self._pending_snapshots.items():
+                if slot.queued:
                     continue
+                if slot_run_id == run_id or (run_id is None and slot.ready_at <= now):
+                    slot.queued = True
+                    self._put(slot)
+
+            if run_id is not None:
+                # Later snapshots of the run must not jump ahead of the event queued next
+                self._pending_snapshots.pop(run_id, None)
+
+    def _flush_held_snapshots(self) -> None:
+        """Queue all the snapshots held back by the debounce, regardless of timing"""
+        with self._snapshots_lock:
+            for slot in self._pending_snapshots.values():
+                if not slot.queued:
+                    slot.queued = True
+                    self._put(slot)
+
+    def _item_size(self, item: QueueItem) -> int:
+        if isinstance(item, _SnapshotSlot):
+            return self._event_size(item.event)
+        return self._event_size(item)
+
+    def _event_size(self, event: ScenarioEvent) -> int:
+        # The encoding is kept by the serializer, and reused to post the event
+        try:
+            return len(serialize_event(event))
+        except Exception:
+            return 0
+
+    async def _process_batch(self, events: List[ScenarioEvent]) -> None:
+        """
+        Post a batch of events in a single request, or one by one if the
+        reporter can't post them together, spooling the ones that could not be
+        delivered.
+        """
+        self._write_to_sinks(self._sinks, events)
+
+        if self._spool is not None and time.monotonic() < self._spool_until:
+            # The endpoint was just found to be down, don't wait on it again
+            self._spool_events(events)
+            return
 
+        results: Optional[List[Optional[Dict[str, Any]]]] = None
+        if len(events) > 1:
+            try:
+                results = await self._process_batch_with_retry(events)
             except Exception as e:
-                self.logger.error(f"Worker thread error: {e}")
+                self.logger.error(f"Error processing batch of {len(events)} events: {e}")
+
+        if results is None:
+            results = [await self._process_event(event) for event in events]
+        else:
+            for event, result in zip(events, results):
+                self._handle_event_result(event, result)
+
+        undelivered = [
+            event for event, result in zip(events, results) if result is None
+        ]
+        if undelivered and self._spool is not None:
+            self.logger.warning(
+                f"Spooling {len(undelivered)} undelivered events, and the next ones for {self._spool_cooldown}s"
+            )
+            self._spool_until = time.monotonic() + self._spool_cooldown
+            self._spool_events(undelivered)
 
-        self.logger.debug("Worker thread loop ended")
+    def _write_to_sinks(
+        self, sinks: List[EventSink], events: List[ScenarioEvent]
+    ) -> None:
+        for sink in sinks:
+            try:
+                sink.write(events)
+            except Exception as e:
+                self.logger.error(f"Error writing {len(events)} events to {sink}: {e}")
+
+    async def _process_batch_with_retry(
+        self, events: List[ScenarioEvent], attempt: int = 1
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Post a batch of events with retry logic.
+
+        Returns None if the endpoint doesn't accept batches, or the batch
+        failed for any other reason than the request itself, so the events get
+        posted individually instead.
+        """
+        try:
+            results = await self._event_reporter.post_events(events)
+            return list(results) if results is not None else None
+        except httpx.HTTPError as e:
+            if attempt >= self._max_retries:
+                self.logger.error(f"Error posting batch of {len(events)} events: {e}")
+                return [None for _ in events]
+            await asyncio.sleep(0.1 * (2 ** (attempt - 1)))  # Exponential backoff
+            return await self._process_batch_with_retry(events, attempt + 1)
+        except Exception as e:
+            self.logger.warning(
+                f"Could not post batch of {len(events)} events, posting them individually: {e}"
+            )
+            return None
 
-    def _process_event_sync(self, event: ScenarioEvent) -> None:
+    async def _process_event(self, event: ScenarioEvent) -> Optional[Dict[str, Any]]:
         """
-        Process event synchronously in worker thread with retry logic.
+        Post a single event on the worker's loop, with retry logic.
+
+        Returns:
+            The result of posting the event, or None if it could not be delivered
         """
         self.logger.debug(
             f"Processing HTTP post for {event.type_} ({event.scenario_run_id})"
         )
 
         try:
-            result = self._post_event_with_retry(event)
+            result = await self._process_event_with_retry(event)
             self._handle_event_result(event, result)
+            return result
         except Exception as e:
             self.logger.error(f"Error processing event {event.type_}: {e}")
-
-    def _post_event_with_retry(self, event: ScenarioEvent) -> Optional[Dict[str, Any]]:
-        """
-        Post event with retry logic, converting async to sync.
-        """
-        return asyncio.run(self._process_event_with_retry(event))
+            return None
 
     def _handle_event_result(
         self, event: ScenarioEvent, result: Optional[Dict[str, Any]]
@@ -180,69 +753,158 @@ class ScenarioEventBus:
         except Exception as e:
             if attempt >= self._max_retries:
                 return None
-            print(
+            self.logger.warning(
                 f"Error processing event (attempt {attempt}/{self._max_retries}): {e}"
             )
             await asyncio.sleep(0.1 * (2 ** (attempt - 1)))  # Exponential backoff
             return await self._process_event_with_retry(event, attempt + 1)
 
+    @classmethod
+    def get(cls) -> "ScenarioEventBus":
+        """
+        Get the process-wide event bus, creating it on first use.
+
+        Returns:
+            The default ScenarioEventBus instance, shared by all executors
+        """
+        with cls._default_lock:
+            if cls.default_bus is None:
+                cls.default_bus = ScenarioEventBus()
+            return cls.default_bus
+
     def subscribe_to_events(self, event_stream: Observable) -> None:
         """
         Subscribe to any observable stream of scenario events.
         Events are queued for processing by the dedicated worker thread.
+
+        Any number of streams can be subscribed to, their events are all posted
+        by the same worker.
         """
-        if self._subscription is not None:
-            self.logger.debug("Already subscribed to event stream")
-            return
+        stream_id = id(event_stream)
+        with self._streams_lock:
+            if stream_id in self._open_streams:
+                self.logger.debug("Already subscribed to event stream")
+                return
+            self._open_streams.add(stream_id)
+            self._completed = False
 
         def handle_event(event: ScenarioEvent) -> None:
             self.logger.debug(
                 f"Event received, queuing: {event.type_} ({event.scenario_run_id})"
             )
-            self._get_or_create_worker()
-            self._event_queue.put(event)
+            if isinstance(event, ScenarioMessageSnapshotEvent):
+                self._queue_snapshot(event)
+            else:
+                # Make sure the run's held back snapshot is posted before this event
+                self._release_held_snapshots(event.scenario_run_id)
+                self._add_pending()
+                self._put(event)
+                if event.type_ == "SCENARIO_RUN_FINISHED":
+                    with self._snapshots_lock:
+                        self._last_snapshot_at.pop(event.scenario_run_id, None)
             self.logger.debug(f"Event queued: {event.type_} ({event.scenario_run_id})")
 
+        def handle_error(error: Exception) -> None:
+            self.logger.error(f"Error in event stream: {error}")
+            self._set_completed(stream_id)
+
         self.logger.info("Subscribing to event stream")
-        self._subscription = event_stream.subscribe(
+        event_stream.subscribe(
             handle_event,
-            lambda e: self.logger.error(f"Error in event stream: {e}"),
-            lambda: self._set_completed(),
+            handle_error,
+            lambda: self._set_completed(stream_id),
         )
 
-    def _set_completed(self):
+    def _set_completed(self, stream_id: int) -> None:
         """Helper to set completed state with logging"""
         self.logger.debug("Event stream completed")
-        self._completed = True
+        with self._streams_lock:
+            self._open_streams.discard(stream_id)
+            self._completed = not self._open_streams
+
+    @property
+    def pending_events(self) -> int:
+        """Number of events received and not delivered yet"""
+        with self._pending_condition:
+            return self._pending_events
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the events received so far to be delivered, including the
+        snapshots held back by the debounce.
+
+        Args:
+            timeout: Maximum time in seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if all the events were delivered, False if the timeout expired first
+        """
+        self._flush_held_snapshots()
+
+        with self._pending_condition:
+            return self._pending_condition.wait_for(
+                lambda: self._pending_events == 0, timeout=timeout
+            )
+
+    def close_sinks(self) -> None:
+        """
+        Complete the files written by the sinks and the spool of the bus, with
+        a warning if events were spooled, as they are not re-sent automatically.
+        """
+        for sink in [*self._sinks, *([self._spool] if self._spool else [])]:
+            try:
+                sink.close()
+            except Exception as e:
+                self.logger.error(f"Error closing event sink {sink}: {e}")
+
+        if self._spooled_events:
+            command = " ".join(
+                ["scenario events replay", getattr(self._spool, "directory", "")]
+            ).strip()
+            self.logger.warning(
+                f"{self._spooled_events} scenario events could not be delivered and were spooled, run `{command}` to re-send them"
+            )
+            self._spooled_events = 0
 
     def drain(self) -> None:
         """
         Waits for all queued events to complete processing.
 
-        This method blocks until all events in the queue have been processed.
-        Since _process_event_sync() uses asyncio.run(), HTTP requests complete
-        before task_done() is called, so join() ensures everything is finished.
+        This method blocks until every event received so far was posted, which
+        the worker signals once each batch's HTTP requests complete, without
+        any polling, and then stops the worker thread.
         """
         self.logger.debug("Drain started - waiting for queue to empty")
 
-        # Wait for all events to be processed - this is sufficient!
-        self._event_queue.join()
+        self.flush()
         self.logger.debug("Event queue drained")
 
+        self._shutdown_worker(timeout=5.0)
+        self.logger.info("Drain completed")
+
+    def _shutdown_worker(self, timeout: float) -> None:
+        """
+        Stop the worker, if no events are pending, and wait for it to release
+        the reporter's HTTP connections and close the sinks.
+        """
         # Signal worker to shutdown and wait for it
-        self._shutdown_event.set()
-        if self._worker_thread and self._worker_thread.is_alive():
+        self._stop_worker()
+        worker_thread = self._stopped_worker_thread
+        if (
+            worker_thread is not None
+            and worker_thread.is_alive()
+            and worker_thread is not threading.current_thread()
+        ):
             self.logger.debug("Waiting for worker thread to shutdown...")
-            self._worker_thread.join(timeout=5.0)
-            if self._worker_thread.is_alive():
+            worker_thread.join(timeout=timeout)
+            if worker_thread.is_alive():
                 self.logger.warning("Worker thread did not shutdown within timeout")
             else:
                 self.logger.debug("Worker thread shutdown complete")
 
-        self.logger.info("Drain completed")
-
     def is_completed(self) -> bool:
         """
         Returns whether all events have been processed.
         """
-        return self._completed and self._event_queue.empty()
+        with self._pending_condition:
+            return self._completed and self._pending_events == 0
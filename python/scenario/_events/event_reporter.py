@@ -1,11 +1,37 @@
+import asyncio
+import importlib.util
 import logging
+import os
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from .events import ScenarioEvent
+from .event_serializer import serialize_event, serialize_events
 from .event_alert_message_logger import EventAlertMessageLogger
 from scenario.config import LangWatchSettings, ScenarioConfig
 
 
+# Connections kept open to the endpoint by default, well above the batches the
+# event bus posts concurrently
+DEFAULT_MAX_CONNECTIONS = 20
+
+# Consecutive batches rejected as a whole after which the endpoint is taken as
+# not supporting batches, rather than each of them holding an invalid event
+MAX_BATCH_REJECTIONS = 2
+
+
+def get_events_max_connections() -> int:
+    """
+    Get the size of the connection pool events are posted through, from the
+    `events_max_connections` setting of scenario.configure() first, and from
+    the SCENARIO_EVENTS_MAX_CONNECTIONS environment variable otherwise.
+    """
+    config = ScenarioConfig.default_config
+    if config is not None and config.events_max_connections is not None:
+        return max(1, config.events_max_connections)
+    env_value = os.environ.get("SCENARIO_EVENTS_MAX_CONNECTIONS")
+    return max(1, int(env_value)) if env_value else DEFAULT_MAX_CONNECTIONS
+
+
 class EventReporter:
     """
     Handles HTTP posting of scenario events to external endpoints.
@@ -13,9 +39,19 @@ class EventReporter:
     Single responsibility: Send events via HTTP to configured endpoints
     with proper authentication and error handling.
 
+    Events are posted through a long-lived pooled HTTP client, with keep-alive
+    and HTTP/2 when the `h2` package is installed, e.g. through the `http2`
+    extra, `pip install langwatch-scenario[http2]`, so that consecutive events
+    reuse the same connections. The client is created on first use and bound
+    to the event loop it was created on, call `aclose()` on that same loop to
+    release its connections. The event bus does so when its worker stops,
+    including at interpreter exit.
+
     Args:
         endpoint (str, optional): Override endpoint URL. If not provided, uses LANGWATCH_ENDPOINT env var.
         api_key (str, optional): Override API key. If not provided, uses LANGWATCH_API_KEY env var.
+        max_connections (int, optional): Size of the connection pool. If not provided, uses the
+            `events_max_connections` setting or SCENARIO_EVENTS_MAX_CONNECTIONS env var. Defaults to 20.
 
     Example:
         # Using environment variables (LANGWATCH_ENDPOINT, LANGWATCH_API_KEY)
@@ -24,12 +60,14 @@ class EventReporter:
         # Override specific values
         reporter = EventReporter(endpoint="https://langwatch.yourdomain.com")
         reporter = EventReporter(api_key="your-api-key")
+        reporter = EventReporter(max_connections=50)
     """
 
     def __init__(
         self,
         endpoint: Optional[str] = None,
         api_key: Optional[str] = None,
+        max_connections: Optional[int] = None,
     ):
         # Load settings from environment variables
         langwatch_settings = LangWatchSettings()
@@ -37,12 +75,63 @@ class EventReporter:
         # Allow constructor parameters to override settings
         self.endpoint = endpoint or langwatch_settings.endpoint
         self.api_key = api_key or langwatch_settings.api_key
+        self.max_connections = (
+            max(1, max_connections)
+            if max_connections is not None
+            else get_events_max_connections()
+        )
         self.logger = logging.getLogger(__name__)
         self.event_alert_message_logger = EventAlertMessageLogger()
 
         # Show greeting message when reporter is initialized
         self.event_alert_message_logger.handle_greeting()
 
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Whether the endpoint accepts batches of events, until proven otherwise
+        self._batch_supported = True
+        self._batch_rejections = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client, creating it on first use.
+
+        httpx connections can't be shared across event loops, so a new client
+        is created if the reporter is used from a different loop than before.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=httpx.Timeout(30.0),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP client, releasing its connections.
+
+        Must be awaited on the same event loop events were posted from.
+        """
+        client = self._client
+        if client is None or self._client_loop is not asyncio.get_running_loop():
+            # Already closed, or now owned by another loop
+            return
+        self._client = None
+        self._client_loop = None
+        await client.aclose()
+
     async def post_event(self, event: ScenarioEvent) -> Dict[str, Any]:
         """
         Posts an event to the configured endpoint.
@@ -52,6 +141,19 @@ class EventReporter:
 
         Returns:
             Dict containing response data, including setUrl if available
+
+        Raises:
+            httpx.HTTPError: If the request could not be sent, or the endpoint
+                            is unavailable, so it can be retried
+        """
+        return await self._post_event(event, raise_for_status=False)
+
+    async def _post_event(
+        self, event: ScenarioEvent, raise_for_status: bool
+    ) -> Dict[str, Any]:
+        """
+        Post an event, optionally raising if the endpoint rejects it instead of
+        only logging it, e.g. so replayed events are kept in the spool.
         """
         event_type = event.type_
         self.logger.info(f"[{event_type}] Publishing event ({event.scenario_run_id})")
@@ -65,39 +167,170 @@ class EventReporter:
             return result
 
         try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.post(
-                    f"{self.endpoint}/api/scenario-events",
-                    json=event.to_dict(),
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-Auth-Token": self.api_key,
-                    },
-                    timeout=httpx.Timeout(30.0),
-                )
+            response = await self._get_client().post(
+                f"{self.endpoint}/api/scenario-events",
+                content=serialize_event(event),
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Auth-Token": self.api_key,
+                },
+            )
+            self.logger.info(
+                f"[{event_type}] POST response status: {response.status_code} ({event.scenario_run_id})"
+            )
+
+            if response.is_success:
+                data = response.json()
                 self.logger.info(
-                    f"[{event_type}] POST response status: {response.status_code} ({event.scenario_run_id})"
+                    f"[{event_type}] POST response: {data} ({event.scenario_run_id})"
                 )
 
-                if response.is_success:
-                    data = response.json()
-                    self.logger.info(
-                        f"[{event_type}] POST response: {data} ({event.scenario_run_id})"
-                    )
-
-                    # Extract setUrl from response if available
-                    if isinstance(data, dict) and "url" in data:
-                        result["setUrl"] = data["url"]
-                else:
-                    error_text = response.text
-                    self.logger.error(
-                        f"[{event_type}] Event POST failed: status={response.status_code}, "
-                        f"reason={response.reason_phrase}, error={error_text}, "
-                        f"event={event}"
-                    )
+                # Extract setUrl from response if available
+                if isinstance(data, dict) and "url" in data:
+                    result["setUrl"] = data["url"]
+            else:
+                error_text = response.text
+                self.logger.error(
+                    f"[{event_type}] Event POST failed: status={response.status_code}, "
+                    f"reason={response.reason_phrase}, error={error_text}, "
+                    f"event={event}"
+                )
+                self._raise_if_unavailable(response)
+                if raise_for_status:
+                    response.raise_for_status()
+        except httpx.HTTPError as error:
+            self.logger.error(
+                f"[{event_type}] Event POST error: {repr(error)}, event={event}, endpoint={self.endpoint}"
+            )
+            raise
         except Exception as error:
             self.logger.error(
                 f"[{event_type}] Event POST error: {repr(error)}, event={event}, endpoint={self.endpoint}"
             )
 
         return result
+
+    def _raise_if_unavailable(self, response: httpx.Response) -> None:
+        """
+        Raise for responses meaning the endpoint is temporarily unavailable,
+        rather than that the events were rejected.
+        """
+        if response.status_code == 429 or response.status_code >= 500:
+            raise httpx.HTTPStatusError(
+                f"Endpoint unavailable: status={response.status_code}",
+                request=response.request,
+                response=response,
+            )
+
+    async def post_events(
+        self, events: List[ScenarioEvent]
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Posts a batch of events to the configured endpoint in a single request.
+
+        The `/api/scenario-events/batch` route is speculative, it is not part of
+        the LangWatch API the client is generated from yet. If the endpoint turns
+        out not to support it, this returns None from then on, and the events
+        should be posted one by one with `post_event()` instead. Batches
+        rejected as a whole, with any other 4xx status, also return None, so
+        that each event gets its own chance and only the invalid ones are lost.
+        After MAX_BATCH_REJECTIONS such batches in a row, e.g. from an older
+        server answering 400 or 422, batches are given up on as well.
+
+        The response is expected to hold a `results` list with one item per
+        event, items with an `error` or a 4xx `status` meaning that event was
+        rejected. Any other response returns None as well, and counts as a
+        rejection.
+
+        Args:
+            events: ScenarioEvents to post, in order
+
+        Returns:
+            List with one dict of response data per event, including setUrl if
+            available, or None for the events that were rejected. None instead
+            of the list if the events must be posted individually
+
+        Raises:
+            httpx.HTTPError: If the request could not be sent, or the endpoint
+                            is unavailable, so it can be retried
+        """
+        if not self._batch_supported or not self.endpoint:
+            return None
+
+        self.logger.info(f"Publishing batch of {len(events)} events")
+
+        response = await self._get_client().post(
+            f"{self.endpoint}/api/scenario-events/batch",
+            content=serialize_events(events),
+            headers={
+                "Content-Type": "application/json",
+                "X-Auth-Token": self.api_key,
+            },
+        )
+        self.logger.info(f"Batch POST response status: {response.status_code}")
+
+        if response.status_code in (404, 405, 501):
+            self.logger.info(
+                "Endpoint does not support batches, falling back to posting events individually"
+            )
+            self._batch_supported = False
+            return None
+
+        if not response.is_success:
+            self.logger.error(
+                f"Batch POST failed: status={response.status_code}, "
+                f"reason={response.reason_phrase}, error={response.text}, "
+                f"events={len(events)}"
+            )
+            self._raise_if_unavailable(response)
+            # Rejected as a whole, find out which events are at fault
+            self._batch_rejected()
+            return None
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        response_items = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(response_items, list) or len(response_items) != len(events):
+            self.logger.warning(
+                f"Unexpected batch POST response, posting the {len(events)} events individually: {response.text[:200]}"
+            )
+            self._batch_rejected()
+            return None
+
+        self._batch_rejections = 0
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for event, item in zip(events, response_items):
+            if _is_rejected_item(item):
+                self.logger.error(
+                    f"[{event.type_}] Event rejected in batch: {item} ({event.scenario_run_id})"
+                )
+                results.append(None)
+                continue
+
+            result: Dict[str, Any] = {}
+            # Extract setUrl from response if available
+            if isinstance(item, dict) and "url" in item:
+                result["setUrl"] = item["url"]
+            results.append(result)
+
+        return results
+
+    def _batch_rejected(self) -> None:
+        self._batch_rejections += 1
+        if self._batch_rejections >= MAX_BATCH_REJECTIONS:
+            self.logger.info(
+                f"{self._batch_rejections} batches rejected in a row, falling back to posting events individually"
+            )
+            self._batch_supported = False
+
+
+def _is_rejected_item(item: Any) -> bool:
+    if not isinstance(item, dict):
+        return False
+    status = item.get("status")
+    return bool(item.get("error")) or (
+        isinstance(status, int) and 400 <= status < 600
+    )
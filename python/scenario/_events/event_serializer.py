@@ -0,0 +1,159 @@
+"""
+Fast JSON serialization of scenario events, as posted to LangWatch.
+
+Message snapshots carry the whole conversation, so going through the generated
+models' `to_dict()` and then encoding the result on every snapshot makes the
+cost of reporting a run grow quadratically with its length. Instead, each
+message is encoded only once, the first time it's posted, and snapshots are
+put together from the already encoded messages, which works because the
+MessageSnapshotBuilder reuses the same message objects across snapshots.
+Events are encoded only once too, so that the event bus can measure the size
+of a batch with the same encoding it then posts.
+
+Encoding uses orjson when it's installed, and the standard library json module
+otherwise, producing the same compact JSON documents as `to_dict()` encoded by
+httpx, key order included.
+"""
+
+import json
+import threading
+import weakref
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+from scenario._generated.langwatch_api_client.lang_watch_api_client.models import (
+    PostApiScenarioEventsBodyType2,
+)
+from scenario._generated.langwatch_api_client.lang_watch_api_client.types import UNSET
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Encoded messages and events by id of the object, dropped once it's collected
+_encoded_messages: Dict[int, Tuple["weakref.ref[Any]", bytes]] = {}
+_encoded_events: Dict[int, Tuple["weakref.ref[Any]", bytes]] = {}
+_encoded_lock = threading.Lock()
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a JSON value to compact UTF-8 bytes, with orjson if available.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the json module handles
+            pass
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+def _forget(cache: Dict[int, Tuple["weakref.ref[Any]", bytes]], key: int) -> None:
+    with _encoded_lock:
+        cache.pop(key, None)
+
+
+def _encode_once(
+    cache: Dict[int, Tuple["weakref.ref[Any]", bytes]],
+    value: Any,
+    encode: Callable[[Any], bytes],
+) -> bytes:
+    key = id(value)
+    with _encoded_lock:
+        cached = cache.get(key)
+    if cached is not None and cached[0]() is value:
+        return cached[1]
+
+    encoded = encode(value)
+    try:
+        ref = weakref.ref(value, lambda _: _forget(cache, key))
+    except TypeError:
+        return encoded
+    with _encoded_lock:
+        cache[key] = (ref, encoded)
+    return encoded
+
+
+def _encode_message(message: Any) -> bytes:
+    return _encode_once(
+        _encoded_messages, message, lambda message: dumps(message.to_dict())
+    )
+
+
+def _encode_event(event: Any) -> bytes:
+    if isinstance(event, PostApiScenarioEventsBodyType2):
+        return _encode_snapshot(event)
+    return dumps(event.to_dict())
+
+
+def _encode_snapshot(event: PostApiScenarioEventsBodyType2) -> bytes:
+    # Same fields, in the same order, as the generated to_dict(), with the
+    # messages spliced in already encoded
+    head: Dict[str, Any] = dict(event.additional_properties)
+    head["type"] = event.type_
+    head["timestamp"] = event.timestamp
+
+    tail: Dict[str, Any] = {
+        "batchRunId": event.batch_run_id,
+        "scenarioId": event.scenario_id,
+        "scenarioRunId": event.scenario_run_id,
+    }
+    if event.raw_event is not UNSET:
+        tail["rawEvent"] = event.raw_event
+    if event.scenario_set_id is not UNSET:
+        tail["scenarioSetId"] = event.scenario_set_id
+
+    return b"".join(
+        [
+            dumps(head)[:-1],
+            b',"messages":[',
+            b",".join(_encode_message(message) for message in event.messages),
+            b"],",
+            dumps(tail)[1:],
+        ]
+    )
+
+
+def serialize_event(event: Any) -> bytes:
+    """
+    Encode a scenario event to the JSON document it's posted as.
+
+    The encoding is kept for as long as the event object lives, so events must
+    not be changed once they were serialized.
+
+    Args:
+        event: Event to encode, any object with a `to_dict()` method
+
+    Returns:
+        The encoded event
+    """
+    return _encode_once(_encoded_events, event, _encode_event)
+
+
+def serialize_events(events: Sequence[Any]) -> bytes:
+    """
+    Encode a batch of scenario events to the JSON document it's posted as.
+
+    Args:
+        events: Events to encode, in order
+
+    Returns:
+        The encoded `{"events": [...]}` document
+    """
+    return b"".join(
+        [
+            b'{"events":[',
+            b",".join(serialize_event(event) for event in events),
+            b"]}",
+        ]
+    )
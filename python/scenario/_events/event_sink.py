@@ -0,0 +1,332 @@
+"""
+Local sinks for scenario events, written to disk alongside, or instead of,
+posting them to LangWatch.
+
+Two directories can be configured through environment variables:
+
+- SCENARIO_EVENTS_DIR: every event posted by the event bus is also appended to
+  JSONL segment files in this directory, so runs can be analysed offline, e.g.
+  in air-gapped CI where no LangWatch endpoint is reachable
+- SCENARIO_EVENTS_SPOOL_DIR: events that could not be delivered after all
+  retries are spooled to this directory instead of being dropped, and can be
+  re-sent later with `scenario events replay`. They are not re-sent
+  automatically once the endpoint is reachable again
+"""
+
+from abc import ABC, abstractmethod
+import json
+import logging
+import os
+import threading
+import time
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from .event_reporter import EventReporter
+from .event_serializer import serialize_event
+from .events import ScenarioEvent
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# Segments still being written to, renamed once closed
+_OPEN_SEGMENT_SUFFIX = ".open"
+
+_REPLAY_BATCH_SIZE = 100
+
+
+class EventSink(ABC):
+    """
+    Destination events are written to by the ScenarioEventBus, in addition to
+    being posted by its EventReporter.
+
+    Sinks are called from the bus' worker thread, with the events in the order
+    they are posted, so a sink doesn't need to be thread-safe unless it's
+    shared by several buses.
+    """
+
+    @abstractmethod
+    def write(self, events: Sequence[ScenarioEvent]) -> None:
+        """Write a batch of events"""
+        pass
+
+    def flush(self) -> None:
+        """Make sure the events written so far are persisted"""
+        pass
+
+    def close(self) -> None:
+        """Flush and release the resources held by the sink, it can still be written to afterwards"""
+        pass
+
+
+class JsonlEventSink(EventSink):
+    """
+    Append-only JSONL event sink, rotating through segment files.
+
+    Events are written one per line, in the same JSON format they are posted
+    in, through a write buffer. The segment being written is fsynced at most
+    once per `fsync_interval` seconds, so that writing many events doesn't pay
+    for a disk sync each time, and on `flush()` and `close()`.
+
+    Once a segment grows beyond `max_segment_bytes`, or the sink is closed, it
+    is completed and a new one is started on the next write. Segments are
+    named after the time they were started, so they sort chronologically, and
+    carry an `.open` suffix until completed.
+
+    Args:
+        directory: Directory the segments are written to, created if missing
+        prefix: Prefix of the segment file names
+        max_segment_bytes: Size after which a new segment is started
+        fsync_interval: Maximum time in seconds between two disk syncs, 0 to
+                       sync on every write
+
+    Example:
+        ```
+        bus = ScenarioEventBus(sinks=[JsonlEventSink("/tmp/scenario/events")])
+        ```
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "events",
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync_interval: float = 1.0,
+    ):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync_interval = fsync_interval
+
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._path: Optional[str] = None
+        self._pid = os.getpid()
+        self._segment_bytes = 0
+        self._segment_count = 0
+        self._synced_at = 0.0
+
+    def write(self, events: Sequence[ScenarioEvent]) -> None:
+        if not events:
+            return
+        data = b"".join(serialize_event(event) + b"\n" for event in events)
+
+        with self._lock:
+            file = self._open_segment()
+            file.write(data)
+            self._segment_bytes += len(data)
+
+            if self._segment_bytes >= self.max_segment_bytes:
+                self._close_segment()
+            elif time.monotonic() - self._synced_at >= self.fsync_interval:
+                self._sync()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None and self._pid == os.getpid():
+                self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_segment()
+
+    def _open_segment(self) -> IO[bytes]:
+        if self._pid != os.getpid():
+            # Forked, the segment belongs to the parent process
+            self._file = None
+            self._path = None
+            self._pid = os.getpid()
+            self._segment_count = 0
+
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            name = f"{self.prefix}-{int(time.time() * 1000):013d}-{self._pid}-{self._segment_count:04d}.jsonl"
+            self._segment_count += 1
+            self._path = os.path.join(self.directory, name)
+            self._file = open(self._path + _OPEN_SEGMENT_SUFFIX, "ab")
+            self._segment_bytes = 0
+            self._synced_at = time.monotonic()
+        return self._file
+
+    def _sync(self) -> None:
+        assert self._file is not None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._synced_at = time.monotonic()
+
+    def _close_segment(self) -> None:
+        if self._file is None or self._path is None or self._pid != os.getpid():
+            return
+        try:
+            self._sync()
+            self._file.close()
+            os.replace(self._path + _OPEN_SEGMENT_SUFFIX, self._path)
+        finally:
+            self._file = None
+            self._path = None
+
+
+def get_events_dir() -> Optional[str]:
+    """Get the directory all events are written to, from SCENARIO_EVENTS_DIR"""
+    return os.environ.get("SCENARIO_EVENTS_DIR") or None
+
+
+def get_events_spool_dir() -> Optional[str]:
+    """Get the directory undelivered events are spooled to, from SCENARIO_EVENTS_SPOOL_DIR"""
+    return os.environ.get("SCENARIO_EVENTS_SPOOL_DIR") or None
+
+
+def default_event_sinks() -> List[EventSink]:
+    """Get the event sinks configured through the environment"""
+    events_dir = get_events_dir()
+    return [JsonlEventSink(events_dir)] if events_dir else []
+
+
+def default_event_spool() -> Optional[EventSink]:
+    """Get the spool for undelivered events configured through the environment"""
+    spool_dir = get_events_spool_dir()
+    return JsonlEventSink(spool_dir, prefix="spool") if spool_dir else None
+
+
+class SpooledEvent:
+    """
+    Event read back from a JSONL segment, posted again exactly as it was
+    written, without going through the event models.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.type_ = data.get("type")
+        self.scenario_run_id = data.get("scenarioRunId")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.data
+
+    def __repr__(self) -> str:
+        return f"SpooledEvent({self.type_}, {self.scenario_run_id})"
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill would terminate the process, assume it's still writing
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def spooled_segments(directory: str) -> List[str]:
+    """
+    List the segments of a spool directory that can be replayed, oldest first.
+
+    Completed segments are always included, while segments still open are
+    only included if the process writing them is gone, e.g. after a crash.
+
+    Args:
+        directory: Spool directory
+
+    Returns:
+        Paths of the segment files
+    """
+    if not os.path.isdir(directory):
+        return []
+
+    segments: List[str] = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".jsonl"):
+            segments.append(os.path.join(directory, name))
+        elif name.endswith(".jsonl" + _OPEN_SEGMENT_SUFFIX):
+            try:
+                pid = int(name.split("-")[-2])
+            except (IndexError, ValueError):
+                continue
+            if pid != os.getpid() and not _pid_alive(pid):
+                segments.append(os.path.join(directory, name))
+    return segments
+
+
+async def _replay_events(
+    event_reporter: EventReporter, events: List[SpooledEvent]
+) -> List[bool]:
+    """Post spooled events, telling for each one whether it was accepted"""
+    try:
+        results = await event_reporter.post_events(events)  # type: ignore[arg-type]
+    except httpx.HTTPError as error:
+        logger.error(f"Error replaying batch of {len(events)} events: {error}")
+        return [False for _ in events]
+    if results is not None:
+        return [result is not None for result in results]
+
+    delivered: List[bool] = []
+    for event in events:
+        try:
+            await event_reporter._post_event(event, raise_for_status=True)  # type: ignore[arg-type]
+            delivered.append(True)
+        except Exception as error:
+            logger.error(f"Error replaying event {event}: {error}")
+            delivered.append(False)
+    return delivered
+
+
+async def replay_spooled_events(
+    directory: str, event_reporter: Optional[EventReporter] = None
+) -> Tuple[int, int]:
+    """
+    Re-send the events spooled while the LangWatch endpoint was unreachable.
+
+    Segments are replayed oldest first, and removed once all their events were
+    accepted by the endpoint. Segments with events that still couldn't be
+    delivered, or were rejected, are rewritten with only those events, so
+    replaying again doesn't send any event twice.
+
+    Args:
+        directory: Spool directory, as set with SCENARIO_EVENTS_SPOOL_DIR
+        event_reporter: Reporter to post the events with, configured from the
+                       environment by default
+
+    Returns:
+        The number of events delivered, and the number still left in the spool
+
+    Raises:
+        ValueError: If no LangWatch endpoint is configured
+    """
+    event_reporter = event_reporter or EventReporter()
+    if not event_reporter.endpoint:
+        raise ValueError("No LANGWATCH_ENDPOINT configured to replay events to")
+
+    delivered_count = 0
+    undelivered_count = 0
+    try:
+        for path in spooled_segments(directory):
+            with open(path, "rb") as f:
+                lines = [line for line in f if line.strip()]
+
+            undelivered: List[bytes] = []
+            for i in range(0, len(lines), _REPLAY_BATCH_SIZE):
+                chunk = lines[i : i + _REPLAY_BATCH_SIZE]
+                events = [SpooledEvent(json.loads(line)) for line in chunk]
+                delivered = await _replay_events(event_reporter, events)
+                undelivered.extend(
+                    line for line, ok in zip(chunk, delivered) if not ok
+                )
+                delivered_count += sum(delivered)
+
+            if undelivered:
+                undelivered_count += len(undelivered)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.writelines(undelivered)
+                os.replace(tmp_path, path)
+            else:
+                os.remove(path)
+    finally:
+        await event_reporter.aclose()
+
+    return delivered_count, undelivered_count
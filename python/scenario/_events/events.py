@@ -141,6 +141,54 @@ class ScenarioMessageSnapshotEvent(PostApiScenarioEventsBodyType2):
             scenario_set_id=scenario_set_id or "default"
         )
 
+class ScenarioMessageDeltaEvent(ScenarioMessageSnapshotEvent):
+    """
+    Incremental message snapshot, carrying only the messages appended to the
+    conversation since the previous snapshot of the run.
+
+    Posted as a regular SCENARIO_MESSAGE_SNAPSHOT event, flagged with `delta`,
+    so consumers append its messages, keyed by their stable ids, to the ones
+    they already received instead of replacing the whole conversation. The
+    `baseMessageCount` field tells how many messages the conversation held
+    before this delta, which lets consumers detect gaps and wait for the next
+    full snapshot to resynchronise.
+
+    Args:
+        batch_run_id (str): Unique identifier for the batch of scenario runs
+        scenario_id (str): Unique identifier for the scenario definition
+        scenario_run_id (str): Unique identifier for this specific run
+        messages (list[MessageType]): Messages appended since the previous snapshot
+        base_message_count (int): Number of messages in the conversation before this delta
+        timestamp (Optional[int], optional): Unix timestamp in milliseconds, auto-generated if not provided
+        raw_event (Optional[Any], optional): Raw event data
+        scenario_set_id (Optional[str], optional): Set identifier, defaults to "default"
+    """
+    def __init__(
+        self,
+        batch_run_id: str,
+        scenario_id: str,
+        scenario_run_id: str,
+        messages: list[MessageType],
+        base_message_count: int,
+        timestamp: int,
+        raw_event: Optional[Any] = None,
+        scenario_set_id: Optional[str] = "default"
+    ):
+        super().__init__(
+            batch_run_id=batch_run_id,
+            scenario_id=scenario_id,
+            scenario_run_id=scenario_run_id,
+            messages=messages,
+            timestamp=timestamp,
+            raw_event=raw_event,
+            scenario_set_id=scenario_set_id
+        )
+        self.base_message_count = base_message_count
+        self.additional_properties = {
+            "delta": True,
+            "baseMessageCount": base_message_count,
+        }
+
 # Union type for all supported event types
 ScenarioEvent = Union[
     ScenarioRunStartedEvent,
@@ -158,5 +206,6 @@ __all__ = [
     "ScenarioRunFinishedEventVerdict",
     "ScenarioRunFinishedEventStatus",
     "ScenarioMessageSnapshotEvent",
+    "ScenarioMessageDeltaEvent",
     "MessageType",
 ]
\ No newline at end of file
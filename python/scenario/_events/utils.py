@@ -1,7 +1,12 @@
+import os
 import warnings
 
 from ..types import ChatCompletionMessageParamWithTrace
-from .events import MessageType
+from .events import (
+    MessageType,
+    ScenarioMessageDeltaEvent,
+    ScenarioMessageSnapshotEvent,
+)
 from .messages import (
     SystemMessage,
     AssistantMessage,
@@ -10,12 +15,51 @@ from .messages import (
     ToolCall,
     FunctionCall,
 )
-from typing import List
+from typing import Any, Dict, List, Literal, Optional, Tuple, cast
 from pksuid import PKSUID
 
+from .._utils.utils import matches_fingerprint, message_fingerprint
+
+
+SnapshotMode = Literal["full", "delta"]
+
+_SNAPSHOT_MODES = ("full", "delta")
+
+_DEFAULT_FULL_SNAPSHOT_INTERVAL = 10
+
+
+def get_snapshot_mode() -> SnapshotMode:
+    """
+    Get the message snapshot mode from the SCENARIO_SNAPSHOT_MODE environment variable.
+
+    Returns:
+        "full" to send the whole conversation on every snapshot, the default,
+        or "delta" to only send the messages appended since the previous one
+
+    Raises:
+        ValueError: If the environment variable is set to an unknown mode
+    """
+    mode = os.environ.get("SCENARIO_SNAPSHOT_MODE", "").strip().lower() or "full"
+    if mode not in _SNAPSHOT_MODES:
+        raise ValueError(
+            f"Unknown SCENARIO_SNAPSHOT_MODE {mode!r}, expected one of: {', '.join(_SNAPSHOT_MODES)}"
+        )
+    return cast(SnapshotMode, mode)
+
+
+def get_full_snapshot_interval() -> int:
+    """
+    Get how many snapshots of a run are sent in "delta" mode between two full
+    ones, from the SCENARIO_FULL_SNAPSHOT_INTERVAL environment variable.
+    """
+    interval = os.environ.get("SCENARIO_FULL_SNAPSHOT_INTERVAL")
+    return max(1, int(interval)) if interval else _DEFAULT_FULL_SNAPSHOT_INTERVAL
+
 
 def convert_messages_to_api_client_messages(
     messages: list[ChatCompletionMessageParamWithTrace],
+    start_index: int = 0,
+    cache: Optional[Dict[str, MessageType]] = None,
 ) -> list[MessageType]:
     """
     Converts OpenAI ChatCompletionMessageParam messages to API client Message format.
@@ -25,6 +69,10 @@ def convert_messages_to_api_client_messages(
 
     Args:
         messages: List of OpenAI ChatCompletionMessageParam messages
+        start_index: Position of the first message in the whole conversation,
+                    used in error messages when converting only part of it
+        cache: Optional mapping of message ids to already converted messages,
+              reused for messages with an id and filled with the new ones
 
     Returns:
         List of API client Message objects
@@ -35,9 +83,14 @@ def convert_messages_to_api_client_messages(
 
     converted_messages: list[MessageType] = []
 
-    for i, message in enumerate(messages):
+    for i, message in enumerate(messages, start=start_index):
+        source_id = message.get("id")
+        if cache is not None and source_id and source_id in cache:
+            converted_messages.append(cache[source_id])
+            continue
+
         # Generate unique ID for each message
-        message_id = message.get("id") or str(PKSUID("scenariomsg"))
+        message_id = source_id or str(PKSUID("scenariomsg"))
 
         role = message.get("role")
         content = message.get("content")
@@ -51,7 +104,6 @@ def convert_messages_to_api_client_messages(
                 content=str(content),
             )
             message_.additional_properties = {"trace_id": message.get("trace_id")}
-            converted_messages.append(message_)
         elif role == "assistant":
             # Handle tool calls if present
             tool_calls = message.get("tool_calls")
@@ -77,7 +129,6 @@ def convert_messages_to_api_client_messages(
                 tool_calls=api_tool_calls,
             )
             message_.additional_properties = {"trace_id": message.get("trace_id")}
-            converted_messages.append(message_)
         elif role == "system":
             if not content:
                 raise ValueError(
@@ -85,7 +136,6 @@ def convert_messages_to_api_client_messages(
                 )
             message_ = SystemMessage(id=message_id, role="system", content=str(content))
             message_.additional_properties = {"trace_id": message.get("trace_id")}
-            converted_messages.append(message_)
         elif role == "tool":
             tool_call_id = message.get("tool_call_id")
             if not tool_call_id:
@@ -106,8 +156,166 @@ def convert_messages_to_api_client_messages(
                 tool_call_id=tool_call_id,
             )
             message_.additional_properties = {"trace_id": message.get("trace_id")}
-            converted_messages.append(message_)
         else:
             raise ValueError(f"Unsupported message role '{role}' at index {i}")
 
+        if cache is not None and source_id:
+            cache[source_id] = message_
+        converted_messages.append(message_)
+
     return converted_messages
+
+
+def merge_message_snapshots(
+    older: ScenarioMessageSnapshotEvent, newer: ScenarioMessageSnapshotEvent
+) -> ScenarioMessageSnapshotEvent:
+    """
+    Merge two consecutive message snapshots of the same run into one.
+
+    A full snapshot simply supersedes whatever came before it, while a delta is
+    applied on top of the older snapshot, keyed by message id, so the merged
+    snapshot is a full one if the older one was, or a delta covering both.
+
+    Args:
+        older: Snapshot that was waiting to be posted
+        newer: Snapshot that came after it
+
+    Returns:
+        A single snapshot equivalent to posting both, in order
+    """
+    if not isinstance(newer, ScenarioMessageDeltaEvent):
+        return newer
+
+    merged = {message.id: message for message in older.messages}
+    for message in newer.messages:
+        merged[message.id] = message
+    messages = list(merged.values())
+
+    common_fields = {
+        "batch_run_id": newer.batch_run_id,
+        "scenario_id": newer.scenario_id,
+        "scenario_run_id": newer.scenario_run_id,
+        "scenario_set_id": newer.scenario_set_id,
+        "timestamp": newer.timestamp,
+    }
+    if isinstance(older, ScenarioMessageDeltaEvent):
+        return ScenarioMessageDeltaEvent(
+            **common_fields,
+            messages=messages,
+            base_message_count=older.base_message_count,
+        )
+    return ScenarioMessageSnapshotEvent(**common_fields, messages=messages)
+
+
+class MessageSnapshotBuilder:
+    """
+    Builds the message snapshots of a single scenario run incrementally.
+
+    Messages are converted to the API client format only once, when they are
+    first seen, and the converted messages are kept, so a snapshot never
+    re-converts the whole conversation and messages keep the same id across
+    snapshots. In "delta" mode, snapshots only carry the messages appended
+    since the previous one, with a full snapshot every `full_snapshot_interval`
+    snapshots for consumers to resynchronise.
+
+    If the end of the conversation is rewritten rather than appended to, or a
+    message at its end is changed in place, see `message_fingerprint()`, the
+    next snapshot is a full one, still reusing by id the converted messages that
+    came before the change. Only the tail is checked, back to the last unchanged
+    message, so a message rewritten before an unchanged one isn't detected.
+
+    Args:
+        mode: Either "full" or "delta"
+        full_snapshot_interval: Number of snapshots between two full ones in "delta" mode
+    """
+
+    def __init__(self, mode: SnapshotMode = "full", full_snapshot_interval: int = 10):
+        self.mode = mode
+        self.full_snapshot_interval = max(1, full_snapshot_interval)
+
+        self._converted: List[MessageType] = []
+        self._converted_by_id: Dict[str, MessageType] = {}
+        # Messages converted so far, with the values of their keys at the time
+        self._sources: List[Any] = []
+        self._fingerprints: List[List[Tuple[str, Any]]] = []
+        self._sent_count = 0
+        self._snapshots_since_full: Optional[int] = None
+
+    def build(
+        self, messages: list[ChatCompletionMessageParamWithTrace]
+    ) -> Optional[Tuple[List[MessageType], Optional[int]]]:
+        """
+        Build the next snapshot of the conversation.
+
+        Args:
+            messages: All the messages of the conversation so far
+
+        Returns:
+            The messages of the snapshot, with the number of messages the
+            conversation held before them for a delta, or None for a full
+            snapshot. Returns None altogether when a delta would be empty.
+        """
+        changed_at = self._changed_at(messages)
+        if changed_at < len(self._sources):
+            # The conversation was rewritten, start over from scratch, only
+            # reusing the conversions of the messages before the change
+            for message in messages[changed_at:]:
+                message_id = message.get("id")
+                if message_id is not None:
+                    self._converted_by_id.pop(message_id, None)
+            self._converted = []
+            self._sources = []
+            self._fingerprints = []
+            self._sent_count = 0
+            self._snapshots_since_full = None
+
+        source_count = len(self._sources)
+        if len(messages) > source_count:
+            new_messages = messages[source_count:]
+            self._converted.extend(
+                convert_messages_to_api_client_messages(
+                    new_messages,
+                    start_index=source_count,
+                    cache=self._converted_by_id,
+                )
+            )
+            self._sources.extend(new_messages)
+            self._fingerprints.extend(
+                message_fingerprint(message) for message in new_messages
+            )
+
+        base_message_count = self._sent_count
+        if (
+            self.mode == "delta"
+            and self._snapshots_since_full is not None
+            and base_message_count == len(self._converted)
+        ):
+            return None
+        self._sent_count = len(self._converted)
+
+        if (
+            self.mode == "full"
+            or self._snapshots_since_full is None
+            or self._snapshots_since_full + 1 >= self.full_snapshot_interval
+        ):
+            self._snapshots_since_full = 0
+            return list(self._converted), None
+
+        self._snapshots_since_full += 1
+        return self._converted[base_message_count:], base_message_count
+
+    def _changed_at(self, messages: list[ChatCompletionMessageParamWithTrace]) -> int:
+        """
+        Index of the first converted message that was removed, replaced or
+        changed, walking back from the last one until one is found unchanged,
+        so that this costs O(1) per snapshot while messages are only appended
+        """
+        changed_at = min(len(self._sources), len(messages))
+        while changed_at > 0 and (
+            messages[changed_at - 1] is not self._sources[changed_at - 1]
+            or not matches_fingerprint(
+                messages[changed_at - 1], self._fingerprints[changed_at - 1]
+            )
+        ):
+            changed_at -= 1
+        return changed_at
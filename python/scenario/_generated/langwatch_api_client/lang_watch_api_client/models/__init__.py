@@ -1,277 +1,383 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .annotation import Annotation
-from .dataset_post_entries import DatasetPostEntries
-from .dataset_post_entries_entries_item import DatasetPostEntriesEntriesItem
-from .delete_api_annotations_id_response_200 import DeleteApiAnnotationsIdResponse200
-from .delete_api_prompts_by_id_response_200 import DeleteApiPromptsByIdResponse200
-from .delete_api_prompts_by_id_response_400 import DeleteApiPromptsByIdResponse400
-from .delete_api_prompts_by_id_response_400_error import DeleteApiPromptsByIdResponse400Error
-from .delete_api_prompts_by_id_response_401 import DeleteApiPromptsByIdResponse401
-from .delete_api_prompts_by_id_response_401_error import DeleteApiPromptsByIdResponse401Error
-from .delete_api_prompts_by_id_response_404 import DeleteApiPromptsByIdResponse404
-from .delete_api_prompts_by_id_response_500 import DeleteApiPromptsByIdResponse500
-from .delete_api_scenario_events_response_200 import DeleteApiScenarioEventsResponse200
-from .delete_api_scenario_events_response_400 import DeleteApiScenarioEventsResponse400
-from .delete_api_scenario_events_response_401 import DeleteApiScenarioEventsResponse401
-from .delete_api_scenario_events_response_500 import DeleteApiScenarioEventsResponse500
-from .error import Error
-from .evaluation import Evaluation
-from .evaluation_timestamps import EvaluationTimestamps
-from .get_api_dataset_by_slug_or_id_response_200 import GetApiDatasetBySlugOrIdResponse200
-from .get_api_dataset_by_slug_or_id_response_200_data_item import GetApiDatasetBySlugOrIdResponse200DataItem
-from .get_api_dataset_by_slug_or_id_response_200_data_item_entry import GetApiDatasetBySlugOrIdResponse200DataItemEntry
-from .get_api_dataset_by_slug_or_id_response_400 import GetApiDatasetBySlugOrIdResponse400
-from .get_api_dataset_by_slug_or_id_response_401 import GetApiDatasetBySlugOrIdResponse401
-from .get_api_dataset_by_slug_or_id_response_404 import GetApiDatasetBySlugOrIdResponse404
-from .get_api_dataset_by_slug_or_id_response_422 import GetApiDatasetBySlugOrIdResponse422
-from .get_api_dataset_by_slug_or_id_response_500 import GetApiDatasetBySlugOrIdResponse500
-from .get_api_prompts_by_id_response_200 import GetApiPromptsByIdResponse200
-from .get_api_prompts_by_id_response_200_messages_item import GetApiPromptsByIdResponse200MessagesItem
-from .get_api_prompts_by_id_response_200_messages_item_role import GetApiPromptsByIdResponse200MessagesItemRole
-from .get_api_prompts_by_id_response_200_response_format_type_0 import GetApiPromptsByIdResponse200ResponseFormatType0
-from .get_api_prompts_by_id_response_200_response_format_type_0_json_schema import (
-    GetApiPromptsByIdResponse200ResponseFormatType0JsonSchema,
-)
-from .get_api_prompts_by_id_response_200_response_format_type_0_json_schema_schema import (
-    GetApiPromptsByIdResponse200ResponseFormatType0JsonSchemaSchema,
-)
-from .get_api_prompts_by_id_response_200_response_format_type_0_type import (
-    GetApiPromptsByIdResponse200ResponseFormatType0Type,
-)
-from .get_api_prompts_by_id_response_400 import GetApiPromptsByIdResponse400
-from .get_api_prompts_by_id_response_400_error import GetApiPromptsByIdResponse400Error
-from .get_api_prompts_by_id_response_401 import GetApiPromptsByIdResponse401
-from .get_api_prompts_by_id_response_401_error import GetApiPromptsByIdResponse401Error
-from .get_api_prompts_by_id_response_404 import GetApiPromptsByIdResponse404
-from .get_api_prompts_by_id_response_500 import GetApiPromptsByIdResponse500
-from .get_api_prompts_by_id_versions_response_200 import GetApiPromptsByIdVersionsResponse200
-from .get_api_prompts_by_id_versions_response_200_config_data import GetApiPromptsByIdVersionsResponse200ConfigData
-from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrations,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItem,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item_type import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItemType,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations_rows_item import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsRowsItem,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_inputs_item import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataInputsItem,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_inputs_item_type import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataInputsItemType,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_messages_item import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataMessagesItem,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_messages_item_role import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataMessagesItemRole,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_outputs_item import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItem,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_outputs_item_json_schema import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItemJsonSchema,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_outputs_item_type import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItemType,
-)
-from .get_api_prompts_by_id_versions_response_200_config_data_prompting_technique import (
-    GetApiPromptsByIdVersionsResponse200ConfigDataPromptingTechnique,
-)
-from .get_api_prompts_by_id_versions_response_400 import GetApiPromptsByIdVersionsResponse400
-from .get_api_prompts_by_id_versions_response_400_error import GetApiPromptsByIdVersionsResponse400Error
-from .get_api_prompts_by_id_versions_response_401 import GetApiPromptsByIdVersionsResponse401
-from .get_api_prompts_by_id_versions_response_401_error import GetApiPromptsByIdVersionsResponse401Error
-from .get_api_prompts_by_id_versions_response_404 import GetApiPromptsByIdVersionsResponse404
-from .get_api_prompts_by_id_versions_response_500 import GetApiPromptsByIdVersionsResponse500
-from .get_api_prompts_response_200_item import GetApiPromptsResponse200Item
-from .get_api_prompts_response_200_item_messages_item import GetApiPromptsResponse200ItemMessagesItem
-from .get_api_prompts_response_200_item_messages_item_role import GetApiPromptsResponse200ItemMessagesItemRole
-from .get_api_prompts_response_200_item_response_format_type_0 import GetApiPromptsResponse200ItemResponseFormatType0
-from .get_api_prompts_response_200_item_response_format_type_0_json_schema import (
-    GetApiPromptsResponse200ItemResponseFormatType0JsonSchema,
-)
-from .get_api_prompts_response_200_item_response_format_type_0_json_schema_schema import (
-    GetApiPromptsResponse200ItemResponseFormatType0JsonSchemaSchema,
-)
-from .get_api_prompts_response_200_item_response_format_type_0_type import (
-    GetApiPromptsResponse200ItemResponseFormatType0Type,
-)
-from .get_api_prompts_response_400 import GetApiPromptsResponse400
-from .get_api_prompts_response_400_error import GetApiPromptsResponse400Error
-from .get_api_prompts_response_401 import GetApiPromptsResponse401
-from .get_api_prompts_response_401_error import GetApiPromptsResponse401Error
-from .get_api_prompts_response_500 import GetApiPromptsResponse500
-from .get_api_trace_id_response_200 import GetApiTraceIdResponse200
-from .get_api_trace_id_response_200_error_type_0 import GetApiTraceIdResponse200ErrorType0
-from .get_api_trace_id_response_200_evaluations_item import GetApiTraceIdResponse200EvaluationsItem
-from .get_api_trace_id_response_200_evaluations_item_error import GetApiTraceIdResponse200EvaluationsItemError
-from .get_api_trace_id_response_200_evaluations_item_timestamps import GetApiTraceIdResponse200EvaluationsItemTimestamps
-from .get_api_trace_id_response_200_input import GetApiTraceIdResponse200Input
-from .get_api_trace_id_response_200_metadata import GetApiTraceIdResponse200Metadata
-from .get_api_trace_id_response_200_metrics import GetApiTraceIdResponse200Metrics
-from .get_api_trace_id_response_200_output import GetApiTraceIdResponse200Output
-from .get_api_trace_id_response_200_spans_item import GetApiTraceIdResponse200SpansItem
-from .get_api_trace_id_response_200_spans_item_error_type_0 import GetApiTraceIdResponse200SpansItemErrorType0
-from .get_api_trace_id_response_200_spans_item_input import GetApiTraceIdResponse200SpansItemInput
-from .get_api_trace_id_response_200_spans_item_input_value_item import GetApiTraceIdResponse200SpansItemInputValueItem
-from .get_api_trace_id_response_200_spans_item_metrics import GetApiTraceIdResponse200SpansItemMetrics
-from .get_api_trace_id_response_200_spans_item_output import GetApiTraceIdResponse200SpansItemOutput
-from .get_api_trace_id_response_200_spans_item_output_value_item import GetApiTraceIdResponse200SpansItemOutputValueItem
-from .get_api_trace_id_response_200_spans_item_params import GetApiTraceIdResponse200SpansItemParams
-from .get_api_trace_id_response_200_spans_item_timestamps import GetApiTraceIdResponse200SpansItemTimestamps
-from .get_api_trace_id_response_200_timestamps import GetApiTraceIdResponse200Timestamps
-from .input_ import Input
-from .metadata import Metadata
-from .metrics import Metrics
-from .output import Output
-from .pagination import Pagination
-from .patch_api_annotations_id_body import PatchApiAnnotationsIdBody
-from .patch_api_annotations_id_response_200 import PatchApiAnnotationsIdResponse200
-from .post_api_annotations_trace_id_body import PostApiAnnotationsTraceIdBody
-from .post_api_prompts_body import PostApiPromptsBody
-from .post_api_prompts_by_id_versions_body import PostApiPromptsByIdVersionsBody
-from .post_api_prompts_by_id_versions_body_config_data import PostApiPromptsByIdVersionsBodyConfigData
-from .post_api_prompts_by_id_versions_body_config_data_demonstrations import (
-    PostApiPromptsByIdVersionsBodyConfigDataDemonstrations,
-)
-from .post_api_prompts_by_id_versions_body_config_data_demonstrations_columns_item import (
-    PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsColumnsItem,
-)
-from .post_api_prompts_by_id_versions_body_config_data_demonstrations_columns_item_type import (
-    PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsColumnsItemType,
-)
-from .post_api_prompts_by_id_versions_body_config_data_demonstrations_rows_item import (
-    PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsRowsItem,
-)
-from .post_api_prompts_by_id_versions_body_config_data_inputs_item import (
-    PostApiPromptsByIdVersionsBodyConfigDataInputsItem,
-)
-from .post_api_prompts_by_id_versions_body_config_data_inputs_item_type import (
-    PostApiPromptsByIdVersionsBodyConfigDataInputsItemType,
-)
-from .post_api_prompts_by_id_versions_body_config_data_messages_item import (
-    PostApiPromptsByIdVersionsBodyConfigDataMessagesItem,
-)
-from .post_api_prompts_by_id_versions_body_config_data_messages_item_role import (
-    PostApiPromptsByIdVersionsBodyConfigDataMessagesItemRole,
-)
-from .post_api_prompts_by_id_versions_body_config_data_outputs_item import (
-    PostApiPromptsByIdVersionsBodyConfigDataOutputsItem,
-)
-from .post_api_prompts_by_id_versions_body_config_data_outputs_item_json_schema import (
-    PostApiPromptsByIdVersionsBodyConfigDataOutputsItemJsonSchema,
-)
-from .post_api_prompts_by_id_versions_body_config_data_outputs_item_type import (
-    PostApiPromptsByIdVersionsBodyConfigDataOutputsItemType,
-)
-from .post_api_prompts_by_id_versions_body_config_data_prompting_technique import (
-    PostApiPromptsByIdVersionsBodyConfigDataPromptingTechnique,
-)
-from .post_api_prompts_by_id_versions_response_200 import PostApiPromptsByIdVersionsResponse200
-from .post_api_prompts_by_id_versions_response_200_config_data import PostApiPromptsByIdVersionsResponse200ConfigData
-from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrations,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItem,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item_type import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItemType,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations_rows_item import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsRowsItem,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_inputs_item import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataInputsItem,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_inputs_item_type import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataInputsItemType,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_messages_item import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataMessagesItem,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_messages_item_role import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataMessagesItemRole,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_outputs_item import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItem,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_outputs_item_json_schema import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItemJsonSchema,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_outputs_item_type import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItemType,
-)
-from .post_api_prompts_by_id_versions_response_200_config_data_prompting_technique import (
-    PostApiPromptsByIdVersionsResponse200ConfigDataPromptingTechnique,
-)
-from .post_api_prompts_by_id_versions_response_400 import PostApiPromptsByIdVersionsResponse400
-from .post_api_prompts_by_id_versions_response_400_error import PostApiPromptsByIdVersionsResponse400Error
-from .post_api_prompts_by_id_versions_response_401 import PostApiPromptsByIdVersionsResponse401
-from .post_api_prompts_by_id_versions_response_401_error import PostApiPromptsByIdVersionsResponse401Error
-from .post_api_prompts_by_id_versions_response_404 import PostApiPromptsByIdVersionsResponse404
-from .post_api_prompts_by_id_versions_response_500 import PostApiPromptsByIdVersionsResponse500
-from .post_api_prompts_response_200 import PostApiPromptsResponse200
-from .post_api_prompts_response_200_messages_item import PostApiPromptsResponse200MessagesItem
-from .post_api_prompts_response_200_messages_item_role import PostApiPromptsResponse200MessagesItemRole
-from .post_api_prompts_response_200_response_format_type_0 import PostApiPromptsResponse200ResponseFormatType0
-from .post_api_prompts_response_200_response_format_type_0_json_schema import (
-    PostApiPromptsResponse200ResponseFormatType0JsonSchema,
-)
-from .post_api_prompts_response_200_response_format_type_0_json_schema_schema import (
-    PostApiPromptsResponse200ResponseFormatType0JsonSchemaSchema,
-)
-from .post_api_prompts_response_200_response_format_type_0_type import PostApiPromptsResponse200ResponseFormatType0Type
-from .post_api_prompts_response_400 import PostApiPromptsResponse400
-from .post_api_prompts_response_400_error import PostApiPromptsResponse400Error
-from .post_api_prompts_response_401 import PostApiPromptsResponse401
-from .post_api_prompts_response_401_error import PostApiPromptsResponse401Error
-from .post_api_prompts_response_500 import PostApiPromptsResponse500
-from .post_api_scenario_events_body_type_0 import PostApiScenarioEventsBodyType0
-from .post_api_scenario_events_body_type_0_metadata import PostApiScenarioEventsBodyType0Metadata
-from .post_api_scenario_events_body_type_1 import PostApiScenarioEventsBodyType1
-from .post_api_scenario_events_body_type_1_results_type_0 import PostApiScenarioEventsBodyType1ResultsType0
-from .post_api_scenario_events_body_type_1_results_type_0_verdict import (
-    PostApiScenarioEventsBodyType1ResultsType0Verdict,
-)
-from .post_api_scenario_events_body_type_1_status import PostApiScenarioEventsBodyType1Status
-from .post_api_scenario_events_body_type_2 import PostApiScenarioEventsBodyType2
-from .post_api_scenario_events_body_type_2_messages_item_type_0 import PostApiScenarioEventsBodyType2MessagesItemType0
-from .post_api_scenario_events_body_type_2_messages_item_type_1 import PostApiScenarioEventsBodyType2MessagesItemType1
-from .post_api_scenario_events_body_type_2_messages_item_type_2 import PostApiScenarioEventsBodyType2MessagesItemType2
-from .post_api_scenario_events_body_type_2_messages_item_type_2_tool_calls_item import (
-    PostApiScenarioEventsBodyType2MessagesItemType2ToolCallsItem,
-)
-from .post_api_scenario_events_body_type_2_messages_item_type_2_tool_calls_item_function import (
-    PostApiScenarioEventsBodyType2MessagesItemType2ToolCallsItemFunction,
-)
-from .post_api_scenario_events_body_type_2_messages_item_type_3 import PostApiScenarioEventsBodyType2MessagesItemType3
-from .post_api_scenario_events_body_type_2_messages_item_type_4 import PostApiScenarioEventsBodyType2MessagesItemType4
-from .post_api_scenario_events_response_201 import PostApiScenarioEventsResponse201
-from .post_api_scenario_events_response_400 import PostApiScenarioEventsResponse400
-from .post_api_scenario_events_response_401 import PostApiScenarioEventsResponse401
-from .post_api_scenario_events_response_500 import PostApiScenarioEventsResponse500
-from .post_api_trace_id_share_response_200 import PostApiTraceIdShareResponse200
-from .post_api_trace_id_unshare_response_200 import PostApiTraceIdUnshareResponse200
-from .put_api_prompts_by_id_body import PutApiPromptsByIdBody
-from .put_api_prompts_by_id_response_200 import PutApiPromptsByIdResponse200
-from .put_api_prompts_by_id_response_400 import PutApiPromptsByIdResponse400
-from .put_api_prompts_by_id_response_400_error import PutApiPromptsByIdResponse400Error
-from .put_api_prompts_by_id_response_401 import PutApiPromptsByIdResponse401
-from .put_api_prompts_by_id_response_401_error import PutApiPromptsByIdResponse401Error
-from .put_api_prompts_by_id_response_404 import PutApiPromptsByIdResponse404
-from .put_api_prompts_by_id_response_500 import PutApiPromptsByIdResponse500
-from .search_request import SearchRequest
-from .search_request_filters import SearchRequestFilters
-from .search_response import SearchResponse
-from .timestamps import Timestamps
-from .trace import Trace
+# Models are imported lazily, on first access, see scripts/make_models_init_lazy.py
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .annotation import Annotation
+    from .dataset_post_entries import DatasetPostEntries
+    from .dataset_post_entries_entries_item import DatasetPostEntriesEntriesItem
+    from .delete_api_annotations_id_response_200 import DeleteApiAnnotationsIdResponse200
+    from .delete_api_prompts_by_id_response_200 import DeleteApiPromptsByIdResponse200
+    from .delete_api_prompts_by_id_response_400 import DeleteApiPromptsByIdResponse400
+    from .delete_api_prompts_by_id_response_400_error import DeleteApiPromptsByIdResponse400Error
+    from .delete_api_prompts_by_id_response_401 import DeleteApiPromptsByIdResponse401
+    from .delete_api_prompts_by_id_response_401_error import DeleteApiPromptsByIdResponse401Error
+    from .delete_api_prompts_by_id_response_404 import DeleteApiPromptsByIdResponse404
+    from .delete_api_prompts_by_id_response_500 import DeleteApiPromptsByIdResponse500
+    from .delete_api_scenario_events_response_200 import DeleteApiScenarioEventsResponse200
+    from .delete_api_scenario_events_response_400 import DeleteApiScenarioEventsResponse400
+    from .delete_api_scenario_events_response_401 import DeleteApiScenarioEventsResponse401
+    from .delete_api_scenario_events_response_500 import DeleteApiScenarioEventsResponse500
+    from .error import Error
+    from .evaluation import Evaluation
+    from .evaluation_timestamps import EvaluationTimestamps
+    from .get_api_dataset_by_slug_or_id_response_200 import GetApiDatasetBySlugOrIdResponse200
+    from .get_api_dataset_by_slug_or_id_response_200_data_item import GetApiDatasetBySlugOrIdResponse200DataItem
+    from .get_api_dataset_by_slug_or_id_response_200_data_item_entry import GetApiDatasetBySlugOrIdResponse200DataItemEntry
+    from .get_api_dataset_by_slug_or_id_response_400 import GetApiDatasetBySlugOrIdResponse400
+    from .get_api_dataset_by_slug_or_id_response_401 import GetApiDatasetBySlugOrIdResponse401
+    from .get_api_dataset_by_slug_or_id_response_404 import GetApiDatasetBySlugOrIdResponse404
+    from .get_api_dataset_by_slug_or_id_response_422 import GetApiDatasetBySlugOrIdResponse422
+    from .get_api_dataset_by_slug_or_id_response_500 import GetApiDatasetBySlugOrIdResponse500
+    from .get_api_prompts_by_id_response_200 import GetApiPromptsByIdResponse200
+    from .get_api_prompts_by_id_response_200_messages_item import GetApiPromptsByIdResponse200MessagesItem
+    from .get_api_prompts_by_id_response_200_messages_item_role import GetApiPromptsByIdResponse200MessagesItemRole
+    from .get_api_prompts_by_id_response_200_response_format_type_0 import GetApiPromptsByIdResponse200ResponseFormatType0
+    from .get_api_prompts_by_id_response_200_response_format_type_0_json_schema import GetApiPromptsByIdResponse200ResponseFormatType0JsonSchema
+    from .get_api_prompts_by_id_response_200_response_format_type_0_json_schema_schema import GetApiPromptsByIdResponse200ResponseFormatType0JsonSchemaSchema
+    from .get_api_prompts_by_id_response_200_response_format_type_0_type import GetApiPromptsByIdResponse200ResponseFormatType0Type
+    from .get_api_prompts_by_id_response_400 import GetApiPromptsByIdResponse400
+    from .get_api_prompts_by_id_response_400_error import GetApiPromptsByIdResponse400Error
+    from .get_api_prompts_by_id_response_401 import GetApiPromptsByIdResponse401
+    from .get_api_prompts_by_id_response_401_error import GetApiPromptsByIdResponse401Error
+    from .get_api_prompts_by_id_response_404 import GetApiPromptsByIdResponse404
+    from .get_api_prompts_by_id_response_500 import GetApiPromptsByIdResponse500
+    from .get_api_prompts_by_id_versions_response_200 import GetApiPromptsByIdVersionsResponse200
+    from .get_api_prompts_by_id_versions_response_200_config_data import GetApiPromptsByIdVersionsResponse200ConfigData
+    from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations import GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrations
+    from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item import GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItem
+    from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item_type import GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItemType
+    from .get_api_prompts_by_id_versions_response_200_config_data_demonstrations_rows_item import GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsRowsItem
+    from .get_api_prompts_by_id_versions_response_200_config_data_inputs_item import GetApiPromptsByIdVersionsResponse200ConfigDataInputsItem
+    from .get_api_prompts_by_id_versions_response_200_config_data_inputs_item_type import GetApiPromptsByIdVersionsResponse200ConfigDataInputsItemType
+    from .get_api_prompts_by_id_versions_response_200_config_data_messages_item import GetApiPromptsByIdVersionsResponse200ConfigDataMessagesItem
+    from .get_api_prompts_by_id_versions_response_200_config_data_messages_item_role import GetApiPromptsByIdVersionsResponse200ConfigDataMessagesItemRole
+    from .get_api_prompts_by_id_versions_response_200_config_data_outputs_item import GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItem
+    from .get_api_prompts_by_id_versions_response_200_config_data_outputs_item_json_schema import GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItemJsonSchema
+    from .get_api_prompts_by_id_versions_response_200_config_data_outputs_item_type import GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItemType
+    from .get_api_prompts_by_id_versions_response_200_config_data_prompting_technique import GetApiPromptsByIdVersionsResponse200ConfigDataPromptingTechnique
+    from .get_api_prompts_by_id_versions_response_400 import GetApiPromptsByIdVersionsResponse400
+    from .get_api_prompts_by_id_versions_response_400_error import GetApiPromptsByIdVersionsResponse400Error
+    from .get_api_prompts_by_id_versions_response_401 import GetApiPromptsByIdVersionsResponse401
+    from .get_api_prompts_by_id_versions_response_401_error import GetApiPromptsByIdVersionsResponse401Error
+    from .get_api_prompts_by_id_versions_response_404 import GetApiPromptsByIdVersionsResponse404
+    from .get_api_prompts_by_id_versions_response_500 import GetApiPromptsByIdVersionsResponse500
+    from .get_api_prompts_response_200_item import GetApiPromptsResponse200Item
+    from .get_api_prompts_response_200_item_messages_item import GetApiPromptsResponse200ItemMessagesItem
+    from .get_api_prompts_response_200_item_messages_item_role import GetApiPromptsResponse200ItemMessagesItemRole
+    from .get_api_prompts_response_200_item_response_format_type_0 import GetApiPromptsResponse200ItemResponseFormatType0
+    from .get_api_prompts_response_200_item_response_format_type_0_json_schema import GetApiPromptsResponse200ItemResponseFormatType0JsonSchema
+    from .get_api_prompts_response_200_item_response_format_type_0_json_schema_schema import GetApiPromptsResponse200ItemResponseFormatType0JsonSchemaSchema
+    from .get_api_prompts_response_200_item_response_format_type_0_type import GetApiPromptsResponse200ItemResponseFormatType0Type
+    from .get_api_prompts_response_400 import GetApiPromptsResponse400
+    from .get_api_prompts_response_400_error import GetApiPromptsResponse400Error
+    from .get_api_prompts_response_401 import GetApiPromptsResponse401
+    from .get_api_prompts_response_401_error import GetApiPromptsResponse401Error
+    from .get_api_prompts_response_500 import GetApiPromptsResponse500
+    from .get_api_trace_id_response_200 import GetApiTraceIdResponse200
+    from .get_api_trace_id_response_200_error_type_0 import GetApiTraceIdResponse200ErrorType0
+    from .get_api_trace_id_response_200_evaluations_item import GetApiTraceIdResponse200EvaluationsItem
+    from .get_api_trace_id_response_200_evaluations_item_error import GetApiTraceIdResponse200EvaluationsItemError
+    from .get_api_trace_id_response_200_evaluations_item_timestamps import GetApiTraceIdResponse200EvaluationsItemTimestamps
+    from .get_api_trace_id_response_200_input import GetApiTraceIdResponse200Input
+    from .get_api_trace_id_response_200_metadata import GetApiTraceIdResponse200Metadata
+    from .get_api_trace_id_response_200_metrics import GetApiTraceIdResponse200Metrics
+    from .get_api_trace_id_response_200_output import GetApiTraceIdResponse200Output
+    from .get_api_trace_id_response_200_spans_item import GetApiTraceIdResponse200SpansItem
+    from .get_api_trace_id_response_200_spans_item_error_type_0 import GetApiTraceIdResponse200SpansItemErrorType0
+    from .get_api_trace_id_response_200_spans_item_input import GetApiTraceIdResponse200SpansItemInput
+    from .get_api_trace_id_response_200_spans_item_input_value_item import GetApiTraceIdResponse200SpansItemInputValueItem
+    from .get_api_trace_id_response_200_spans_item_metrics import GetApiTraceIdResponse200SpansItemMetrics
+    from .get_api_trace_id_response_200_spans_item_output import GetApiTraceIdResponse200SpansItemOutput
+    from .get_api_trace_id_response_200_spans_item_output_value_item import GetApiTraceIdResponse200SpansItemOutputValueItem
+    from .get_api_trace_id_response_200_spans_item_params import GetApiTraceIdResponse200SpansItemParams
+    from .get_api_trace_id_response_200_spans_item_timestamps import GetApiTraceIdResponse200SpansItemTimestamps
+    from .get_api_trace_id_response_200_timestamps import GetApiTraceIdResponse200Timestamps
+    from .input_ import Input
+    from .metadata import Metadata
+    from .metrics import Metrics
+    from .output import Output
+    from .pagination import Pagination
+    from .patch_api_annotations_id_body import PatchApiAnnotationsIdBody
+    from .patch_api_annotations_id_response_200 import PatchApiAnnotationsIdResponse200
+    from .post_api_annotations_trace_id_body import PostApiAnnotationsTraceIdBody
+    from .post_api_prompts_body import PostApiPromptsBody
+    from .post_api_prompts_by_id_versions_body import PostApiPromptsByIdVersionsBody
+    from .post_api_prompts_by_id_versions_body_config_data import PostApiPromptsByIdVersionsBodyConfigData
+    from .post_api_prompts_by_id_versions_body_config_data_demonstrations import PostApiPromptsByIdVersionsBodyConfigDataDemonstrations
+    from .post_api_prompts_by_id_versions_body_config_data_demonstrations_columns_item import PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsColumnsItem
+    from .post_api_prompts_by_id_versions_body_config_data_demonstrations_columns_item_type import PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsColumnsItemType
+    from .post_api_prompts_by_id_versions_body_config_data_demonstrations_rows_item import PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsRowsItem
+    from .post_api_prompts_by_id_versions_body_config_data_inputs_item import PostApiPromptsByIdVersionsBodyConfigDataInputsItem
+    from .post_api_prompts_by_id_versions_body_config_data_inputs_item_type import PostApiPromptsByIdVersionsBodyConfigDataInputsItemType
+    from .post_api_prompts_by_id_versions_body_config_data_messages_item import PostApiPromptsByIdVersionsBodyConfigDataMessagesItem
+    from .post_api_prompts_by_id_versions_body_config_data_messages_item_role import PostApiPromptsByIdVersionsBodyConfigDataMessagesItemRole
+    from .post_api_prompts_by_id_versions_body_config_data_outputs_item import PostApiPromptsByIdVersionsBodyConfigDataOutputsItem
+    from .post_api_prompts_by_id_versions_body_config_data_outputs_item_json_schema import PostApiPromptsByIdVersionsBodyConfigDataOutputsItemJsonSchema
+    from .post_api_prompts_by_id_versions_body_config_data_outputs_item_type import PostApiPromptsByIdVersionsBodyConfigDataOutputsItemType
+    from .post_api_prompts_by_id_versions_body_config_data_prompting_technique import PostApiPromptsByIdVersionsBodyConfigDataPromptingTechnique
+    from .post_api_prompts_by_id_versions_response_200 import PostApiPromptsByIdVersionsResponse200
+    from .post_api_prompts_by_id_versions_response_200_config_data import PostApiPromptsByIdVersionsResponse200ConfigData
+    from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations import PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrations
+    from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item import PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItem
+    from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item_type import PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItemType
+    from .post_api_prompts_by_id_versions_response_200_config_data_demonstrations_rows_item import PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsRowsItem
+    from .post_api_prompts_by_id_versions_response_200_config_data_inputs_item import PostApiPromptsByIdVersionsResponse200ConfigDataInputsItem
+    from .post_api_prompts_by_id_versions_response_200_config_data_inputs_item_type import PostApiPromptsByIdVersionsResponse200ConfigDataInputsItemType
+    from .post_api_prompts_by_id_versions_response_200_config_data_messages_item import PostApiPromptsByIdVersionsResponse200ConfigDataMessagesItem
+    from .post_api_prompts_by_id_versions_response_200_config_data_messages_item_role import PostApiPromptsByIdVersionsResponse200ConfigDataMessagesItemRole
+    from .post_api_prompts_by_id_versions_response_200_config_data_outputs_item import PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItem
+    from .post_api_prompts_by_id_versions_response_200_config_data_outputs_item_json_schema import PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItemJsonSchema
+    from .post_api_prompts_by_id_versions_response_200_config_data_outputs_item_type import PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItemType
+    from .post_api_prompts_by_id_versions_response_200_config_data_prompting_technique import PostApiPromptsByIdVersionsResponse200ConfigDataPromptingTechnique
+    from .post_api_prompts_by_id_versions_response_400 import PostApiPromptsByIdVersionsResponse400
+    from .post_api_prompts_by_id_versions_response_400_error import PostApiPromptsByIdVersionsResponse400Error
+    from .post_api_prompts_by_id_versions_response_401 import PostApiPromptsByIdVersionsResponse401
+    from .post_api_prompts_by_id_versions_response_401_error import PostApiPromptsByIdVersionsResponse401Error
+    from .post_api_prompts_by_id_versions_response_404 import PostApiPromptsByIdVersionsResponse404
+    from .post_api_prompts_by_id_versions_response_500 import PostApiPromptsByIdVersionsResponse500
+    from .post_api_prompts_response_200 import PostApiPromptsResponse200
+    from .post_api_prompts_response_200_messages_item import PostApiPromptsResponse200MessagesItem
+    from .post_api_prompts_response_200_messages_item_role import PostApiPromptsResponse200MessagesItemRole
+    from .post_api_prompts_response_200_response_format_type_0 import PostApiPromptsResponse200ResponseFormatType0
+    from .post_api_prompts_response_200_response_format_type_0_json_schema import PostApiPromptsResponse200ResponseFormatType0JsonSchema
+    from .post_api_prompts_response_200_response_format_type_0_json_schema_schema import PostApiPromptsResponse200ResponseFormatType0JsonSchemaSchema
+    from .post_api_prompts_response_200_response_format_type_0_type import PostApiPromptsResponse200ResponseFormatType0Type
+    from .post_api_prompts_response_400 import PostApiPromptsResponse400
+    from .post_api_prompts_response_400_error import PostApiPromptsResponse400Error
+    from .post_api_prompts_response_401 import PostApiPromptsResponse401
+    from .post_api_prompts_response_401_error import PostApiPromptsResponse401Error
+    from .post_api_prompts_response_500 import PostApiPromptsResponse500
+    from .post_api_scenario_events_body_type_0 import PostApiScenarioEventsBodyType0
+    from .post_api_scenario_events_body_type_0_metadata import PostApiScenarioEventsBodyType0Metadata
+    from .post_api_scenario_events_body_type_1 import PostApiScenarioEventsBodyType1
+    from .post_api_scenario_events_body_type_1_results_type_0 import PostApiScenarioEventsBodyType1ResultsType0
+    from .post_api_scenario_events_body_type_1_results_type_0_verdict import PostApiScenarioEventsBodyType1ResultsType0Verdict
+    from .post_api_scenario_events_body_type_1_status import PostApiScenarioEventsBodyType1Status
+    from .post_api_scenario_events_body_type_2 import PostApiScenarioEventsBodyType2
+    from .post_api_scenario_events_body_type_2_messages_item_type_0 import PostApiScenarioEventsBodyType2MessagesItemType0
+    from .post_api_scenario_events_body_type_2_messages_item_type_1 import PostApiScenarioEventsBodyType2MessagesItemType1
+    from .post_api_scenario_events_body_type_2_messages_item_type_2 import PostApiScenarioEventsBodyType2MessagesItemType2
+    from .post_api_scenario_events_body_type_2_messages_item_type_2_tool_calls_item import PostApiScenarioEventsBodyType2MessagesItemType2ToolCallsItem
+    from .post_api_scenario_events_body_type_2_messages_item_type_2_tool_calls_item_function import PostApiScenarioEventsBodyType2MessagesItemType2ToolCallsItemFunction
+    from .post_api_scenario_events_body_type_2_messages_item_type_3 import PostApiScenarioEventsBodyType2MessagesItemType3
+    from .post_api_scenario_events_body_type_2_messages_item_type_4 import PostApiScenarioEventsBodyType2MessagesItemType4
+    from .post_api_scenario_events_response_201 import PostApiScenarioEventsResponse201
+    from .post_api_scenario_events_response_400 import PostApiScenarioEventsResponse400
+    from .post_api_scenario_events_response_401 import PostApiScenarioEventsResponse401
+    from .post_api_scenario_events_response_500 import PostApiScenarioEventsResponse500
+    from .post_api_trace_id_share_response_200 import PostApiTraceIdShareResponse200
+    from .post_api_trace_id_unshare_response_200 import PostApiTraceIdUnshareResponse200
+    from .put_api_prompts_by_id_body import PutApiPromptsByIdBody
+    from .put_api_prompts_by_id_response_200 import PutApiPromptsByIdResponse200
+    from .put_api_prompts_by_id_response_400 import PutApiPromptsByIdResponse400
+    from .put_api_prompts_by_id_response_400_error import PutApiPromptsByIdResponse400Error
+    from .put_api_prompts_by_id_response_401 import PutApiPromptsByIdResponse401
+    from .put_api_prompts_by_id_response_401_error import PutApiPromptsByIdResponse401Error
+    from .put_api_prompts_by_id_response_404 import PutApiPromptsByIdResponse404
+    from .put_api_prompts_by_id_response_500 import PutApiPromptsByIdResponse500
+    from .search_request import SearchRequest
+    from .search_request_filters import SearchRequestFilters
+    from .search_response import SearchResponse
+    from .timestamps import Timestamps
+    from .trace import Trace
+
+_MODEL_MODULES = {
+    "Annotation": ".annotation",
+    "DatasetPostEntries": ".dataset_post_entries",
+    "DatasetPostEntriesEntriesItem": ".dataset_post_entries_entries_item",
+    "DeleteApiAnnotationsIdResponse200": ".delete_api_annotations_id_response_200",
+    "DeleteApiPromptsByIdResponse200": ".delete_api_prompts_by_id_response_200",
+    "DeleteApiPromptsByIdResponse400": ".delete_api_prompts_by_id_response_400",
+    "DeleteApiPromptsByIdResponse400Error": ".delete_api_prompts_by_id_response_400_error",
+    "DeleteApiPromptsByIdResponse401": ".delete_api_prompts_by_id_response_401",
+    "DeleteApiPromptsByIdResponse401Error": ".delete_api_prompts_by_id_response_401_error",
+    "DeleteApiPromptsByIdResponse404": ".delete_api_prompts_by_id_response_404",
+    "DeleteApiPromptsByIdResponse500": ".delete_api_prompts_by_id_response_500",
+    "DeleteApiScenarioEventsResponse200": ".delete_api_scenario_events_response_200",
+    "DeleteApiScenarioEventsResponse400": ".delete_api_scenario_events_response_400",
+    "DeleteApiScenarioEventsResponse401": ".delete_api_scenario_events_response_401",
+    "DeleteApiScenarioEventsResponse500": ".delete_api_scenario_events_response_500",
+    "Error": ".error",
+    "Evaluation": ".evaluation",
+    "EvaluationTimestamps": ".evaluation_timestamps",
+    "GetApiDatasetBySlugOrIdResponse200": ".get_api_dataset_by_slug_or_id_response_200",
+    "GetApiDatasetBySlugOrIdResponse200DataItem": ".get_api_dataset_by_slug_or_id_response_200_data_item",
+    "GetApiDatasetBySlugOrIdResponse200DataItemEntry": ".get_api_dataset_by_slug_or_id_response_200_data_item_entry",
+    "GetApiDatasetBySlugOrIdResponse400": ".get_api_dataset_by_slug_or_id_response_400",
+    "GetApiDatasetBySlugOrIdResponse401": ".get_api_dataset_by_slug_or_id_response_401",
+    "GetApiDatasetBySlugOrIdResponse404": ".get_api_dataset_by_slug_or_id_response_404",
+    "GetApiDatasetBySlugOrIdResponse422": ".get_api_dataset_by_slug_or_id_response_422",
+    "GetApiDatasetBySlugOrIdResponse500": ".get_api_dataset_by_slug_or_id_response_500",
+    "GetApiPromptsByIdResponse200": ".get_api_prompts_by_id_response_200",
+    "GetApiPromptsByIdResponse200MessagesItem": ".get_api_prompts_by_id_response_200_messages_item",
+    "GetApiPromptsByIdResponse200MessagesItemRole": ".get_api_prompts_by_id_response_200_messages_item_role",
+    "GetApiPromptsByIdResponse200ResponseFormatType0": ".get_api_prompts_by_id_response_200_response_format_type_0",
+    "GetApiPromptsByIdResponse200ResponseFormatType0JsonSchema": ".get_api_prompts_by_id_response_200_response_format_type_0_json_schema",
+    "GetApiPromptsByIdResponse200ResponseFormatType0JsonSchemaSchema": ".get_api_prompts_by_id_response_200_response_format_type_0_json_schema_schema",
+    "GetApiPromptsByIdResponse200ResponseFormatType0Type": ".get_api_prompts_by_id_response_200_response_format_type_0_type",
+    "GetApiPromptsByIdResponse400": ".get_api_prompts_by_id_response_400",
+    "GetApiPromptsByIdResponse400Error": ".get_api_prompts_by_id_response_400_error",
+    "GetApiPromptsByIdResponse401": ".get_api_prompts_by_id_response_401",
+    "GetApiPromptsByIdResponse401Error": ".get_api_prompts_by_id_response_401_error",
+    "GetApiPromptsByIdResponse404": ".get_api_prompts_by_id_response_404",
+    "GetApiPromptsByIdResponse500": ".get_api_prompts_by_id_response_500",
+    "GetApiPromptsByIdVersionsResponse200": ".get_api_prompts_by_id_versions_response_200",
+    "GetApiPromptsByIdVersionsResponse200ConfigData": ".get_api_prompts_by_id_versions_response_200_config_data",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrations": ".get_api_prompts_by_id_versions_response_200_config_data_demonstrations",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItem": ".get_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItemType": ".get_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item_type",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsRowsItem": ".get_api_prompts_by_id_versions_response_200_config_data_demonstrations_rows_item",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataInputsItem": ".get_api_prompts_by_id_versions_response_200_config_data_inputs_item",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataInputsItemType": ".get_api_prompts_by_id_versions_response_200_config_data_inputs_item_type",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataMessagesItem": ".get_api_prompts_by_id_versions_response_200_config_data_messages_item",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataMessagesItemRole": ".get_api_prompts_by_id_versions_response_200_config_data_messages_item_role",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItem": ".get_api_prompts_by_id_versions_response_200_config_data_outputs_item",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItemJsonSchema": ".get_api_prompts_by_id_versions_response_200_config_data_outputs_item_json_schema",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataOutputsItemType": ".get_api_prompts_by_id_versions_response_200_config_data_outputs_item_type",
+    "GetApiPromptsByIdVersionsResponse200ConfigDataPromptingTechnique": ".get_api_prompts_by_id_versions_response_200_config_data_prompting_technique",
+    "GetApiPromptsByIdVersionsResponse400": ".get_api_prompts_by_id_versions_response_400",
+    "GetApiPromptsByIdVersionsResponse400Error": ".get_api_prompts_by_id_versions_response_400_error",
+    "GetApiPromptsByIdVersionsResponse401": ".get_api_prompts_by_id_versions_response_401",
+    "GetApiPromptsByIdVersionsResponse401Error": ".get_api_prompts_by_id_versions_response_401_error",
+    "GetApiPromptsByIdVersionsResponse404": ".get_api_prompts_by_id_versions_response_404",
+    "GetApiPromptsByIdVersionsResponse500": ".get_api_prompts_by_id_versions_response_500",
+    "GetApiPromptsResponse200Item": ".get_api_prompts_response_200_item",
+    "GetApiPromptsResponse200ItemMessagesItem": ".get_api_prompts_response_200_item_messages_item",
+    "GetApiPromptsResponse200ItemMessagesItemRole": ".get_api_prompts_response_200_item_messages_item_role",
+    "GetApiPromptsResponse200ItemResponseFormatType0": ".get_api_prompts_response_200_item_response_format_type_0",
+    "GetApiPromptsResponse200ItemResponseFormatType0JsonSchema": ".get_api_prompts_response_200_item_response_format_type_0_json_schema",
+    "GetApiPromptsResponse200ItemResponseFormatType0JsonSchemaSchema": ".get_api_prompts_response_200_item_response_format_type_0_json_schema_schema",
+    "GetApiPromptsResponse200ItemResponseFormatType0Type": ".get_api_prompts_response_200_item_response_format_type_0_type",
+    "GetApiPromptsResponse400": ".get_api_prompts_response_400",
+    "GetApiPromptsResponse400Error": ".get_api_prompts_response_400_error",
+    "GetApiPromptsResponse401": ".get_api_prompts_response_401",
+    "GetApiPromptsResponse401Error": ".get_api_prompts_response_401_error",
+    "GetApiPromptsResponse500": ".get_api_prompts_response_500",
+    "GetApiTraceIdResponse200": ".get_api_trace_id_response_200",
+    "GetApiTraceIdResponse200ErrorType0": ".get_api_trace_id_response_200_error_type_0",
+    "GetApiTraceIdResponse200EvaluationsItem": ".get_api_trace_id_response_200_evaluations_item",
+    "GetApiTraceIdResponse200EvaluationsItemError": ".get_api_trace_id_response_200_evaluations_item_error",
+    "GetApiTraceIdResponse200EvaluationsItemTimestamps": ".get_api_trace_id_response_200_evaluations_item_timestamps",
+    "GetApiTraceIdResponse200Input": ".get_api_trace_id_response_200_input",
+    "GetApiTraceIdResponse200Metadata": ".get_api_trace_id_response_200_metadata",
+    "GetApiTraceIdResponse200Metrics": ".get_api_trace_id_response_200_metrics",
+    "GetApiTraceIdResponse200Output": ".get_api_trace_id_response_200_output",
+    "GetApiTraceIdResponse200SpansItem": ".get_api_trace_id_response_200_spans_item",
+    "GetApiTraceIdResponse200SpansItemErrorType0": ".get_api_trace_id_response_200_spans_item_error_type_0",
+    "GetApiTraceIdResponse200SpansItemInput": ".get_api_trace_id_response_200_spans_item_input",
+    "GetApiTraceIdResponse200SpansItemInputValueItem": ".get_api_trace_id_response_200_spans_item_input_value_item",
+    "GetApiTraceIdResponse200SpansItemMetrics": ".get_api_trace_id_response_200_spans_item_metrics",
+    "GetApiTraceIdResponse200SpansItemOutput": ".get_api_trace_id_response_200_spans_item_output",
+    "GetApiTraceIdResponse200SpansItemOutputValueItem": ".get_api_trace_id_response_200_spans_item_output_value_item",
+    "GetApiTraceIdResponse200SpansItemParams": ".get_api_trace_id_response_200_spans_item_params",
+    "GetApiTraceIdResponse200SpansItemTimestamps": ".get_api_trace_id_response_200_spans_item_timestamps",
+    "GetApiTraceIdResponse200Timestamps": ".get_api_trace_id_response_200_timestamps",
+    "Input": ".input_",
+    "Metadata": ".metadata",
+    "Metrics": ".metrics",
+    "Output": ".output",
+    "Pagination": ".pagination",
+    "PatchApiAnnotationsIdBody": ".patch_api_annotations_id_body",
+    "PatchApiAnnotationsIdResponse200": ".patch_api_annotations_id_response_200",
+    "PostApiAnnotationsTraceIdBody": ".post_api_annotations_trace_id_body",
+    "PostApiPromptsBody": ".post_api_prompts_body",
+    "PostApiPromptsByIdVersionsBody": ".post_api_prompts_by_id_versions_body",
+    "PostApiPromptsByIdVersionsBodyConfigData": ".post_api_prompts_by_id_versions_body_config_data",
+    "PostApiPromptsByIdVersionsBodyConfigDataDemonstrations": ".post_api_prompts_by_id_versions_body_config_data_demonstrations",
+    "PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsColumnsItem": ".post_api_prompts_by_id_versions_body_config_data_demonstrations_columns_item",
+    "PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsColumnsItemType": ".post_api_prompts_by_id_versions_body_config_data_demonstrations_columns_item_type",
+    "PostApiPromptsByIdVersionsBodyConfigDataDemonstrationsRowsItem": ".post_api_prompts_by_id_versions_body_config_data_demonstrations_rows_item",
+    "PostApiPromptsByIdVersionsBodyConfigDataInputsItem": ".post_api_prompts_by_id_versions_body_config_data_inputs_item",
+    "PostApiPromptsByIdVersionsBodyConfigDataInputsItemType": ".post_api_prompts_by_id_versions_body_config_data_inputs_item_type",
+    "PostApiPromptsByIdVersionsBodyConfigDataMessagesItem": ".post_api_prompts_by_id_versions_body_config_data_messages_item",
+    "PostApiPromptsByIdVersionsBodyConfigDataMessagesItemRole": ".post_api_prompts_by_id_versions_body_config_data_messages_item_role",
+    "PostApiPromptsByIdVersionsBodyConfigDataOutputsItem": ".post_api_prompts_by_id_versions_body_config_data_outputs_item",
+    "PostApiPromptsByIdVersionsBodyConfigDataOutputsItemJsonSchema": ".post_api_prompts_by_id_versions_body_config_data_outputs_item_json_schema",
+    "PostApiPromptsByIdVersionsBodyConfigDataOutputsItemType": ".post_api_prompts_by_id_versions_body_config_data_outputs_item_type",
+    "PostApiPromptsByIdVersionsBodyConfigDataPromptingTechnique": ".post_api_prompts_by_id_versions_body_config_data_prompting_technique",
+    "PostApiPromptsByIdVersionsResponse200": ".post_api_prompts_by_id_versions_response_200",
+    "PostApiPromptsByIdVersionsResponse200ConfigData": ".post_api_prompts_by_id_versions_response_200_config_data",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrations": ".post_api_prompts_by_id_versions_response_200_config_data_demonstrations",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItem": ".post_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsColumnsItemType": ".post_api_prompts_by_id_versions_response_200_config_data_demonstrations_columns_item_type",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataDemonstrationsRowsItem": ".post_api_prompts_by_id_versions_response_200_config_data_demonstrations_rows_item",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataInputsItem": ".post_api_prompts_by_id_versions_response_200_config_data_inputs_item",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataInputsItemType": ".post_api_prompts_by_id_versions_response_200_config_data_inputs_item_type",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataMessagesItem": ".post_api_prompts_by_id_versions_response_200_config_data_messages_item",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataMessagesItemRole": ".post_api_prompts_by_id_versions_response_200_config_data_messages_item_role",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItem": ".post_api_prompts_by_id_versions_response_200_config_data_outputs_item",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItemJsonSchema": ".post_api_prompts_by_id_versions_response_200_config_data_outputs_item_json_schema",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataOutputsItemType": ".post_api_prompts_by_id_versions_response_200_config_data_outputs_item_type",
+    "PostApiPromptsByIdVersionsResponse200ConfigDataPromptingTechnique": ".post_api_prompts_by_id_versions_response_200_config_data_prompting_technique",
+    "PostApiPromptsByIdVersionsResponse400": ".post_api_prompts_by_id_versions_response_400",
+    "PostApiPromptsByIdVersionsResponse400Error": ".post_api_prompts_by_id_versions_response_400_error",
+    "PostApiPromptsByIdVersionsResponse401": ".post_api_prompts_by_id_versions_response_401",
+    "PostApiPromptsByIdVersionsResponse401Error": ".post_api_prompts_by_id_versions_response_401_error",
+    "PostApiPromptsByIdVersionsResponse404": ".post_api_prompts_by_id_versions_response_404",
+    "PostApiPromptsByIdVersionsResponse500": ".post_api_prompts_by_id_versions_response_500",
+    "PostApiPromptsResponse200": ".post_api_prompts_response_200",
+    "PostApiPromptsResponse200MessagesItem": ".post_api_prompts_response_200_messages_item",
+    "PostApiPromptsResponse200MessagesItemRole": ".post_api_prompts_response_200_messages_item_role",
+    "PostApiPromptsResponse200ResponseFormatType0": ".post_api_prompts_response_200_response_format_type_0",
+    "PostApiPromptsResponse200ResponseFormatType0JsonSchema": ".post_api_prompts_response_200_response_format_type_0_json_schema",
+    "PostApiPromptsResponse200ResponseFormatType0JsonSchemaSchema": ".post_api_prompts_response_200_response_format_type_0_json_schema_schema",
+    "PostApiPromptsResponse200ResponseFormatType0Type": ".post_api_prompts_response_200_response_format_type_0_type",
+    "PostApiPromptsResponse400": ".post_api_prompts_response_400",
+    "PostApiPromptsResponse400Error": ".post_api_prompts_response_400_error",
+    "PostApiPromptsResponse401": ".post_api_prompts_response_401",
+    "PostApiPromptsResponse401Error": ".post_api_prompts_response_401_error",
+    "PostApiPromptsResponse500": ".post_api_prompts_response_500",
+    "PostApiScenarioEventsBodyType0": ".post_api_scenario_events_body_type_0",
+    "PostApiScenarioEventsBodyType0Metadata": ".post_api_scenario_events_body_type_0_metadata",
+    "PostApiScenarioEventsBodyType1": ".post_api_scenario_events_body_type_1",
+    "PostApiScenarioEventsBodyType1ResultsType0": ".post_api_scenario_events_body_type_1_results_type_0",
+    "PostApiScenarioEventsBodyType1ResultsType0Verdict": ".post_api_scenario_events_body_type_1_results_type_0_verdict",
+    "PostApiScenarioEventsBodyType1Status": ".post_api_scenario_events_body_type_1_status",
+    "PostApiScenarioEventsBodyType2": ".post_api_scenario_events_body_type_2",
+    "PostApiScenarioEventsBodyType2MessagesItemType0": ".post_api_scenario_events_body_type_2_messages_item_type_0",
+    "PostApiScenarioEventsBodyType2MessagesItemType1": ".post_api_scenario_events_body_type_2_messages_item_type_1",
+    "PostApiScenarioEventsBodyType2MessagesItemType2": ".post_api_scenario_events_body_type_2_messages_item_type_2",
+    "PostApiScenarioEventsBodyType2MessagesItemType2ToolCallsItem": ".post_api_scenario_events_body_type_2_messages_item_type_2_tool_calls_item",
+    "PostApiScenarioEventsBodyType2MessagesItemType2ToolCallsItemFunction": ".post_api_scenario_events_body_type_2_messages_item_type_2_tool_calls_item_function",
+    "PostApiScenarioEventsBodyType2MessagesItemType3": ".post_api_scenario_events_body_type_2_messages_item_type_3",
+    "PostApiScenarioEventsBodyType2MessagesItemType4": ".post_api_scenario_events_body_type_2_messages_item_type_4",
+    "PostApiScenarioEventsResponse201": ".post_api_scenario_events_response_201",
+    "PostApiScenarioEventsResponse400": ".post_api_scenario_events_response_400",
+    "PostApiScenarioEventsResponse401": ".post_api_scenario_events_response_401",
+    "PostApiScenarioEventsResponse500": ".post_api_scenario_events_response_500",
+    "PostApiTraceIdShareResponse200": ".post_api_trace_id_share_response_200",
+    "PostApiTraceIdUnshareResponse200": ".post_api_trace_id_unshare_response_200",
+    "PutApiPromptsByIdBody": ".put_api_prompts_by_id_body",
+    "PutApiPromptsByIdResponse200": ".put_api_prompts_by_id_response_200",
+    "PutApiPromptsByIdResponse400": ".put_api_prompts_by_id_response_400",
+    "PutApiPromptsByIdResponse400Error": ".put_api_prompts_by_id_response_400_error",
+    "PutApiPromptsByIdResponse401": ".put_api_prompts_by_id_response_401",
+    "PutApiPromptsByIdResponse401Error": ".put_api_prompts_by_id_response_401_error",
+    "PutApiPromptsByIdResponse404": ".put_api_prompts_by_id_response_404",
+    "PutApiPromptsByIdResponse500": ".put_api_prompts_by_id_response_500",
+    "SearchRequest": ".search_request",
+    "SearchRequestFilters": ".search_request_filters",
+    "SearchResponse": ".search_response",
+    "Timestamps": ".timestamps",
+    "Trace": ".trace",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODEL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MODEL_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_MODEL_MODULES])
+
 
 __all__ = (
     "Annotation",
@@ -0,0 +1,176 @@
+"""
+Instrumentation of the agent calls made during scenario runs.
+
+While an agent is called, the litellm completions it makes are intercepted to
+collect their token usage, estimated cost and the time the first response came
+back, and the cached calls it serves from the scenario cache are counted. The
+executor turns what was collected into an AgentCallTiming per call, see
+`ScenarioResult.timings`.
+
+Usage is only collected for litellm completions. `litellm.completion` and
+`litellm.acompletion` are patched on the first agent call, see
+`install_usage_patches()`. Under pytest, the scenario plugin patches them as
+soon as litellm is imported, so agents doing `from litellm import acompletion`
+are covered too. Outside of pytest, such names are only covered if they are
+imported after the first scenario ran. Streaming responses are passed through
+without collecting their usage.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import threading
+import time
+import logging
+from typing import Any, Callable, Iterator, Optional
+
+
+logger = logging.getLogger("scenario")
+
+
+class AgentCallRecorder:
+    """
+    Accumulates the LLM usage of a single agent call.
+
+    Attributes:
+        started_at: perf_counter() timestamp of the start of the call
+        first_response_at: perf_counter() timestamp of the first LLM response
+        llm_calls: Number of LLM completions made
+        prompt_tokens: Prompt tokens used by the completions
+        completion_tokens: Completion tokens used by the completions
+        cost: Estimated cost of the completions in USD, from litellm's model prices
+        cache_hits: Number of calls served from the scenario cache
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_response_at: Optional[float] = None
+        self.llm_calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+        self.cache_hits = 0
+        # Completions can come from concurrent tasks or threads of the agent
+        self._lock = threading.Lock()
+
+    @property
+    def time_to_first_response(self) -> Optional[float]:
+        """Time in seconds from the start of the call to the first complete LLM response"""
+        if self.first_response_at is None:
+            return None
+        return self.first_response_at - self.started_at
+
+    def record_response(self, response: Any) -> None:
+        """Record the usage of a completion response"""
+        responded_at = time.perf_counter()
+        usage = getattr(response, "usage", None)
+        cost = _completion_cost(response)
+
+        with self._lock:
+            if self.first_response_at is None:
+                self.first_response_at = responded_at
+            self.llm_calls += 1
+            self.cost += cost
+            if usage is not None:
+                self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+                self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+    def record_cache_hit(self) -> None:
+        """Record a call served from the scenario cache"""
+        with self._lock:
+            self.cache_hits += 1
+
+
+def _completion_cost(response: Any) -> float:
+    from litellm.cost_calculator import completion_cost
+
+    try:
+        return completion_cost(completion_response=response) or 0.0
+    except Exception as e:
+        # e.g. a model litellm has no prices for
+        logger.debug(f"Could not estimate the cost of a completion: {repr(e)}")
+        return 0.0
+
+
+current_agent_call: ContextVar[Optional[AgentCallRecorder]] = ContextVar(
+    "scenario_agent_call", default=None
+)
+
+
+@contextmanager
+def record_agent_call() -> Iterator[AgentCallRecorder]:
+    """
+    Collect the LLM usage of the agent call made within the block.
+
+    Yields:
+        The recorder the usage is collected into
+    """
+    install_usage_patches()
+
+    recorder = AgentCallRecorder()
+    token = current_agent_call.set(recorder)
+    try:
+        yield recorder
+    finally:
+        current_agent_call.reset(token)
+
+
+def record_cache_hit() -> None:
+    """Count a call served from the scenario cache towards the current agent call"""
+    recorder = current_agent_call.get()
+    if recorder is not None:
+        recorder.record_cache_hit()
+
+
+def _patch_sync(original: Callable) -> Callable:
+    @functools.wraps(original)
+    def patched(*args, **kwargs):
+        response = original(*args, **kwargs)
+        recorder = current_agent_call.get()
+        if recorder is not None and not kwargs.get("stream"):
+            recorder.record_response(response)
+        return response
+
+    patched._scenario_timings_original = original  # type: ignore
+    return patched
+
+
+def _patch_async(original: Callable) -> Callable:
+    @functools.wraps(original)
+    async def patched(*args, **kwargs):
+        response = await original(*args, **kwargs)
+        recorder = current_agent_call.get()
+        if recorder is not None and not kwargs.get("stream"):
+            recorder.record_response(response)
+        return response
+
+    patched._scenario_timings_original = original  # type: ignore
+    return patched
+
+
+_patches_lock = threading.Lock()
+_patches_installed = False
+
+
+def install_usage_patches() -> None:
+    """
+    Patch litellm to record the usage of its completions in the current agent
+    call. Completions made outside of an agent call are passed through
+    untouched. Safe to call multiple times.
+    """
+    global _patches_installed
+
+    if _patches_installed:
+        return
+
+    import litellm
+
+    with _patches_lock:
+        if _patches_installed:
+            return
+
+        litellm.completion = _patch_sync(litellm.completion)  # type: ignore
+        litellm.acompletion = _patch_async(litellm.acompletion)  # type: ignore
+
+        _patches_installed = True
+
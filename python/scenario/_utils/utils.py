@@ -11,6 +11,9 @@ import sys
 from typing import (
     Any,
     Iterator,
+    List,
+    Mapping,
+    Tuple,
     Optional,
     Union,
     TypeVar,
@@ -141,6 +144,56 @@ def safe_attr_or_key(obj: Any, attr_or_key: str, default: Any = None) -> Any:
     return getattr(obj, attr_or_key, getattr(obj, 'get', lambda x, default=None: default)(attr_or_key, default))
 
 
+def message_fingerprint(message: Mapping[str, Any]) -> List[Tuple[str, Any]]:
+    """
+    Take a fingerprint of a message, to later tell whether it changed in place.
+
+    The fingerprint holds the values of the message keys themselves, so
+    comparing it is cheap however large the message is. Replacing the value of
+    a key changes the fingerprint, mutating a nested value, such as appending
+    to the tool_calls list, doesn't.
+
+    Args:
+        message: The message to take a fingerprint of
+
+    Returns:
+        The fingerprint, to pass to `matches_fingerprint()`
+
+    Example:
+        ```
+        message = {"role": "user", "content": "Hello"}
+        fingerprint = message_fingerprint(message)
+
+        message["content"] = "Goodbye"
+        print(matches_fingerprint(message, fingerprint))  # False
+        ```
+    """
+    return list(message.items())
+
+
+def matches_fingerprint(
+    message: Mapping[str, Any], fingerprint: List[Tuple[str, Any]]
+) -> bool:
+    """
+    Check whether a message is unchanged since its fingerprint was taken.
+
+    Args:
+        message: The message to check
+        fingerprint: Fingerprint taken with `message_fingerprint()`
+
+    Returns:
+        True if the message still holds the same keys with the same values
+    """
+    if len(message) != len(fingerprint):
+        return False
+    return all(
+        key == fingerprint_key and value is fingerprint_value
+        for (key, value), (fingerprint_key, fingerprint_value) in zip(
+            message.items(), fingerprint
+        )
+    )
+
+
 def title_case(string: str) -> str:
     """
     Convert snake_case string to Title Case.
@@ -8,7 +8,7 @@ architecture or API.
 """
 
 from abc import ABC, abstractmethod
-from typing import ClassVar
+from typing import Any, ClassVar, Dict
 
 from .types import AgentInput, AgentReturnTypes, AgentRole
 
@@ -113,3 +113,34 @@ class AgentAdapter(ABC):
             ```
         """
         pass
+
+    def cache_identity(self) -> Dict[str, Any]:
+        """
+        Describe what makes this agent behave differently from other agents of
+        the same kind, for calls cached with `@scenario.cache()`.
+
+        The identity is part of the cache key of the agent's cached methods, so
+        that, for example, two judges with different criteria never share cached
+        judgments. By default, only the agent class is taken into account.
+        Override it to add any setting that changes the agent's output, but
+        never include secrets such as API keys.
+
+        Returns:
+            JSON-serializable dictionary identifying the agent's behavior
+
+        Example:
+            ```
+            class MyAgent(scenario.AgentAdapter):
+                def __init__(self, model: str, prompt: str):
+                    self.model = model
+                    self.prompt = prompt
+
+                def cache_identity(self):
+                    return {
+                        **super().cache_identity(),
+                        "model": self.model,
+                        "prompt": self.prompt,
+                    }
+            ```
+        """
+        return {"class": f"{self.__class__.__module__}.{self.__class__.__qualname__}"}
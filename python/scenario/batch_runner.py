@@ -0,0 +1,340 @@
+"""
+Batch execution module for running many scenarios at once.
+
+This module provides the `run_many()` function, which runs a large number of
+scenario definitions with a global concurrency limit on top of the shared
+ScenarioRuntime, streaming each ScenarioResult back as soon as its run finishes.
+Scenarios can either run on worker threads of the current process, as cheap
+tasks on the caller's own event loop, or be spread across a pool of worker
+processes to use all CPU cores.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    TypedDict,
+    Union,
+)
+
+from .agent_adapter import AgentAdapter
+from .config import ScenarioConfig
+from .scenario_executor import ScenarioExecutor, run
+from .scenario_runtime import ScenarioRuntime
+from .types import ScenarioResult, ScriptStep
+from ._budget import SessionSpend
+from ._timings import install_usage_patches
+from ._events import ScenarioEventBus
+from ._utils.ids import get_batch_run_id
+
+
+logger = logging.getLogger("scenario")
+
+# Scenarios in "loop" mode are plain asyncio tasks, so they are not bounded by
+# the number of worker threads
+_DEFAULT_LOOP_CONCURRENCY = 1000
+
+
+class _ScenarioSpecRequired(TypedDict):
+    name: str
+    description: str
+
+
+class ScenarioSpec(_ScenarioSpecRequired, total=False):
+    """
+    Definition of a single scenario to be executed by `run_many()`.
+
+    Accepts the same fields as the keyword arguments of `scenario.run()`,
+    only `name` and `description` are required.
+
+    Attributes:
+        name: Human-readable name for the scenario
+        description: Detailed description of what the scenario tests
+        agents: List of agent adapters (agent under test, user simulator, judge)
+        max_turns: Maximum conversation turns before timeout
+        verbose: Show detailed output during execution
+        cache_key: Cache key for deterministic behavior
+        debug: Enable debug mode for step-by-step execution
+        script: Optional script steps to control scenario flow
+        set_id: Optional set identifier for grouping related scenarios
+        token_budget: Maximum number of LLM tokens the scenario may use
+        cost_budget: Maximum estimated LLM cost in USD of the scenario
+
+    Example:
+        ```
+        spec: scenario.ScenarioSpec = {
+            "name": "weather query",
+            "description": "User asks about the weather in Amsterdam",
+            "agents": [WeatherAgent(), scenario.UserSimulatorAgent(), judge],
+            "set_id": "weather-regression",
+        }
+        ```
+    """
+
+    agents: List[AgentAdapter]
+    max_turns: Optional[int]
+    verbose: Optional[Union[bool, int]]
+    cache_key: Optional[str]
+    debug: Optional[bool]
+    script: Optional[List[ScriptStep]]
+    set_id: Optional[str]
+    token_budget: Optional[int]
+    cost_budget: Optional[float]
+
+
+def _error_result(spec: ScenarioSpec, error: Exception) -> ScenarioResult:
+    """
+    Turn an unexpected error into a failed result, so that one broken scenario
+    does not abort the whole batch.
+    """
+    logger.error(f"Scenario '{spec['name']}' failed with error: {repr(error)}")
+    return ScenarioResult(
+        success=False,
+        messages=[],
+        reasoning=f"Scenario failed with error: {str(error)}",
+    )
+
+
+async def _run_spec(spec: ScenarioSpec) -> ScenarioResult:
+    """Run a single scenario spec on the shared ScenarioRuntime worker threads"""
+    try:
+        return await run(**spec)
+    except Exception as e:
+        return _error_result(spec, e)
+
+
+async def _run_spec_in_loop(spec: ScenarioSpec) -> ScenarioResult:
+    """
+    Run a single scenario spec directly on the current event loop.
+
+    Each spec runs in its own task, which gets its own copy of the context, so
+    the current scenario tracked by the cache stays isolated per task.
+    """
+    executor = ScenarioExecutor(**spec)
+    try:
+        return await executor.run()
+    except Exception as e:
+        return _error_result(spec, e)
+
+
+# Persistent event loop of the current worker process, when running in process mode
+_process_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker_process(default_config: Optional[ScenarioConfig]) -> None:
+    """
+    Initialize a worker process of the process pool.
+
+    Each worker gets its own runtime, event loop, and, as scenario modules are
+    imported fresh in the worker, its own event bus and cache handle. The global
+    configuration from the parent process is carried over.
+    """
+    global _process_loop
+
+    # Never inherit runtime or event bus threads from the parent, in case the
+    # process was forked
+    ScenarioRuntime.default_runtime = None
+    ScenarioEventBus.default_bus = None
+    ScenarioConfig.default_config = default_config
+
+    _process_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_process_loop)
+
+    # Patch litellm before the specs are unpickled, so agents that import its
+    # functions by name still have their usage recorded
+    install_usage_patches()
+
+
+def _run_spec_in_worker_process(
+    spec: ScenarioSpec, session_tokens: int, session_cost: float
+) -> ScenarioResult:
+    """
+    Entry point executed inside the worker process for each scenario spec.
+
+    The session spend is the one of the parent process, which adds up the spend
+    of every worker, so that session budgets hold across the whole batch.
+    """
+    assert _process_loop is not None, "Worker process was not initialized"
+
+    SessionSpend.default_spend = SessionSpend(tokens=session_tokens, cost=session_cost)
+    return _process_loop.run_until_complete(_run_spec(spec))
+
+
+def _report_remote_result(spec: ScenarioSpec, result: ScenarioResult) -> None:
+    """
+    Called in the parent process for each result produced by a worker process.
+
+    Scenarios executed in worker processes don't go through the parent's
+    ScenarioExecutor.run(), so integrations collecting results, like the
+    pytest plugin reporter, hook in here instead.
+    """
+    pass
+
+
+async def _run_spec_in_process_pool(
+    pool: concurrent.futures.ProcessPoolExecutor, spec: ScenarioSpec
+) -> ScenarioResult:
+    spend = SessionSpend.get()
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(
+            pool, _run_spec_in_worker_process, spec, spend.tokens, spend.cost
+        )
+    except Exception as e:
+        result = _error_result(spec, e)
+
+    if result.timings is not None:
+        summary = result.timings.summary()
+        spend.add(summary.prompt_tokens + summary.completion_tokens, summary.cost)
+
+    _report_remote_result(spec, result)
+    return result
+
+
+async def run_many(
+    specs: Iterable[ScenarioSpec],
+    max_concurrency: Optional[int] = None,
+    mode: Literal["thread", "loop", "process"] = "thread",
+    max_processes: Optional[int] = None,
+) -> AsyncIterator[ScenarioResult]:
+    """
+    Run many scenarios concurrently, yielding results as they complete.
+
+    Scenarios are started lazily from the `specs` iterable, keeping at most
+    `max_concurrency` of them in flight at any time. Each result is yielded as
+    soon as its scenario finishes, so results arrive in completion order rather
+    than in the order of `specs`.
+
+    A scenario that raises an error, instead of returning a result, is reported
+    as a failed ScenarioResult with the error as reasoning.
+
+    In "loop" mode, scenarios run as asyncio tasks on the caller's event loop
+    instead of being dispatched to worker threads, which allows for a thousand
+    or more concurrent scenarios without as many OS threads. This requires agents
+    to be fully async: any blocking call, including the `debug` mode prompts,
+    stalls every scenario in the batch.
+
+    In "process" mode, scenario specs are shipped to a pool of worker processes,
+    which lifts the GIL limit for agents doing CPU-heavy work. Specs must then be
+    picklable, meaning agents should be instances of classes defined at module
+    level, and scripts run as `__main__` need an `if __name__ == "__main__":` guard.
+    Script steps built with the `scenario.user()`, `scenario.agent()`, etc helpers
+    are lambdas and cannot be pickled, so scripted scenarios should use "thread" mode.
+    Each worker process runs one scenario at a time, with its own event bus and
+    cache handle, and ships back the ScenarioResult. Session budgets are checked
+    against the spend added up from the results of all the workers, so the
+    scenarios running at the same time can together go over them.
+
+    Args:
+        specs: Scenario definitions to run, with the same fields as `scenario.run()`
+        max_concurrency: Maximum number of scenarios running at the same time.
+                        Defaults to the size of the ScenarioRuntime worker pool
+                        in "thread" mode, to 1000 in "loop" mode, and to the
+                        number of processes in "process" mode.
+        mode: Either "thread" to run scenarios on the worker threads of the
+             current process, "loop" to run them as tasks on the current event
+             loop, or "process" to spread them across worker processes
+        max_processes: Number of worker processes in "process" mode, defaults
+                      to the number of CPUs
+
+    Yields:
+        ScenarioResult for each scenario, in completion order
+
+    Example:
+        ```
+        import scenario
+
+        specs = [
+            {
+                "name": f"refund request #{i}",
+                "description": f"User asks for a refund on order {i}",
+                "agents": [MyAgent(), scenario.UserSimulatorAgent(), judge],
+            }
+            for i in range(5000)
+        ]
+
+        passed = 0
+        async for result in scenario.run_many(specs, max_concurrency=100):
+            passed += result.success
+
+        print(f"{passed}/{len(specs)} scenarios passed")
+
+        # Fully async agents can run as tasks on the current event loop
+        async for result in scenario.run_many(specs, mode="loop", max_concurrency=1000):
+            print(result)
+
+        # Spread CPU-heavy agents across 8 worker processes
+        async for result in scenario.run_many(specs, mode="process", max_processes=8):
+            print(result)
+        ```
+    """
+    pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+    run_spec: Callable[[ScenarioSpec], Awaitable[ScenarioResult]]
+
+    if mode == "process":
+        processes = max_processes or os.cpu_count() or 1
+        max_concurrency = max_concurrency or processes
+
+        # Make sure all worker processes report under the same batch run id
+        get_batch_run_id()
+
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_process,
+            initargs=(ScenarioConfig.default_config,),
+        )
+        process_pool = pool
+        run_spec = lambda spec: _run_spec_in_process_pool(process_pool, spec)
+    elif mode == "loop":
+        max_concurrency = max_concurrency or _DEFAULT_LOOP_CONCURRENCY
+        run_spec = _run_spec_in_loop
+    elif mode == "thread":
+        max_concurrency = max_concurrency or ScenarioRuntime.get().max_workers
+        run_spec = _run_spec
+    else:
+        raise ValueError(f"Unknown run_many mode: {mode}")
+
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    pending_specs: Iterator[ScenarioSpec] = iter(specs)
+    in_flight: Set["asyncio.Future[ScenarioResult]"] = set()
+
+    def schedule_next() -> bool:
+        spec = next(pending_specs, None)
+        if spec is None:
+            return False
+        in_flight.add(asyncio.ensure_future(run_spec(spec)))
+        return True
+
+    try:
+        while len(in_flight) < max_concurrency and schedule_next():
+            pass
+
+        while in_flight:
+            done, _ = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                in_flight.remove(task)
+                schedule_next()
+
+            for task in done:
+                yield task.result()
+    finally:
+        # The consumer stopped iterating early, don't leave runs queued behind
+        for task in in_flight:
+            task.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
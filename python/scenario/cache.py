@@ -7,54 +7,232 @@ on scenario configuration and function arguments, enabling consistent test resul
 across multiple runs.
 """
 
+import asyncio
+import concurrent.futures
+import copy
 from contextvars import ContextVar
+import hashlib
 import inspect
+import logging
 import os
 from pathlib import Path
-from typing import Callable, TYPE_CHECKING
-from joblib import Memory
+import pickle
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 import json
 
 import wrapt
+from scenario.agent_adapter import AgentAdapter
+from scenario.config import ModelConfig, ScenarioConfig
 from scenario.types import AgentInput
+from scenario._cache import (
+    CacheBackend,
+    CacheStats,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from scenario._timings import record_cache_hit
 from scenario._utils.utils import SerializableWithStringFallback
 
 if TYPE_CHECKING:
     from scenario.scenario_executor import ScenarioExecutor
 
 
+logger = logging.getLogger("scenario")
+
 context_scenario = ContextVar("scenario")
 
+# Version of the cache key schema, bump it whenever the components of the key
+# change, so that entries stored under the previous schema are never mixed up
+CACHE_KEY_SCHEMA_VERSION = 1
+
+# Default maximum size of the cache, 1 GiB
+DEFAULT_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+
+# Default maximum size of the in-memory tier in front of the cache, 64 MiB
+DEFAULT_CACHE_MEMORY_SIZE = 64 * 1024 * 1024
+
+_CACHE_FILENAME = "cache.sqlite3"
 
-def get_cache() -> Memory:
+
+def get_cache(config: Optional["ScenarioConfig"] = None) -> Optional[CacheBackend]:
     """
-    Get a cross-platform cache directory for scenario execution.
+    Create the cache backend for scenario execution.
+
+    Creates a single-file SQLite cache inside a cross-platform cache directory.
+    The cache can be customized through `scenario.configure()`, or via
+    environment variables, the configuration taking precedence:
+
+    - cache_dir / SCENARIO_CACHE_DIR: directory of the cache, set it to an
+      empty string to disable caching entirely (default: ~/.scenario/cache)
+    - cache_max_size / SCENARIO_CACHE_MAX_SIZE: maximum size of the cache in
+      bytes, the least recently used entries are evicted beyond it (default: 1 GiB)
+    - cache_ttl / SCENARIO_CACHE_TTL: maximum age of a cache entry in seconds
+      (default: no expiry)
+    - cache_memory_size / SCENARIO_CACHE_MEMORY_SIZE: size in bytes of the
+      in-memory LRU tier kept in front of the SQLite cache, set it to 0 to
+      disable it (default: 64 MiB)
 
-    Creates and returns a joblib Memory instance configured to use a
-    cross-platform cache directory. The cache location can be customized
-    via the SCENARIO_CACHE_DIR environment variable.
+    Args:
+        config: Configuration to take the cache settings from, the global
+                configuration by default
 
     Returns:
-        Memory instance configured with the appropriate cache directory
+        The cache backend, or None if caching is disabled
 
     Example:
         ```
-        # Default cache location: ~/.scenario/cache
+        # Default cache location: ~/.scenario/cache/cache.sqlite3
         cache = get_cache()
 
-        # Custom cache location via environment variable
+        # Custom cache location and size via environment variables
         os.environ["SCENARIO_CACHE_DIR"] = "/tmp/my_scenario_cache"
+        os.environ["SCENARIO_CACHE_MAX_SIZE"] = str(200 * 1024 * 1024)
         cache = get_cache()
         ```
     """
-    home_dir = str(Path.home())
-    cache_dir = os.path.join(home_dir, ".scenario", "cache")
+    cache_dir, max_size, ttl, memory_size = _cache_settings(config)
+    if not cache_dir:
+        return None
+
+    backend: CacheBackend = SQLiteCacheBackend(
+        path=os.path.join(cache_dir, _CACHE_FILENAME),
+        max_size_bytes=max_size if max_size is not None else DEFAULT_CACHE_MAX_SIZE,
+        ttl_seconds=ttl,
+    )
+
+    memory_size_bytes = (
+        memory_size if memory_size is not None else DEFAULT_CACHE_MEMORY_SIZE
+    )
+    if memory_size_bytes > 0:
+        backend = MemoryCacheBackend(
+            backend=backend, max_size_bytes=memory_size_bytes, ttl_seconds=ttl
+        )
+
+    return backend
+
+
+_CacheSettings = Tuple[str, Optional[int], Optional[float], Optional[int]]
+
+
+def _cache_settings(config: Optional["ScenarioConfig"] = None) -> _CacheSettings:
+    """
+    Resolve the (directory, max size, ttl, memory size) settings of the cache,
+    from the configuration first and from the environment variables otherwise.
+    """
+    if config is None:
+        config = ScenarioConfig.default_config
+
+    def setting(name: str, env: str, parse: Callable[[str], Any]) -> Any:
+        value = getattr(config, name, None) if config is not None else None
+        if value is not None:
+            return value
+        env_value = os.environ.get(env)
+        return parse(env_value) if env_value else None
+
+    cache_dir = getattr(config, "cache_dir", None) if config is not None else None
+    if cache_dir is None:
+        cache_dir = os.environ.get(
+            "SCENARIO_CACHE_DIR", os.path.join(str(Path.home()), ".scenario", "cache")
+        )
+
+    return (
+        cache_dir,
+        setting("cache_max_size", "SCENARIO_CACHE_MAX_SIZE", int),
+        setting("cache_ttl", "SCENARIO_CACHE_TTL", float),
+        setting("cache_memory_size", "SCENARIO_CACHE_MEMORY_SIZE", int),
+    )
+
+
+# The cache backend is only created on the first cached call, so that runs
+# which never set a cache_key don't touch the filesystem, and it is created
+# again whenever the cache settings are changed through scenario.configure()
+_cache_backend: Optional[CacheBackend] = None
+_cache_backend_settings: Optional[_CacheSettings] = None
+_cache_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """
+    Get the backend used to store cached calls, creating it on first use.
+
+    Returns:
+        The cache backend, or None if caching is disabled
+
+    Example:
+        ```
+        import scenario
+        from scenario.cache import get_cache_backend
+
+        scenario.configure(cache_dir="/tmp/my_scenario_cache")
+        backend = get_cache_backend()
+        ```
+    """
+    global _cache_backend, _cache_backend_settings
+
+    settings = _cache_settings()
+    if settings == _cache_backend_settings:
+        return _cache_backend
+
+    with _cache_backend_lock:
+        if settings != _cache_backend_settings:
+            previous_backend = _cache_backend
+            _cache_backend = get_cache()
+            _cache_backend_settings = settings
+            if previous_backend is not None:
+                previous_backend.close()
+        return _cache_backend
+
+
+def set_cache_backend(backend: Optional[CacheBackend]) -> None:
+    """
+    Replace the backend used to store cached calls.
 
-    return Memory(location=os.environ.get("SCENARIO_CACHE_DIR", cache_dir), verbose=0)
+    The backend is used until the cache settings are changed again through
+    `scenario.configure()`, after which a new backend is created from them.
 
+    Args:
+        backend: The new cache backend, or None to disable caching
 
-memory = get_cache()
+    Example:
+        ```
+        from scenario.cache import set_cache_backend
+
+        set_cache_backend(MyRedisCacheBackend(url="redis://ci-cache:6379"))
+        ```
+    """
+    global _cache_backend, _cache_backend_settings
+
+    settings = _cache_settings()
+    with _cache_backend_lock:
+        previous_backend, _cache_backend = _cache_backend, backend
+        _cache_backend_settings = settings
+    if previous_backend is not None and previous_backend is not backend:
+        previous_backend.close()
+
+
+def cache_stats() -> Optional[CacheStats]:
+    """
+    Get the hit and miss counters of the in-memory cache tier.
+
+    Returns:
+        The cache statistics, or None if the in-memory tier is disabled or no
+        cached call was made yet
+
+    Example:
+        ```
+        from scenario.cache import cache_stats
+
+        stats = cache_stats()
+        if stats:
+            print(f"{stats['hits']} hits, {stats['misses']} misses")
+        ```
+    """
+    backend = _cache_backend
+    if isinstance(backend, MemoryCacheBackend):
+        return backend.stats()
+    return None
 
 
 def scenario_cache(ignore=[]):
@@ -101,87 +279,341 @@ def scenario_cache(ignore=[]):
 
     Note:
         - Caching only occurs when a cache_key is set in the scenario configuration
-        - The cache key is computed from scenario config, function arguments, and cache_key
-        - AgentInput objects are specially handled to exclude thread_id from caching
+        - The cache key is computed from the cache_key, the relevant scenario config,
+          the agent's `cache_identity()` and function arguments, see `resolve_cache_key()`
+        - AgentInput objects are reduced to a digest of the conversation, excluding thread_id
         - Both sync and async functions are supported
     """
 
+    # Resolved once, on the first call, instead of inspecting the function every time
+    signature: Optional[inspect.Signature] = None
+    is_coroutine_function = False
+
     @wrapt.decorator
     def wrapper(wrapped: Callable, instance=None, args=[], kwargs={}):
+        nonlocal signature, is_coroutine_function
+
         scenario: "ScenarioExecutor" = context_scenario.get()
 
         if not scenario.config.cache_key:
             return wrapped(*args, **kwargs)
 
-        sig = inspect.signature(wrapped)
-        parameters = list(sig.parameters.values())
-
-        all_args = {
-            str(parameter.name): value for parameter, value in zip(parameters, args)
-        }
-        for arg in ["self"] + ignore:
-            if arg in all_args:
-                del all_args[arg]
+        if signature is None:
+            is_coroutine_function = inspect.iscoroutinefunction(wrapped)
+            signature = inspect.signature(wrapped)
 
-        for key, value in all_args.items():
-            if isinstance(value, AgentInput):
-                scenario_state = value.scenario_state.model_dump(exclude={"thread_id"})
-                all_args[key] = value.model_dump(exclude={"thread_id"})
-                all_args[key]["scenario_state"] = scenario_state
-
-        cache_key = json.dumps(
-            {
-                "cache_key": scenario.config.cache_key,
-                "scenario": scenario.config.model_dump(exclude={"agents"}),
-                "all_args": all_args,
-            },
-            cls=SerializableWithStringFallback,
+        digest, _ = resolve_cache_key(
+            scenario, wrapped, instance, args, kwargs, ignore, signature=signature
         )
 
-        # if is an async function, we need to wrap it in a sync function
-        if inspect.iscoroutinefunction(wrapped):
-            return _async_cached_call(wrapped, args, kwargs, cache_key=cache_key)
+        if is_coroutine_function:
+            return _async_cached_call(wrapped, args, kwargs, digest=digest)
         else:
-            return _cached_call(wrapped, args, kwargs, cache_key=cache_key)
+            return _cached_call(wrapped, args, kwargs, digest=digest)
 
     return wrapper
 
 
-@memory.cache(ignore=["func", "args", "kwargs"])
-def _cached_call(func: Callable, args, kwargs, cache_key):
+def resolve_cache_key(
+    scenario: "ScenarioExecutor",
+    func: Callable,
+    instance: Any,
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    ignore: List[str] = [],
+    signature: Optional[inspect.Signature] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Resolve the cache key of a call made during a scenario execution.
+
+    The key follows an explicit schema, versioned by `CACHE_KEY_SCHEMA_VERSION`,
+    made only of what can change the outcome of the call: the scenario's
+    cache_key and relevant configuration, the identity of the agent owning the
+    cached method, the function itself, and its arguments. Presentation-only
+    settings such as `verbose`, `debug` or `headless` never take part in it.
+
+    Every resolved key is logged with its components on the "scenario" logger
+    at DEBUG level, to help figuring out why a call missed the cache.
+
+    Args:
+        scenario: The scenario executor the call is made in
+        func: The cached function
+        instance: The object the cached method is bound to, if any
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        ignore: Argument names to leave out of the key
+        signature: Signature of func, inspected from it when not given
+
+    Returns:
+        A (digest, components) tuple, the digest being the actual cache key
+
+    Example:
+        ```
+        import logging
+
+        # See the components of every cache key while running scenarios
+        logging.getLogger("scenario").setLevel(logging.DEBUG)
+        ```
+    """
+    function_name = f"{func.__module__}.{func.__qualname__}"
+
+    if isinstance(instance, AgentAdapter):
+        agent = instance.cache_identity()
+    elif instance is not None:
+        agent = {"class": f"{type(instance).__module__}.{type(instance).__qualname__}"}
+    else:
+        agent = None
+
+    # Bound to the parameter names, so that passing an argument by position or
+    # by keyword, or leaving out one that has a default, resolves the same key
+    bound = (signature or inspect.signature(func)).bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+
+    components = {
+        "version": CACHE_KEY_SCHEMA_VERSION,
+        "cache_key": scenario.config.cache_key,
+        "config": scenario._cache_key_config,
+        "agent": agent,
+        "function": function_name,
+        "args": {
+            name: _cache_key_value(value)
+            for name, value in bound.arguments.items()
+            if name != "self" and name not in ignore
+        },
+    }
+
+    serialized = json.dumps(
+        components, sort_keys=True, cls=SerializableWithStringFallback
+    )
+    digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    logger.debug(f"Cache key {digest} for {function_name}: {serialized}")
+
+    return digest, components
+
+
+def cache_key_config(config: "ScenarioConfig") -> Dict[str, Any]:
+    """
+    Extract the configuration fields that take part in cache keys.
+
+    The configuration doesn't change during a scenario run, so the executor
+    resolves this once per run instead of on every cached call. API keys are
+    never part of cache keys.
+
+    Args:
+        config: The scenario configuration
+
+    Returns:
+        Dictionary with the default model settings and max_turns
+    """
+    model = config.default_model
+    if isinstance(model, ModelConfig):
+        model = model.model_dump(exclude={"api_key"})
+
+    return {
+        "default_model": model,
+        "max_turns": config.max_turns,
+    }
+
+
+def _cache_key_value(value: Any) -> Any:
+    """
+    Get the representation of an argument that goes into the cache key.
+
+    AgentInput arguments are reduced to the digest of their conversation,
+    maintained incrementally by the scenario state, so that the cost of
+    computing the key does not grow with the conversation length. The
+    thread_id is left out, as it is different on every run.
+    """
+    if not isinstance(value, AgentInput):
+        return value
+
+    state = value.scenario_state
+    if value.messages is state.messages:
+        messages_hash = state._messages_hash()
+    else:
+        messages_hash = _hash_messages(value.messages)
+
+    return {
+        "messages": messages_hash,
+        "new_messages": _hash_messages(value.new_messages),
+        "judgment_request": value.judgment_request,
+        "description": state.description,
+        "current_turn": state.current_turn,
+    }
+
+
+def _hash_messages(messages: List[Any]) -> str:
+    serialized = json.dumps(
+        [
+            {
+                key: value
+                for key, value in message.items()
+                if key not in ("trace_id", "id")
+            }
+            for message in messages
+        ],
+        sort_keys=True,
+        cls=SerializableWithStringFallback,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _cache_lookup(digest: str) -> Tuple[bool, Any]:
+    """
+    Look up a cached return value.
+
+    Returns:
+        A (hit, value) tuple, value being None on a miss
+    """
+    backend = get_cache_backend()
+    if backend is None:
+        return False, None
+
+    stored = backend.get(digest)
+    if stored is None:
+        return False, None
+
+    try:
+        value = pickle.loads(stored)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable cache entry {digest}: {repr(e)}")
+        return False, None
+
+    record_cache_hit()
+    return True, value
+
+
+def _cache_store(digest: str, value: Any) -> Optional[bytes]:
+    """
+    Store a return value in the cache.
+
+    Returns:
+        The pickled value, or None if the value could not be pickled
+    """
+    try:
+        stored = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logger.debug(f"Not caching unpicklable value for {digest}: {repr(e)}")
+        return None
+
+    backend = get_cache_backend()
+    if backend is not None:
+        backend.set(digest, stored)
+    return stored
+
+
+# Calls currently being computed, by cache key. These are concurrent futures
+# rather than asyncio ones, as identical calls can come from scenarios running
+# on the event loops of different ScenarioRuntime worker threads.
+_in_flight_calls: Dict[str, "concurrent.futures.Future[Tuple[Optional[bytes], Any]]"] = {}
+_in_flight_calls_lock = threading.Lock()
+
+
+def _cached_call(func: Callable, args, kwargs, digest: str):
     """
     Internal function for caching synchronous function calls.
 
     This function is used internally by the scenario_cache decorator
-    to cache synchronous function calls using joblib.Memory.
+    to serve the call from the cache backend, or to call the function
+    and store its return value on a miss.
 
     Args:
         func: The function to call and cache
         args: Positional arguments for the function
         kwargs: Keyword arguments for the function
-        cache_key: Cache key for deterministic caching
+        digest: Content-addressed cache key of the call
 
     Returns:
         The result of calling func(*args, **kwargs)
     """
-    return func(*args, **kwargs)
+    hit, value = _cache_lookup(digest)
+    if hit:
+        return value
+
+    value = func(*args, **kwargs)
+    _cache_store(digest, value)
+    return value
 
 
-@memory.cache(ignore=["func", "args", "kwargs"])
-async def _async_cached_call(func: Callable, args, kwargs, cache_key):
+async def _async_cached_call(func: Callable, args, kwargs, digest: str):
     """
     Internal function for caching asynchronous function calls.
 
     This function is used internally by the scenario_cache decorator
-    to cache asynchronous function calls using joblib.Memory.
+    to serve the call from the cache backend, or to await the function
+    and store its awaited return value on a miss.
+
+    Concurrent calls with the same cache key, for example parallel scenarios
+    sharing the same opening message, are coalesced: only the first one
+    actually calls the function, the others wait for its result. Each waiter
+    gets its own copy of the value, unpickled from what was stored in the
+    cache, or deep-copied if the value couldn't be pickled, so that scenarios
+    never share mutable messages. Only values that can't be copied either are
+    shared as they are.
 
     Args:
         func: The async function to call and cache
         args: Positional arguments for the function
         kwargs: Keyword arguments for the function
-        cache_key: Cache key for deterministic caching
+        digest: Content-addressed cache key of the call
 
     Returns:
         The result of calling await func(*args, **kwargs)
     """
-    return await func(*args, **kwargs)
+    while True:
+        hit, value = _cache_lookup(digest)
+        if hit:
+            return value
+
+        with _in_flight_calls_lock:
+            in_flight = _in_flight_calls.get(digest)
+            if in_flight is None:
+                _in_flight_calls[digest] = concurrent.futures.Future()
+
+        if in_flight is None:
+            return await _async_cached_call_leader(func, args, kwargs, digest)
+
+        try:
+            # Shielded so that a cancelled waiter doesn't cancel the shared call
+            stored, value = await asyncio.shield(asyncio.wrap_future(in_flight))
+        except asyncio.CancelledError:
+            if not in_flight.cancelled():
+                raise
+            # The scenario making the call was cancelled, try again ourselves
+            continue
+
+        record_cache_hit()
+        return _waiter_copy(digest, stored, value)
+
+
+def _waiter_copy(digest: str, stored: Optional[bytes], value: Any) -> Any:
+    """Get a copy of the result of a coalesced call, for one of its waiters"""
+    if stored is not None:
+        return pickle.loads(stored)
+    try:
+        return copy.deepcopy(value)
+    except Exception as e:
+        logger.debug(f"Sharing uncopyable value of {digest}: {repr(e)}")
+        return value
+
+
+async def _async_cached_call_leader(func: Callable, args, kwargs, digest: str):
+    in_flight = _in_flight_calls[digest]
+    try:
+        value = await func(*args, **kwargs)
+        stored = _cache_store(digest, value)
+    except BaseException as e:
+        with _in_flight_calls_lock:
+            del _in_flight_calls[digest]
+        if isinstance(e, asyncio.CancelledError):
+            in_flight.cancel()
+        else:
+            in_flight.set_exception(e)
+        raise
+
+    with _in_flight_calls_lock:
+        del _in_flight_calls[digest]
+    in_flight.set_result((stored, value))
+
+    return value
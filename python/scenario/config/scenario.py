@@ -26,6 +26,14 @@ class ScenarioConfig(BaseModel):
         verbose: Whether to show detailed output during execution (True/False or verbosity level)
         cache_key: Key for caching scenario results to ensure deterministic behavior
         debug: Whether to enable debug mode with step-by-step interaction
+        cache_dir: Directory of the cache, empty to disable caching (default: ~/.scenario/cache)
+        cache_max_size: Maximum size of the cache in bytes
+        cache_ttl: Maximum age of a cache entry in seconds
+        cache_memory_size: Size in bytes of the in-memory tier in front of the cache
+        token_budget: Maximum number of LLM tokens a single scenario may use
+        cost_budget: Maximum estimated LLM cost in USD of a single scenario
+        session_token_budget: Maximum number of LLM tokens all scenarios of the process may use
+        session_cost_budget: Maximum estimated LLM cost in USD of all scenarios of the process
 
     Example:
         ```
@@ -59,6 +67,15 @@ class ScenarioConfig(BaseModel):
         "0",
         "",
     ]
+    cache_dir: Optional[str] = None
+    cache_max_size: Optional[int] = None
+    cache_ttl: Optional[float] = None
+    cache_memory_size: Optional[int] = None
+    token_budget: Optional[int] = None
+    cost_budget: Optional[float] = None
+    session_token_budget: Optional[int] = None
+    session_cost_budget: Optional[float] = None
+    events_max_connections: Optional[int] = None
 
     default_config: ClassVar[Optional["ScenarioConfig"]] = None
 
@@ -71,6 +88,15 @@ class ScenarioConfig(BaseModel):
         cache_key: Optional[str] = None,
         debug: Optional[bool] = None,
         headless: Optional[bool] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        cache_memory_size: Optional[int] = None,
+        token_budget: Optional[int] = None,
+        cost_budget: Optional[float] = None,
+        session_token_budget: Optional[int] = None,
+        session_cost_budget: Optional[float] = None,
+        events_max_connections: Optional[int] = None,
     ) -> None:
         """
         Set global configuration settings for all scenario executions.
@@ -84,6 +110,15 @@ class ScenarioConfig(BaseModel):
             verbose: Enable verbose output during scenario execution
             cache_key: Cache key for deterministic scenario behavior across runs
             debug: Enable debug mode for step-by-step execution with user intervention
+            cache_dir: Directory of the cache, set it to an empty string to disable caching
+            cache_max_size: Maximum size of the cache in bytes (default: 1 GiB)
+            cache_ttl: Maximum age of a cache entry in seconds (default: no expiry)
+            cache_memory_size: Size in bytes of the in-memory tier in front of the cache (default: 64 MiB)
+            token_budget: Maximum number of LLM tokens a single scenario may use before it's failed
+            cost_budget: Maximum estimated LLM cost in USD of a single scenario before it's failed
+            session_token_budget: Maximum number of LLM tokens all scenarios of the process may use
+            session_cost_budget: Maximum estimated LLM cost in USD of all scenarios of the process
+            events_max_connections: Size of the connection pool events are reported through (default: 20)
 
         Example:
             ```
@@ -115,6 +150,15 @@ class ScenarioConfig(BaseModel):
                 cache_key=cache_key,
                 debug=debug,
                 headless=headless,
+                cache_dir=cache_dir,
+                cache_max_size=cache_max_size,
+                cache_ttl=cache_ttl,
+                cache_memory_size=cache_memory_size,
+                token_budget=token_budget,
+                cost_budget=cost_budget,
+                session_token_budget=session_token_budget,
+                session_cost_budget=session_cost_budget,
+                events_max_connections=events_max_connections,
             )
         )
 
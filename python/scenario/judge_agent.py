@@ -10,11 +10,12 @@ success/failure verdicts.
 import json
 import logging
 import re
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Literal, Optional, Union, cast
 
 import litellm
 from litellm import Choices
 from litellm.files.main import ModelResponse
+from litellm.types.llms.openai import ChatCompletionToolChoiceObjectParam
 
 from scenario.cache import scenario_cache
 from scenario.agent_adapter import AgentAdapter
@@ -195,6 +196,17 @@ class JudgeAgent(AgentAdapter):
         if not hasattr(self, "model"):
             raise Exception(agent_not_configured_error_message("TestingAgent"))
 
+    def cache_identity(self) -> Dict[str, Any]:
+        return {
+            **super().cache_identity(),
+            "model": self.model,
+            "api_base": self.api_base,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "criteria": self.criteria,
+            "system_prompt": self.system_prompt,
+        }
+
     @scenario_cache()
     async def call(
         self,
@@ -355,9 +367,15 @@ if you don't have enough information to make a verdict, say inconclusive with ma
                 reasoning="TestingAgent was called as a judge, but it has no criteria to judge against",
             )
 
+        tool_choice: Union[ChatCompletionToolChoiceObjectParam, Literal["required"]] = (
+            {"type": "function", "function": {"name": "finish_test"}}
+            if (is_last_message or enforce_judgment) and has_criteria
+            else "required"
+        )
+
         response = cast(
             ModelResponse,
-            litellm.completion(
+            await litellm.acompletion(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
@@ -365,11 +383,9 @@ if you don't have enough information to make a verdict, say inconclusive with ma
                 api_base=self.api_base,
                 max_tokens=self.max_tokens,
                 tools=tools,
-                tool_choice=(
-                    {"type": "function", "function": {"name": "finish_test"}}
-                    if (is_last_message or enforce_judgment) and has_criteria
-                    else "required"
-                ),
+                # acompletion is only annotated to take strings, but accepts
+                # the same tool choice objects as completion
+                tool_choice=cast(Any, tool_choice),
             ),
         )
 
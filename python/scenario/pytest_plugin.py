@@ -8,14 +8,20 @@ pytest-based testing workflows.
 """
 
 import pytest
-from typing import TypedDict
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, TYPE_CHECKING
 import functools
+import wrapt
 from termcolor import colored
 
 from scenario.config import ScenarioConfig
-from scenario.types import ScenarioResult
 
-from .scenario_executor import ScenarioExecutor
+if TYPE_CHECKING:
+    from scenario.types import AgentCallTiming, ScenarioResult, TimingSummary
+
+    from .batch_runner import ScenarioSpec
+    from .scenario_executor import ScenarioExecutor
 
 
 class ScenarioReporterResults(TypedDict):
@@ -23,12 +29,15 @@ class ScenarioReporterResults(TypedDict):
     Type definition for scenario test results stored by the reporter.
 
     Attributes:
-        scenario: The ScenarioExecutor instance that ran the test
+        name: Name of the scenario that ran
+        scenario: The ScenarioExecutor instance that ran the test, None when the
+                 scenario ran in a worker process of `scenario.run_many()`
         result: The ScenarioResult containing test outcome and details
     """
 
-    scenario: ScenarioExecutor
-    result: ScenarioResult
+    name: str
+    scenario: Optional["ScenarioExecutor"]
+    result: "ScenarioResult"
 
 
 # ScenarioReporter class definition moved outside the fixture for global use
@@ -51,7 +60,7 @@ class ScenarioReporter:
         """Initialize an empty scenario reporter."""
         self.results: list[ScenarioReporterResults] = []
 
-    def add_result(self, scenario: ScenarioExecutor, result: ScenarioResult):
+    def add_result(self, scenario: "ScenarioExecutor", result: "ScenarioResult"):
         """
         Add a test result to the reporter.
 
@@ -63,7 +72,23 @@ class ScenarioReporter:
             scenario: The ScenarioExecutor instance that ran the test
             result: The ScenarioResult containing test outcome and details
         """
-        self.results.append({"scenario": scenario, "result": result})
+        self.results.append(
+            {"name": scenario.name, "scenario": scenario, "result": result}
+        )
+
+    def add_remote_result(self, name: str, result: "ScenarioResult"):
+        """
+        Add a test result produced in a worker process to the reporter.
+
+        This method is called automatically by the pytest plugin for scenarios
+        executed with `scenario.run_many(..., mode="process")`, whose
+        ScenarioExecutor lives in another process.
+
+        Args:
+            name: Name of the scenario that ran
+            result: The ScenarioResult containing test outcome and details
+        """
+        self.results.append({"name": name, "scenario": None, "result": result})
 
     def get_summary(self):
         """
@@ -78,16 +103,49 @@ class ScenarioReporter:
             - passed: Number of scenarios that passed
             - failed: Number of scenarios that failed
             - success_rate: Percentage of scenarios that passed (0-100)
+            - tokens: LLM tokens used by the agent calls of all scenarios
+            - cost: Estimated LLM cost in USD of the agent calls of all scenarios
         """
         total = len(self.results)
         passed = sum(1 for r in self.results if r["result"].success)
         failed = total - passed
 
+        calls = [
+            call
+            for r in self.results
+            if r["result"].timings is not None
+            for call in r["result"].timings.calls
+        ]
+
         return {
             "total": total,
             "passed": passed,
             "failed": failed,
             "success_rate": round(passed / total * 100, 2) if total else 0,
+            "tokens": sum(call.prompt_tokens + call.completion_tokens for call in calls),
+            "cost": sum(call.cost for call in calls),
+        }
+
+    def get_timings_by_role(self) -> Dict[str, "TimingSummary"]:
+        """
+        Get the latency and usage of the agent calls of all the scenarios,
+        aggregated by role.
+
+        Returns:
+            Summary of the agent calls of each role, with their p50 and p95 latencies
+        """
+        from scenario.types import TimingSummary
+
+        calls_by_role: Dict[str, List["AgentCallTiming"]] = {}
+        for item in self.results:
+            timings = item["result"].timings
+            if timings is None:
+                continue
+            for call in timings.calls:
+                calls_by_role.setdefault(call.role, []).append(call)
+
+        return {
+            role: TimingSummary.of(calls) for role, calls in calls_by_role.items()
         }
 
     def print_report(self):
@@ -95,10 +153,10 @@ class ScenarioReporter:
         Print a detailed report of all test results.
 
         Outputs a comprehensive report to the console showing:
-        - Overall summary statistics
+        - Overall summary statistics, including the tokens and estimated cost spent
         - Individual scenario results with success/failure status
         - Detailed reasoning for each scenario outcome
-        - Timing information when available
+        - Timing information when available, and p50/p95 latencies by role
         - Criteria pass/fail breakdown for judge-evaluated scenarios
 
         The report is automatically printed at the end of pytest sessions,
@@ -111,6 +169,11 @@ class ScenarioReporter:
         Passed: 4
         Failed: 1
         Success Rate: 80%
+        Spend: 7655 tokens, $0.0042 estimated
+        Latency by Role:
+           Agent: p50 0.95s, p95 1.80s (10 calls, 0 prompt tokens, 0 completion tokens, $0.0000, 0 cache hits)
+           User: p50 0.61s, p95 0.92s (10 calls, 4210 prompt tokens, 85 completion tokens, $0.0018, 0 cache hits)
+           Judge: p50 1.20s, p95 1.45s (5 calls, 3120 prompt tokens, 240 completion tokens, $0.0024, 0 cache hits)
 
         1. weather query test - PASSED in 2.34s (agent: 1.12s)
            Reasoning: Agent successfully provided weather information
@@ -149,9 +212,27 @@ class ScenarioReporter:
             else "yellow" if success_rate >= 70 else "red"
         )
         print(colored(f"Success Rate: {success_rate}%", rate_color))
+        print(
+            colored(
+                f"Spend: {summary['tokens']} tokens, ${summary['cost']:.4f} estimated",
+                "white",
+            )
+        )
+
+        timings_by_role = self.get_timings_by_role()
+        if timings_by_role:
+            print(colored("Latency by Role:", "white"))
+            for role, timings in timings_by_role.items():
+                print(
+                    colored(
+                        f"   {role}: p50 {timings.p50_latency or 0:.2f}s, p95 {timings.p95_latency or 0:.2f}s"
+                        f" ({timings.calls} calls, {timings.prompt_tokens} prompt tokens,"
+                        f" {timings.completion_tokens} completion tokens, ${timings.cost:.4f}, {timings.cache_hits} cache hits)",
+                        "white",
+                    )
+                )
 
         for idx, item in enumerate(self.results, 1):
-            scenario = item["scenario"]
             result = item["result"]
 
             status = "PASSED" if result.success else "FAILED"
@@ -162,7 +243,7 @@ class ScenarioReporter:
                 time = f" in {result.total_time:.2f}s (agent: {result.agent_time:.2f}s)"
 
             print(
-                f"\n{idx}. {scenario.name} - {colored(status, status_color, attrs=['bold'])}{time}"
+                f"\n{idx}. {item['name']} - {colored(status, status_color, attrs=['bold'])}{time}"
             )
 
             print(
@@ -196,8 +277,30 @@ class ScenarioReporter:
                 )
 
 
-# Store the original run method
-original_run = ScenarioExecutor.run
+# Functions replaced by the plugin, as (owner, name, original), restored on exit
+_patched_functions: List[Tuple[Any, str, Callable[..., Any]]] = []
+
+
+def _when_imported(module_name: str, patch: Callable[[ModuleType], None]) -> None:
+    """
+    Patch a module as soon as it's imported, or right away if it already was.
+
+    The scenario modules are only imported once a test actually uses them, so
+    that merely having the plugin installed doesn't slow down pytest startup.
+    """
+    wrapt.register_post_import_hook(patch, module_name)
+
+
+def _patch_function(owner: Any, name: str, replacement: Callable[..., Any]) -> None:
+    _patched_functions.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _restore_patched_functions() -> None:
+    while _patched_functions:
+        owner, name, original = _patched_functions.pop()
+        setattr(owner, name, original)
+
 
 def pytest_addoption(parser):
     parser.addoption("--headless", action="store_true")
@@ -248,23 +351,44 @@ def pytest_configure(config):
     # Create a global reporter instance
     config._scenario_reporter = ScenarioReporter()
 
-    # Create a patched version of Scenario.run that auto-reports
-    @functools.wraps(original_run)
-    async def auto_reporting_run(self, *args, **kwargs):
-        result = await original_run(self, *args, **kwargs)
+    def patch_scenario_executor(module: ModuleType) -> None:
+        original_run = module.ScenarioExecutor.run
+
+        # Create a patched version of Scenario.run that auto-reports
+        @functools.wraps(original_run)
+        async def auto_reporting_run(self, *args, **kwargs):
+            result = await original_run(self, *args, **kwargs)
+
+            # Always report to the global reporter
+            # Ensure the reporter exists before adding result
+            if hasattr(config, "_scenario_reporter"):
+                config._scenario_reporter.add_result(self, result)
+            else:
+                # Handle case where reporter might not be initialized (should not happen with current setup)
+                print(colored("Warning: Scenario reporter not found during run.", "yellow"))
+
+            return result
+
+        # Apply the patch
+        _patch_function(module.ScenarioExecutor, "run", auto_reporting_run)
+
+    def patch_batch_runner(module: ModuleType) -> None:
+        def auto_reporting_remote_result(spec: "ScenarioSpec", result: "ScenarioResult"):
+            if hasattr(config, "_scenario_reporter"):
+                config._scenario_reporter.add_remote_result(spec["name"], result)
 
-        # Always report to the global reporter
-        # Ensure the reporter exists before adding result
-        if hasattr(config, "_scenario_reporter"):
-            config._scenario_reporter.add_result(self, result)
-        else:
-            # Handle case where reporter might not be initialized (should not happen with current setup)
-            print(colored("Warning: Scenario reporter not found during run.", "yellow"))
+        _patch_function(module, "_report_remote_result", auto_reporting_remote_result)
 
-        return result
+    def patch_litellm(module: ModuleType) -> None:
+        from scenario._timings import install_usage_patches
 
-    # Apply the patch
-    ScenarioExecutor.run = auto_reporting_run
+        install_usage_patches()
+
+    _when_imported("scenario.scenario_executor", patch_scenario_executor)
+    _when_imported("scenario.batch_runner", patch_batch_runner)
+    # Record the usage of agent calls, see `ScenarioResult.timings`, patching
+    # litellm before the tests get to import its functions
+    _when_imported("litellm", patch_litellm)
 
 
 @pytest.hookimpl(trylast=True)
@@ -273,6 +397,7 @@ def pytest_unconfigure(config):
     Clean up pytest integration when pytest exits.
 
     This hook is called when pytest is shutting down and:
+    - Waits for the scenario events still being delivered in the background
     - Prints the final scenario test report
     - Restores the original ScenarioExecutor.run method
     - Cleans up any remaining resources
@@ -284,12 +409,25 @@ def pytest_unconfigure(config):
         This function runs automatically when pytest exits.
         Users don't need to call it directly.
     """
+    # Scenario runs don't wait for their events to be delivered, flush them
+    # once, if any scenario ran at all
+    event_bus = sys.modules.get("scenario._events.event_bus")
+    if event_bus is not None and not event_bus.flush_events(
+        timeout=event_bus.DEFAULT_FLUSH_TIMEOUT
+    ):
+        print(
+            colored(
+                f"Warning: {event_bus.pending_events()} scenario events were not delivered after {event_bus.DEFAULT_FLUSH_TIMEOUT:g}s",
+                "yellow",
+            )
+        )
+
     # Print the final report
     if hasattr(config, "_scenario_reporter"):
         config._scenario_reporter.print_report()
 
-    # Restore the original method
-    ScenarioExecutor.run = original_run
+    # Restore the original methods
+    _restore_patched_functions()
 
 
 @pytest.fixture
@@ -9,6 +9,7 @@ and judge agents to determine test success or failure.
 import json
 import sys
 from typing import (
+    Any,
     Awaitable,
     Callable,
     Dict,
@@ -23,8 +24,6 @@ from typing import (
 import time
 import warnings
 import termcolor
-import asyncio
-import concurrent.futures
 
 from scenario.config import ScenarioConfig
 from scenario._utils import (
@@ -35,6 +34,7 @@ from scenario._utils import (
     await_if_awaitable,
     get_batch_run_id,
     generate_scenario_run_id,
+    generate_message_id,
     SerializableWithStringFallback,
 )
 from openai.types.chat import (
@@ -43,24 +43,41 @@ from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
 )
 
-from .types import AgentInput, AgentRole, ChatCompletionMessageParamWithTrace, ScenarioResult, ScriptStep
+from .types import (
+    AgentCallTiming,
+    AgentInput,
+    AgentRole,
+    ChatCompletionMessageParamWithTrace,
+    ScenarioResult,
+    ScenarioTimings,
+    ScriptStep,
+)
 from ._error_messages import agent_response_not_awaitable
-from .cache import context_scenario
+from .cache import cache_key_config, context_scenario
+from ._cassette import scenario_cassette
+from ._timings import AgentCallRecorder, install_usage_patches, record_agent_call
+from ._budget import BudgetExceededError, SessionSpend, check_budgets
 from .agent_adapter import AgentAdapter
 from .script import proceed
 from pksuid import PKSUID
 from .scenario_state import ScenarioState
+from .scenario_runtime import ScenarioRuntime
 from ._events import (
     ScenarioEventBus,
     ScenarioEvent,
     ScenarioRunStartedEvent,
     ScenarioMessageSnapshotEvent,
+    ScenarioMessageDeltaEvent,
     ScenarioRunFinishedEvent,
     ScenarioRunStartedEventMetadata,
     ScenarioRunFinishedEventResults,
     ScenarioRunFinishedEventVerdict,
     ScenarioRunFinishedEventStatus,
-    convert_messages_to_api_client_messages,
+)
+from ._events.utils import (
+    MessageSnapshotBuilder,
+    get_full_snapshot_interval,
+    get_snapshot_mode,
 )
 from rx.subject.subject import Subject
 from rx.core.observable.observable import Observable
@@ -105,9 +122,11 @@ class ScenarioExecutor:
     _total_start_time: float
     _pending_messages: Dict[int, List[ChatCompletionMessageParam]]
 
-    _pending_roles_on_turn: List[AgentRole] = []
-    _pending_agents_on_turn: Set[AgentAdapter] = set()
-    _agent_times: Dict[int, float] = {}
+    _pending_roles_on_turn: List[AgentRole]
+    _pending_agents_on_turn: Set[AgentAdapter]
+    _agent_times: Dict[int, float]
+    _call_timings: List[AgentCallTiming]
+    _cache_key_config: Dict[str, Any]
     _events: Subject
     _trace: LangWatchTrace
 
@@ -127,6 +146,8 @@ class ScenarioExecutor:
         verbose: Optional[Union[bool, int]] = None,
         cache_key: Optional[str] = None,
         debug: Optional[bool] = None,
+        token_budget: Optional[int] = None,
+        cost_budget: Optional[float] = None,
         event_bus: Optional[ScenarioEventBus] = None,
         set_id: Optional[str] = None,
     ):
@@ -149,7 +170,12 @@ class ScenarioExecutor:
                       Overrides global configuration for this scenario.
             debug: Whether to enable debug mode with step-by-step execution.
                   Overrides global configuration for this scenario.
-            event_bus: Optional event bus that will subscribe to this executor's events
+            token_budget: Maximum number of LLM tokens the scenario may use before it's failed.
+                         Overrides global configuration for this scenario.
+            cost_budget: Maximum estimated LLM cost in USD of the scenario before it's failed.
+                        Overrides global configuration for this scenario.
+            event_bus: Optional event bus that will subscribe to this executor's events,
+                      defaults to the process-wide bus shared by all executors
             set_id: Optional set identifier for grouping related scenarios
         """
         self.name = name
@@ -163,17 +189,27 @@ class ScenarioExecutor:
             cache_key=cache_key,
             debug=debug,
             headless=None,
+            token_budget=token_budget,
+            cost_budget=cost_budget,
         )
         self.config = (ScenarioConfig.default_config or ScenarioConfig()).merge(config)
 
         self.batch_run_id = get_batch_run_id()
         self.scenario_set_id = set_id or "default"
 
+        # Keep all mutable execution state per instance, so that many executors
+        # can safely be interleaved as tasks on the same event loop
+        self._pending_messages = {}
+        self._pending_roles_on_turn = []
+        self._pending_agents_on_turn = set()
+        self._agent_times = {}
+        self._call_timings = []
+
         # Create executor's own event stream
         self._events = Subject()
 
-        # Create and configure event bus to subscribe to our events
-        self.event_bus = event_bus or ScenarioEventBus()
+        # Have the shared event bus, or the given one, subscribe to our events
+        self.event_bus = event_bus or ScenarioEventBus.get()
         self.event_bus.subscribe_to_events(self._events)
 
     @property
@@ -217,6 +253,13 @@ class ScenarioExecutor:
         self._pending_messages = {}
         self._total_start_time = time.time()
         self._agent_times = {}
+        self._call_timings = []
+        self._cache_key_config = cache_key_config(self.config)
+        self._message_ids: Set[str] = set()
+        self._message_snapshots = MessageSnapshotBuilder(
+            mode=get_snapshot_mode(),
+            full_snapshot_interval=get_full_snapshot_interval(),
+        )
 
         self._new_turn()
         self._state.current_turn = 0
@@ -233,6 +276,9 @@ class ScenarioExecutor:
         to other agents in their next call. It's used internally by the executor
         and can be called from script steps to inject custom messages.
 
+        Each message is stamped with a stable `id`, unless it already has one,
+        which identifies it across the message snapshots of the run.
+
         Args:
             message: OpenAI-compatible message to add to the conversation
             from_agent_idx: Index of the agent that generated this message.
@@ -261,6 +307,16 @@ class ScenarioExecutor:
             ```
         """
         message = cast(ChatCompletionMessageParamWithTrace, message)
+        message_id = message.get("id")
+        if message_id in self._message_ids:
+            # The same message object was added twice, give the copy its own id
+            message = cast(ChatCompletionMessageParamWithTrace, {**message})
+            message_id = None
+        if not message_id:
+            message_id = generate_message_id()
+            message["id"] = message_id
+        self._message_ids.add(message_id)
+
         message["trace_id"] = self._trace.trace_id
         self._state.messages.append(message)
 
@@ -406,8 +462,7 @@ class ScenarioExecutor:
                 return idx, agent
         return -1, None
 
-    def _reached_max_turns(self, error_message: Optional[str] = None) -> ScenarioResult:
-        # If we reached max turns without conclusion, fail the test
+    def _agent_time(self) -> float:
         agent_roles_agents_idx = [
             idx
             for idx, agent in enumerate(self.agents)
@@ -418,27 +473,51 @@ class ScenarioExecutor:
             for idx in agent_roles_agents_idx
             if idx in self._agent_times
         ]
-        agent_time = sum(agent_times)
+        return sum(agent_times)
 
+    def _reached_max_turns(self, error_message: Optional[str] = None) -> ScenarioResult:
+        # If we reached max turns without conclusion, fail the test
         return ScenarioResult(
             success=False,
             messages=self._state.messages,
             reasoning=error_message
             or f"Reached maximum turns ({self.config.max_turns or 10}) without conclusion",
             total_time=time.time() - self._total_start_time,
-            agent_time=agent_time,
+            agent_time=self._agent_time(),
+        )
+
+    def _budget_exceeded(self, error: BudgetExceededError) -> ScenarioResult:
+        # The criteria were never judged, fail the test with the exceeded budget
+        return ScenarioResult(
+            success=False,
+            messages=self._state.messages,
+            reasoning=str(error),
+            total_time=time.time() - self._total_start_time,
+            agent_time=self._agent_time(),
+            timings=self._timings(),
         )
 
     async def run(self) -> ScenarioResult:
         """
         Run a scenario against the agent under test.
 
+        When SCENARIO_RECORD_MODE is set, the LLM requests made during the run
+        are recorded to, or replayed from, the scenario's cassette.
+
         Args:
             context: Optional initial context for the agent
 
         Returns:
             ScenarioResult containing the test outcome
         """
+        # Patched before the cassette, so that replayed requests, which don't
+        # use any tokens, don't count towards the timings
+        install_usage_patches()
+
+        with scenario_cassette(self.name, self.description):
+            return await self._run()
+
+    async def _run(self) -> ScenarioResult:
         scenario_run_id = generate_scenario_run_id()
 
         try:
@@ -463,6 +542,7 @@ class ScenarioExecutor:
                         if result.success
                         else ScenarioRunFinishedEventStatus.FAILED
                     )
+                    result.timings = self._timings()
                     self._emit_run_finished_event(scenario_run_id, result, status)
                     return result
 
@@ -474,6 +554,7 @@ class ScenarioExecutor:
 - `scenario.succeed()` or `scenario.fail()` to end the test with an explicit result
                 """
             )
+            result.timings = self._timings()
 
             status = (
                 ScenarioRunFinishedEventStatus.SUCCESS
@@ -483,6 +564,13 @@ class ScenarioExecutor:
             self._emit_run_finished_event(scenario_run_id, result, status)
             return result
 
+        except BudgetExceededError as e:
+            result = self._budget_exceeded(e)
+            self._emit_run_finished_event(
+                scenario_run_id, result, ScenarioRunFinishedEventStatus.FAILED
+            )
+            return result
+
         except Exception as e:
             # Publish failure event before propagating the error
             error_result = ScenarioResult(
@@ -491,17 +579,31 @@ class ScenarioExecutor:
                 reasoning=f"Scenario failed with error: {str(e)}",
                 total_time=time.time() - self._total_start_time,
                 agent_time=0,
+                timings=self._timings(),
             )
             self._emit_run_finished_event(
                 scenario_run_id, error_result, ScenarioRunFinishedEventStatus.ERROR
             )
             raise  # Re-raise the exception after cleanup
 
+    def _timings(self) -> ScenarioTimings:
+        return ScenarioTimings(calls=list(self._call_timings))
+
     async def _call_agent(
         self, idx: int, role: AgentRole, request_judgment: bool = False
     ) -> Union[List[ChatCompletionMessageParam], ScenarioResult, None]:
         agent = self.agents[idx]
 
+        check_budgets(
+            self.config,
+            scenario_tokens=sum(
+                call.prompt_tokens + call.completion_tokens
+                for call in self._call_timings
+            ),
+            scenario_cost=sum(call.cost for call in self._call_timings),
+            session=SessionSpend.get(),
+        )
+
         if role == AgentRole.USER and self.config.debug:
             print(
                 f"\n{self._scenario_name()}{termcolor.colored('[Debug Mode]', 'yellow')} Press enter to continue or type a message to send"
@@ -521,84 +623,109 @@ class ScenarioExecutor:
                     ChatCompletionUserMessageParam(role="user", content=input_message)
                 ]
 
-        with self._trace.span(type="agent", name=f"{agent.__class__.__name__}.call") as span:
-            with show_spinner(
-                text=(
-                    "Judging..."
-                    if role == AgentRole.JUDGE
-                    else f"{role.value if isinstance(role, AgentRole) else role}:"
-                ),
-                color=(
-                    "blue"
-                    if role == AgentRole.AGENT
-                    else "green" if role == AgentRole.USER else "yellow"
-                ),
-                enabled=self.config.verbose,
-            ):
-                start_time = time.time()
-
-                # Prevent pydantic validation warnings which should already be disabled
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-
-                    self._trace.autotrack_litellm_calls(litellm)
-
-                    agent_response = agent.call(
-                        AgentInput(
-                            # TODO: test thread_id
-                            thread_id=self._state.thread_id,
-                            messages=cast(List[ChatCompletionMessageParam], self._state.messages),
-                            new_messages=self._pending_messages.get(idx, []),
-                            judgment_request=request_judgment,
-                            scenario_state=self._state,
-                        )
-                    )
-                if not isinstance(agent_response, Awaitable):
-                    raise Exception(
-                        agent_response_not_awaitable(agent.__class__.__name__),
+        call_started_at = time.perf_counter()
+        latency: Optional[float] = None
+        recorder: Optional[AgentCallRecorder] = None
+        try:
+            with self._trace.span(type="agent", name=f"{agent.__class__.__name__}.call") as span:
+                with show_spinner(
+                    text=(
+                        "Judging..."
+                        if role == AgentRole.JUDGE
+                        else f"{role.value if isinstance(role, AgentRole) else role}:"
+                    ),
+                    color=(
+                        "blue"
+                        if role == AgentRole.AGENT
+                        else "green" if role == AgentRole.USER else "yellow"
+                    ),
+                    enabled=self.config.verbose,
+                ):
+                    agent_input = AgentInput(
+                        # TODO: test thread_id
+                        thread_id=self._state.thread_id,
+                        messages=cast(List[ChatCompletionMessageParam], self._state.messages),
+                        new_messages=self._pending_messages.get(idx, []),
+                        judgment_request=request_judgment,
+                        scenario_state=self._state,
                     )
 
-                agent_response = await agent_response
-
-                if idx not in self._agent_times:
-                    self._agent_times[idx] = 0
-                self._agent_times[idx] += time.time() - start_time
+                    with record_agent_call() as recorder:
+                        # Prevent pydantic validation warnings which should already be disabled
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("ignore")
+
+                            self._trace.autotrack_litellm_calls(litellm)
+
+                            agent_response = agent.call(agent_input)
+                        if not isinstance(agent_response, Awaitable):
+                            raise Exception(
+                                agent_response_not_awaitable(agent.__class__.__name__),
+                            )
+
+                        agent_response = await agent_response
+
+                    latency = time.perf_counter() - recorder.started_at
+                    if idx not in self._agent_times:
+                        self._agent_times[idx] = 0
+                    self._agent_times[idx] += latency
+
+                    self._pending_messages[idx] = []
+                    check_valid_return_type(agent_response, agent.__class__.__name__)
+
+                    messages = []
+                    if isinstance(agent_response, ScenarioResult):
+                        # TODO: should be an event
+                        span.add_evaluation(
+                            name=f"{agent.__class__.__name__} Judgment",
+                            status="processed",
+                            passed=agent_response.success,
+                            details=agent_response.reasoning,
+                            score=(
+                                len(agent_response.passed_criteria)
+                                / len(agent_response.failed_criteria)
+                                if agent_response.failed_criteria
+                                else 1.0
+                            ),
+                        )
 
-                self._pending_messages[idx] = []
-                check_valid_return_type(agent_response, agent.__class__.__name__)
-
-                messages = []
-                if isinstance(agent_response, ScenarioResult):
-                    # TODO: should be an event
-                    span.add_evaluation(
-                        name=f"{agent.__class__.__name__} Judgment",
-                        status="processed",
-                        passed=agent_response.success,
-                        details=agent_response.reasoning,
-                        score=(
-                            len(agent_response.passed_criteria)
-                            / len(agent_response.failed_criteria)
-                            if agent_response.failed_criteria
-                            else 1.0
-                        ),
-                    )
+                        return agent_response
+                    else:
+                        messages = convert_agent_return_types_to_openai_messages(
+                            agent_response,
+                            role="user" if role == AgentRole.USER else "assistant",
+                        )
 
-                    return agent_response
-                else:
-                    messages = convert_agent_return_types_to_openai_messages(
-                        agent_response,
-                        role="user" if role == AgentRole.USER else "assistant",
-                    )
+                    self.add_messages(messages, from_agent_idx=idx)
 
-                self.add_messages(messages, from_agent_idx=idx)
+                    if messages and self.config.verbose:
+                        print_openai_messages(
+                            self._scenario_name(),
+                            [m for m in messages if m["role"] != "system"],
+                        )
 
-                if messages and self.config.verbose:
-                    print_openai_messages(
-                        self._scenario_name(),
-                        [m for m in messages if m["role"] != "system"],
+                    return messages
+        finally:
+            if recorder is not None:
+                SessionSpend.get().add(
+                    recorder.prompt_tokens + recorder.completion_tokens, recorder.cost
+                )
+            if recorder is not None and latency is not None:
+                self._call_timings.append(
+                    AgentCallTiming(
+                        turn=self._state.current_turn,
+                        role=role.value if isinstance(role, AgentRole) else str(role),
+                        agent=agent.__class__.__name__,
+                        latency=latency,
+                        time_to_first_response=recorder.time_to_first_response,
+                        framework_time=time.perf_counter() - call_started_at - latency,
+                        llm_calls=recorder.llm_calls,
+                        prompt_tokens=recorder.prompt_tokens,
+                        completion_tokens=recorder.completion_tokens,
+                        cost=recorder.cost,
+                        cache_hits=recorder.cache_hits,
                     )
-
-                return messages
+                )
 
     def _scenario_name(self):
         if self.config.verbose == 2:
@@ -824,13 +951,27 @@ class ScenarioExecutor:
         This event captures the current state of the conversation during
         scenario execution. It's published whenever messages are added to
         the conversation, allowing real-time tracking of scenario progress.
+
+        Only the messages appended since the previous snapshot are converted.
+        With SCENARIO_SNAPSHOT_MODE=delta, only those are sent as well, as a
+        ScenarioMessageDeltaEvent, with a periodic full snapshot in between.
         """
+        snapshot = self._message_snapshots.build(self._state.messages)
+        if snapshot is None:
+            return
+
+        messages, base_message_count = snapshot
         common_fields = self._create_common_event_fields(scenario_run_id)
 
-        event = ScenarioMessageSnapshotEvent(
-            **common_fields,
-            messages=convert_messages_to_api_client_messages(self._state.messages),
-        )
+        event: ScenarioMessageSnapshotEvent
+        if base_message_count is None:
+            event = ScenarioMessageSnapshotEvent(**common_fields, messages=messages)
+        else:
+            event = ScenarioMessageDeltaEvent(
+                **common_fields,
+                messages=messages,
+                base_message_count=base_message_count,
+            )
         self._emit_event(event)
 
     def _emit_run_finished_event(
@@ -886,13 +1027,15 @@ async def run(
     debug: Optional[bool] = None,
     script: Optional[List[ScriptStep]] = None,
     set_id: Optional[str] = None,
+    token_budget: Optional[int] = None,
+    cost_budget: Optional[float] = None,
 ) -> ScenarioResult:
     """
     High-level interface for running a scenario test.
 
     This is the main entry point for executing scenario tests. It creates a
-    ScenarioExecutor instance and runs it in an isolated thread pool to support
-    parallel execution and prevent blocking.
+    ScenarioExecutor instance and runs it on the shared ScenarioRuntime worker
+    threads to support parallel execution and prevent blocking.
 
     Args:
         name: Human-readable name for the scenario
@@ -904,6 +1047,8 @@ async def run(
         debug: Enable debug mode for step-by-step execution
         script: Optional script steps to control scenario flow
         set_id: Optional set identifier for grouping related scenarios
+        token_budget: Maximum number of LLM tokens the scenario may use before it's failed
+        cost_budget: Maximum estimated LLM cost in USD of the scenario before it's failed
 
     Returns:
         ScenarioResult containing the test outcome, conversation history,
@@ -959,27 +1104,17 @@ async def run(
         debug=debug,
         script=script,
         set_id=set_id,
+        token_budget=token_budget,
+        cost_budget=cost_budget,
     )
 
-    # We'll use a thread pool to run the execution logic, we
+    # We run the execution logic on the shared scenario runtime workers, we
     # require a separate thread because even though asyncio is
     # being used throughout, any user code on the callback can
-    # be blocking, preventing them from running scenarios in parallel
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-
-        def run_in_thread():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                return loop.run_until_complete(scenario.run())
-            finally:
-                scenario.event_bus.drain()
-                loop.close()
-
-        # Run the function in the thread pool and await its result
-        # This converts the thread's execution into a Future that the current
-        # event loop can await without blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(executor, run_in_thread)
-        return result
+    # be blocking, preventing them from running scenarios in parallel.
+    # The result is returned right away, while the events are still being
+    # delivered in the background, see `flush_events()`.
+    #
+    # The runtime converts the worker's execution into a Future that the current
+    # event loop can await without blocking
+    return await ScenarioRuntime.get().run(scenario.run)
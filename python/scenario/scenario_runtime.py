@@ -0,0 +1,262 @@
+"""
+Shared execution runtime for scenario runs.
+
+This module provides the ScenarioRuntime class, a process-wide pool of worker
+threads, each owning a persistent asyncio event loop, on top of which
+`scenario.run()` dispatches scenario executions. Reusing threads and loops
+avoids paying thread pool and event loop setup/teardown for every scenario,
+while still isolating potentially blocking user code from the caller's loop.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Awaitable, Callable, ClassVar, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+logger = logging.getLogger("scenario")
+
+
+def _default_max_workers() -> int:
+    """
+    Resolve the default worker pool size.
+
+    Can be customized via the SCENARIO_MAX_WORKERS environment variable,
+    otherwise scales with the number of CPUs, since scenarios are mostly
+    waiting on I/O rather than using the CPU.
+    """
+    env_value = os.environ.get("SCENARIO_MAX_WORKERS")
+    if env_value:
+        return max(1, int(env_value))
+    return max(32, (os.cpu_count() or 1) * 4)
+
+
+class ScenarioRuntime:
+    """
+    Process-wide pool of worker threads with persistent event loops.
+
+    Each worker thread creates its own event loop once, the first time it picks
+    up work, and keeps reusing it for every scenario it runs afterwards. The
+    pool is bounded, so when more scenarios are submitted than there are
+    workers, the extra ones wait in queue until a worker frees up.
+
+    Most users never interact with the runtime directly, `scenario.run()` uses
+    the default runtime automatically. It can be resized or shut down through
+    the class methods below.
+
+    Attributes:
+        max_workers: Maximum number of worker threads in the pool
+
+    Example:
+        ```
+        import scenario
+
+        # Allow up to 200 scenarios to run at the same time
+        scenario.ScenarioRuntime.configure(max_workers=200)
+
+        # Or run your own coroutines on the shared workers
+        runtime = scenario.ScenarioRuntime.get()
+        result = await runtime.run(lambda: my_async_function())
+        ```
+    """
+
+    max_workers: int
+
+    default_runtime: ClassVar[Optional["ScenarioRuntime"]] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize a scenario runtime.
+
+        Worker threads are only spawned as work is submitted, up to max_workers.
+
+        Args:
+            max_workers: Maximum number of worker threads. Defaults to the
+                        SCENARIO_MAX_WORKERS environment variable or a value
+                        derived from the number of CPUs.
+        """
+        self.max_workers = max_workers or _default_max_workers()
+
+        self._thread_local = threading.local()
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._loops_lock = threading.Lock()
+        self._is_shutdown = False
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="ScenarioRuntime-Worker",
+            initializer=self._init_worker,
+        )
+
+    def _init_worker(self) -> None:
+        """Create the persistent event loop owned by the current worker thread"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._thread_local.loop = loop
+        with self._loops_lock:
+            self._loops.append(loop)
+
+    def _current_worker_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return getattr(self._thread_local, "loop", None)
+
+    def _run_in_worker(self, coroutine_factory: Callable[[], Awaitable[T]]) -> T:
+        loop = self._current_worker_loop()
+        assert loop is not None, "ScenarioRuntime worker loop not initialized"
+
+        try:
+            return loop.run_until_complete(coroutine_factory())
+        finally:
+            self._cancel_leftover_tasks(loop)
+
+    def _cancel_leftover_tasks(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Cancel any task left behind by the finished run, so that it doesn't
+        leak into the next scenario scheduled on the same loop.
+        """
+        pending = asyncio.all_tasks(loop)
+        if not pending:
+            return
+
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    def submit(
+        self, coroutine_factory: Callable[[], Awaitable[T]]
+    ) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine to run on one of the worker loops.
+
+        Args:
+            coroutine_factory: Function returning the coroutine to run. It is
+                              called inside the worker thread, so the coroutine
+                              is created on the loop that will run it.
+
+        Returns:
+            A concurrent future resolving to the coroutine's return value
+
+        Raises:
+            RuntimeError: If the runtime has already been shut down
+        """
+        if self._is_shutdown:
+            raise RuntimeError("Cannot submit work to a ScenarioRuntime that was shut down")
+        return self._executor.submit(self._run_in_worker, coroutine_factory)
+
+    async def run(self, coroutine_factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a coroutine on one of the worker loops and await its result.
+
+        The caller's event loop is not blocked while the coroutine runs. When
+        called from inside a worker loop (for example a scenario running another
+        scenario), the coroutine is awaited inline instead, to avoid exhausting
+        the pool with workers waiting on each other.
+
+        Args:
+            coroutine_factory: Function returning the coroutine to run
+
+        Returns:
+            The return value of the coroutine
+        """
+        worker_loop = self._current_worker_loop()
+        if worker_loop is not None and worker_loop is asyncio.get_running_loop():
+            return await coroutine_factory()
+
+        return await asyncio.wrap_future(self.submit(coroutine_factory))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the worker pool.
+
+        The worker event loops are closed once the worker threads have exited,
+        in the background when not waiting for them.
+
+        Args:
+            wait: Whether to block until all running scenarios complete
+        """
+        if self._is_shutdown:
+            return
+        self._is_shutdown = True
+
+        logger.debug("Shutting down ScenarioRuntime")
+        if wait:
+            self._close_when_idle()
+        else:
+            self._executor.shutdown(wait=False)
+            threading.Thread(
+                target=self._close_when_idle,
+                name="ScenarioRuntime-Shutdown",
+                daemon=True,
+            ).start()
+
+    def _close_when_idle(self) -> None:
+        """Wait for the worker threads to exit, then close their event loops"""
+        self._executor.shutdown(wait=True)
+
+        with self._loops_lock:
+            loops, self._loops = self._loops, []
+        for loop in loops:
+            if not loop.is_closed():
+                loop.close()
+
+    @classmethod
+    def get(cls) -> "ScenarioRuntime":
+        """
+        Get the process-wide default runtime, creating it on first use.
+
+        Returns:
+            The default ScenarioRuntime instance
+        """
+        with cls._default_lock:
+            if cls.default_runtime is None or cls.default_runtime._is_shutdown:
+                cls.default_runtime = ScenarioRuntime()
+            return cls.default_runtime
+
+    @classmethod
+    def configure(cls, max_workers: Optional[int] = None) -> None:
+        """
+        Replace the process-wide default runtime with a new one.
+
+        Scenarios already running on the previous runtime are allowed to finish,
+        after which its worker loops are closed.
+
+        Args:
+            max_workers: Maximum number of scenarios executing at the same time
+
+        Example:
+            ```
+            import scenario
+
+            scenario.ScenarioRuntime.configure(max_workers=8)
+            ```
+        """
+        with cls._default_lock:
+            previous_runtime = cls.default_runtime
+            cls.default_runtime = ScenarioRuntime(max_workers=max_workers)
+
+        if previous_runtime is not None:
+            previous_runtime.shutdown(wait=False)
+
+    @classmethod
+    def shutdown_default(cls, wait: bool = True) -> None:
+        """
+        Shut down the process-wide default runtime, if one was started.
+
+        Called automatically at interpreter exit.
+
+        Args:
+            wait: Whether to block until all running scenarios complete
+        """
+        with cls._default_lock:
+            runtime, cls.default_runtime = cls.default_runtime, None
+
+        if runtime is not None:
+            runtime.shutdown(wait=wait)
+
+
+atexit.register(ScenarioRuntime.shutdown_default)
@@ -6,16 +6,23 @@ of a scenario execution, including conversation history, turn tracking, and
 utility methods for inspecting the conversation.
 """
 
-from typing import List, Optional, TYPE_CHECKING
+import hashlib
+import json
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
 from openai.types.chat import (
     ChatCompletionMessageParam,
     ChatCompletionMessageToolCallParam,
     ChatCompletionUserMessageParam,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from scenario.types import ChatCompletionMessageParamWithTrace
 from scenario.config import ScenarioConfig
+from scenario._utils.utils import (
+    SerializableWithStringFallback,
+    matches_fingerprint,
+    message_fingerprint,
+)
 
 if TYPE_CHECKING:
     from .scenario_executor import ScenarioExecutor
@@ -78,6 +85,16 @@ class ScenarioState(BaseModel):
 
     _executor: "ScenarioExecutor"
 
+    # Rolling hash chain over the messages, entry i being the digest of
+    # messages[0..i], extended lazily as new messages are appended, along with
+    # the message objects it was computed from and their fingerprints, to
+    # detect rewrites and changes in place
+    _messages_hash_chain: List[str] = PrivateAttr(default_factory=list)
+    _messages_hash_sources: List[Any] = PrivateAttr(default_factory=list)
+    _messages_hash_fingerprints: List[List[Tuple[str, Any]]] = PrivateAttr(
+        default_factory=list
+    )
+
     def add_message(self, message: ChatCompletionMessageParam):
         """
         Add a message to the conversation history.
@@ -205,3 +222,59 @@ class ScenarioState(BaseModel):
             ```
         """
         return self.last_tool_call(tool_name) is not None
+
+    def _messages_hash(self) -> str:
+        """
+        Get a digest of the whole conversation so far, for use in cache keys.
+
+        Each message is only hashed once, chained onto the digest of the messages
+        before it, so this costs O(1) per call as the conversation grows, instead
+        of re-serializing the whole history. Fields that differ between runs of
+        the same conversation, like `trace_id` and `id`, are left out.
+
+        Only the tail of the history is checked for changes: messages are walked
+        back from the last hashed one until one is found unchanged, see
+        `message_fingerprint()`, and the chain is rebuilt from there. Messages
+        popped from, replaced at or changed in place at the end of the history
+        are detected, while a message rewritten before an unchanged one isn't,
+        as the executor only ever appends to the history.
+
+        Returns:
+            Hex digest of the conversation messages
+        """
+        chain = self._messages_hash_chain
+        sources = self._messages_hash_sources
+        fingerprints = self._messages_hash_fingerprints
+
+        valid = min(len(chain), len(self.messages))
+        while valid > 0 and (
+            sources[valid - 1] is not self.messages[valid - 1]
+            or not matches_fingerprint(
+                self.messages[valid - 1], fingerprints[valid - 1]
+            )
+        ):
+            valid -= 1
+        if valid < len(chain):
+            # Messages were removed, replaced or changed, rebuild the chain from there
+            del chain[valid:]
+            del sources[valid:]
+            del fingerprints[valid:]
+
+        for message in self.messages[len(chain) :]:
+            previous = chain[-1] if chain else ""
+            content = json.dumps(
+                {
+                    key: value
+                    for key, value in message.items()
+                    if key not in ("trace_id", "id")
+                },
+                sort_keys=True,
+                cls=SerializableWithStringFallback,
+            )
+            chain.append(
+                hashlib.sha256(f"{previous}:{content}".encode("utf-8")).hexdigest()
+            )
+            sources.append(message)
+            fingerprints.append(message_fingerprint(message))
+
+        return chain[-1] if chain else ""
@@ -6,11 +6,13 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     List,
     Optional,
     TypeAlias,
     Union,
 )
+from typing_extensions import TypedDict
 
 from openai.types.chat import (
     ChatCompletionMessageParam,
@@ -36,33 +38,50 @@ else:
 # message types with the trace_id field
 
 
-class ChatCompletionDeveloperMessageParamWithTrace(ChatCompletionDeveloperMessageParam):
+class _MessageId(TypedDict, total=False):
+    # Stable id stamped on each message when added to the conversation
+    id: str
+
+
+class ChatCompletionDeveloperMessageParamWithTrace(
+    ChatCompletionDeveloperMessageParam, _MessageId
+):
     trace_id: Optional[str]
 
 
-class ChatCompletionSystemMessageParamWithTrace(ChatCompletionSystemMessageParam):
+class ChatCompletionSystemMessageParamWithTrace(
+    ChatCompletionSystemMessageParam, _MessageId
+):
     trace_id: Optional[str]
 
 
-class ChatCompletionUserMessageParamWithTrace(ChatCompletionUserMessageParam):
+class ChatCompletionUserMessageParamWithTrace(
+    ChatCompletionUserMessageParam, _MessageId
+):
     trace_id: Optional[str]
 
 
-class ChatCompletionAssistantMessageParamWithTrace(ChatCompletionAssistantMessageParam):
+class ChatCompletionAssistantMessageParamWithTrace(
+    ChatCompletionAssistantMessageParam, _MessageId
+):
     trace_id: Optional[str]
 
 
-class ChatCompletionToolMessageParamWithTrace(ChatCompletionToolMessageParam):
+class ChatCompletionToolMessageParamWithTrace(
+    ChatCompletionToolMessageParam, _MessageId
+):
     trace_id: Optional[str]
 
 
-class ChatCompletionFunctionMessageParamWithTrace(ChatCompletionFunctionMessageParam):
+class ChatCompletionFunctionMessageParamWithTrace(
+    ChatCompletionFunctionMessageParam, _MessageId
+):
     trace_id: Optional[str]
 
 
 """
 A wrapper around ChatCompletionMessageParam that adds a trace_id field to be able to
-tie back each message of the scenario run to a trace.
+tie back each message of the scenario run to a trace, and the message id.
 """
 ChatCompletionMessageParamWithTrace: TypeAlias = Union[
     ChatCompletionDeveloperMessageParamWithTrace,
@@ -182,6 +201,132 @@ class AgentInput(BaseModel):
         return content
 
 
+class AgentCallTiming(BaseModel):
+    """
+    Latency and usage of a single agent call made during a scenario run.
+
+    Attributes:
+        turn: Turn the call was made on
+        role: Role the agent was called for, "User", "Agent" or "Judge"
+        agent: Class name of the agent
+        latency: Time in seconds the agent took to respond
+        time_to_first_response: Time in seconds until the first complete LLM
+                                response of the call was received, None if it
+                                made no LLM call
+        framework_time: Time in seconds spent in scenario code around the
+                        call, preparing its input and processing its response
+        llm_calls: Number of litellm completions made during the call
+        prompt_tokens: Prompt tokens used by those completions
+        completion_tokens: Completion tokens used by those completions
+        cost: Estimated cost of those completions in USD
+        cache_hits: Number of cached calls served from the scenario cache
+    """
+
+    turn: int
+    role: str
+    agent: str
+    latency: float
+    time_to_first_response: Optional[float] = None
+    framework_time: float = 0.0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    cache_hits: int = 0
+
+
+def _percentile(values: List[float], percentile: float) -> Optional[float]:
+    """Linearly interpolated percentile of the values, None if there are none"""
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class TimingSummary(BaseModel):
+    """
+    Aggregated latency and usage of a group of agent calls.
+
+    Attributes:
+        calls: Number of agent calls
+        latency: Total time in seconds the agents took to respond
+        p50_latency: Median latency of a call
+        p95_latency: 95th percentile latency of a call
+        framework_time: Total time in seconds spent in scenario code around the calls
+        prompt_tokens: Total prompt tokens used
+        completion_tokens: Total completion tokens used
+        cost: Total estimated cost in USD
+        cache_hits: Total number of cached calls served from the scenario cache
+    """
+
+    calls: int = 0
+    latency: float = 0.0
+    p50_latency: Optional[float] = None
+    p95_latency: Optional[float] = None
+    framework_time: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+    cache_hits: int = 0
+
+    @classmethod
+    def of(cls, calls: List[AgentCallTiming]) -> "TimingSummary":
+        """Summarize a list of agent calls"""
+        latencies = [call.latency for call in calls]
+        return cls(
+            calls=len(calls),
+            latency=sum(latencies),
+            p50_latency=_percentile(latencies, 50),
+            p95_latency=_percentile(latencies, 95),
+            framework_time=sum(call.framework_time for call in calls),
+            prompt_tokens=sum(call.prompt_tokens for call in calls),
+            completion_tokens=sum(call.completion_tokens for call in calls),
+            cost=sum(call.cost for call in calls),
+            cache_hits=sum(call.cache_hits for call in calls),
+        )
+
+
+class ScenarioTimings(BaseModel):
+    """
+    Latency and usage of all the agent calls made during a scenario run,
+    broken down by turn and by role.
+
+    Attributes:
+        calls: Every agent call, in the order they were made
+
+    Example:
+        ```
+        result = await scenario.run(...)
+
+        for role, summary in result.timings.by_role().items():
+            print(f"{role}: p50 {summary.p50_latency:.2f}s, {summary.prompt_tokens} prompt tokens")
+        ```
+    """
+
+    calls: List[AgentCallTiming] = []
+
+    def by_role(self) -> Dict[str, TimingSummary]:
+        """Summary of the agent calls of each role"""
+        return {
+            role: TimingSummary.of([call for call in self.calls if call.role == role])
+            for role in dict.fromkeys(call.role for call in self.calls)
+        }
+
+    def by_turn(self) -> Dict[int, TimingSummary]:
+        """Summary of the agent calls of each turn"""
+        return {
+            turn: TimingSummary.of([call for call in self.calls if call.turn == turn])
+            for turn in dict.fromkeys(call.turn for call in self.calls)
+        }
+
+    def summary(self) -> TimingSummary:
+        """Summary of all the agent calls"""
+        return TimingSummary.of(self.calls)
+
+
 class ScenarioResult(BaseModel):
     """
     Represents the final result of a scenario test execution.
@@ -198,6 +343,7 @@ class ScenarioResult(BaseModel):
         failed_criteria: List of success criteria that were not satisfied
         total_time: Total execution time in seconds (if measured)
         agent_time: Time spent in agent calls in seconds (if measured)
+        timings: Latency and token usage of each agent call, by turn and by role (if measured)
 
     Example:
         ```
@@ -229,6 +375,7 @@ class ScenarioResult(BaseModel):
     failed_criteria: List[str] = []
     total_time: Optional[float] = None
     agent_time: Optional[float] = None
+    timings: Optional[ScenarioTimings] = None
 
     def __repr__(self) -> str:
         """
@@ -8,7 +8,7 @@ conversation history.
 """
 
 import logging
-from typing import Optional, cast
+from typing import Any, Dict, Optional, cast
 
 import litellm
 from litellm import Choices
@@ -168,6 +168,16 @@ class UserSimulatorAgent(AgentAdapter):
         if not hasattr(self, "model"):
             raise Exception(agent_not_configured_error_message("TestingAgent"))
 
+    def cache_identity(self) -> Dict[str, Any]:
+        return {
+            **super().cache_identity(),
+            "model": self.model,
+            "api_base": self.api_base,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "system_prompt": self.system_prompt,
+        }
+
     @scenario_cache()
     async def call(
         self,
@@ -229,7 +239,7 @@ Your goal (assistant) is to interact with the Agent Under Test (user) as if you
 
         response = cast(
             ModelResponse,
-            litellm.completion(
+            await litellm.acompletion(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
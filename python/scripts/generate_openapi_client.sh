@@ -4,8 +4,9 @@
 # This script:
 # 1. Generates the OpenAPI client using openapi-python-client
 # 2. Adds generated code markers and headers
-# 3. Updates documentation
-# 4. Installs the generated client
+# 3. Makes the models package import its models lazily
+# 4. Updates documentation
+# 5. Installs the generated client
 
 set -euo pipefail  # Exit on error, undefined vars, pipe failures
 
@@ -137,6 +138,13 @@ main() {
         add_generated_header "$init_file"
     fi
 
+    # Only import the models that are actually used
+    local models_init_file="${CLIENT_DIR}/lang_watch_api_client/models/__init__.py"
+    if [[ -f "$models_init_file" ]]; then
+        run_command "Making models imports lazy" \
+            "python scripts/make_models_init_lazy.py $models_init_file"
+    fi
+
     # Update README
     local readme_file="${CLIENT_DIR}/README.md"
     if [[ -f "$readme_file" ]]; then
@@ -0,0 +1,87 @@
+"""
+Rewrite the `models/__init__.py` of the generated API client to import its
+models lazily.
+
+openapi-python-client generates a `models/__init__.py` importing every single
+model module, well over a hundred of them, while scenario only uses a handful.
+This keeps the same public names, but only imports a model's module the first
+time the model is accessed, through a module level `__getattr__` (PEP 562).
+
+Usage:
+
+    python scripts/make_models_init_lazy.py path/to/lang_watch_api_client/models/__init__.py
+"""
+
+import ast
+import sys
+from typing import Dict
+
+
+TEMPLATE = '''"""Contains all the data models used in inputs/outputs"""
+
+# Models are imported lazily, on first access, see scripts/make_models_init_lazy.py
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{type_checking_imports}
+
+_MODEL_MODULES = {{
+{model_modules}
+}}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODEL_MODULES:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(_MODEL_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_MODEL_MODULES])
+
+
+__all__ = (
+{all_names}
+)
+'''
+
+
+def make_lazy(source: str) -> str:
+    tree = ast.parse(source)
+    if any(
+        isinstance(node, ast.Assign)
+        and any(isinstance(target, ast.Name) and target.id == "_MODEL_MODULES" for target in node.targets)
+        for node in tree.body
+    ):
+        # Already lazy
+        return source
+
+    model_modules: Dict[str, str] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+            for alias in node.names:
+                model_modules[alias.asname or alias.name] = f".{node.module}"
+
+    return TEMPLATE.format(
+        type_checking_imports="\n".join(
+            f"    from {module} import {name}" for name, module in model_modules.items()
+        ),
+        model_modules="\n".join(f'    "{name}": "{module}",' for name, module in model_modules.items()),
+        all_names="\n".join(f'    "{name}",' for name in model_modules),
+    )
+
+
+def main() -> None:
+    path = sys.argv[1]
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(make_lazy(source))
+
+
+if __name__ == "__main__":
+    main()
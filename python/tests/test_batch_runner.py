@@ -0,0 +1,281 @@
+import asyncio
+import os
+import threading
+import pytest
+
+import scenario
+from litellm import acompletion
+from scenario._budget import SessionSpend
+from scenario.cache import context_scenario
+from scenario.types import AgentInput, AgentReturnTypes, ScenarioResult
+
+
+class MockJudgeAgent(scenario.JudgeAgent):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:  # type: ignore
+        return ScenarioResult(
+            success=True,
+            messages=[],
+            reasoning=input.scenario_state.description,
+            passed_criteria=["test criteria"],
+        )
+
+
+class MockUserSimulatorAgent(scenario.UserSimulatorAgent):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:  # type: ignore
+        return "Hi, I'm a user"
+
+
+class SlowAgent(scenario.AgentAdapter):
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+    # Set once two calls ran at the same time
+    overlapped = threading.Event()
+
+    def __init__(self, delay: float = 0.0, wait_for_overlap: bool = False):
+        self.delay = delay
+        self.wait_for_overlap = wait_for_overlap
+
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        with SlowAgent.lock:
+            SlowAgent.running += 1
+            SlowAgent.max_running = max(SlowAgent.max_running, SlowAgent.running)
+            if SlowAgent.running >= 2:
+                SlowAgent.overlapped.set()
+        if self.wait_for_overlap:
+            # Hold the call until another one runs alongside it, or time out so
+            # that scenarios never running concurrently fail instead of hanging
+            await asyncio.to_thread(SlowAgent.overlapped.wait, 10)
+        await asyncio.sleep(self.delay)
+        with SlowAgent.lock:
+            SlowAgent.running -= 1
+        return "Hey, how can I help you?"
+
+
+class GatedAgent(scenario.AgentAdapter):
+    def __init__(self, gate: threading.Event):
+        self.gate = gate
+
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        # Only answers once the gate opens, or after a timeout so that a
+        # broken ordering fails the test instead of hanging it
+        await asyncio.to_thread(self.gate.wait, 10)
+        return "Hey, how can I help you?"
+
+
+class BrokenAgent(scenario.AgentAdapter):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        raise ValueError("agent exploded")
+
+
+def make_spec(description: str, agent: scenario.AgentAdapter) -> scenario.ScenarioSpec:
+    return {
+        "name": "batch test",
+        "description": description,
+        "agents": [
+            agent,
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+        "script": [scenario.user(), scenario.agent(), scenario.judge()],
+        "verbose": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_many_yields_a_result_per_spec():
+    specs = [make_spec(f"scenario {i}", SlowAgent()) for i in range(10)]
+
+    results = [result async for result in scenario.run_many(specs, max_concurrency=3)]
+
+    assert len(results) == 10
+    assert all(result.success for result in results)
+    assert sorted(result.reasoning or "" for result in results) == sorted(
+        f"scenario {i}" for i in range(10)
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_many_respects_max_concurrency():
+    SlowAgent.max_running = 0
+    SlowAgent.overlapped.clear()
+    specs = [
+        make_spec(f"scenario {i}", SlowAgent(delay=0.01, wait_for_overlap=True))
+        for i in range(8)
+    ]
+
+    results = [result async for result in scenario.run_many(specs, max_concurrency=2)]
+
+    assert len(results) == 8
+    assert SlowAgent.overlapped.is_set()
+    assert SlowAgent.max_running <= 2
+
+
+@pytest.mark.asyncio
+async def test_run_many_streams_results_in_completion_order():
+    # The slow scenario can only complete once the fast one has been streamed
+    gate = threading.Event()
+    specs = [
+        make_spec("slow", GatedAgent(gate)),
+        make_spec("fast", SlowAgent()),
+    ]
+
+    results = []
+    async for result in scenario.run_many(specs, max_concurrency=2):
+        results.append(result)
+        gate.set()
+
+    assert [result.reasoning for result in results] == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_run_many_reports_errors_as_failed_results():
+    specs = [
+        make_spec("broken", BrokenAgent()),
+        make_spec("fine", SlowAgent()),
+    ]
+
+    results = [result async for result in scenario.run_many(specs)]
+
+    assert len(results) == 2
+    failed = [result for result in results if not result.success]
+    assert len(failed) == 1
+    assert "agent exploded" in (failed[0].reasoning or "")
+
+
+class ProcessIdAgent(scenario.AgentAdapter):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        return f"Hello from process {os.getpid()}"
+
+
+class TranscriptJudgeAgent(scenario.JudgeAgent):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:  # type: ignore
+        return ScenarioResult(
+            success=True,
+            messages=input.scenario_state.messages,
+            reasoning="test reasoning",
+            passed_criteria=["test criteria"],
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_many_in_process_mode_runs_on_worker_processes(scenario_reporter):
+    specs: list[scenario.ScenarioSpec] = [
+        {
+            "name": f"process test {i}",
+            "description": f"scenario {i}",
+            "agents": [
+                ProcessIdAgent(),
+                MockUserSimulatorAgent(model="none"),
+                TranscriptJudgeAgent(model="none", criteria=["test criteria"]),
+            ],
+            "verbose": False,
+        }
+        for i in range(4)
+    ]
+    reported_before = len(scenario_reporter.results)
+
+    results = [
+        result
+        async for result in scenario.run_many(specs, mode="process", max_processes=2)
+    ]
+
+    assert len(results) == 4
+    assert all(result.success for result in results)
+
+    agent_pids = {
+        message.get("content")
+        for result in results
+        for message in result.messages
+        if message["role"] == "assistant"
+    }
+    assert f"Hello from process {os.getpid()}" not in agent_pids
+    assert 1 <= len(agent_pids) <= 2
+
+    remote_results = scenario_reporter.results[reported_before:]
+    assert sorted(item["name"] for item in remote_results) == sorted(
+        spec["name"] for spec in specs
+    )
+    assert all(item["scenario"] is None for item in remote_results)
+
+
+class ImportedCompletionAgent(scenario.AgentAdapter):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        response = await acompletion(
+            model="openai/gpt-4o-mini",
+            messages=input.messages,
+            mock_response="Hey, how can I help you?",
+        )
+        return response.choices[0].message.content  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_run_many_in_process_mode_adds_up_the_session_spend(monkeypatch):
+    spend = SessionSpend()
+    monkeypatch.setattr(SessionSpend, "default_spend", spend)
+    specs: list[scenario.ScenarioSpec] = [
+        {
+            "name": "process spend test",
+            "description": f"scenario {i}",
+            "agents": [
+                ImportedCompletionAgent(),
+                MockUserSimulatorAgent(model="none"),
+                TranscriptJudgeAgent(model="none", criteria=["test criteria"]),
+            ],
+            "verbose": False,
+        }
+        for i in range(2)
+    ]
+
+    results = [
+        result
+        async for result in scenario.run_many(specs, mode="process", max_processes=2)
+    ]
+
+    summaries = [result.timings.summary() for result in results if result.timings]
+    assert len(summaries) == 2
+    assert spend.tokens > 0
+    assert spend.tokens == sum(
+        summary.prompt_tokens + summary.completion_tokens for summary in summaries
+    )
+
+
+class CacheContextAgent(scenario.AgentAdapter):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        await asyncio.sleep(0.05)
+        # The executor tracked by the cache must be this task's own scenario
+        executor = context_scenario.get()
+        return f"{threading.get_ident()}:{executor._state.description}"
+
+
+@pytest.mark.asyncio
+async def test_run_many_in_loop_mode_runs_tasks_on_the_current_loop():
+    specs: list[scenario.ScenarioSpec] = [
+        {
+            "name": "loop test",
+            "description": f"scenario {i}",
+            "agents": [
+                CacheContextAgent(),
+                MockUserSimulatorAgent(model="none"),
+                TranscriptJudgeAgent(model="none", criteria=["test criteria"]),
+            ],
+            "script": [scenario.user(), scenario.agent(), scenario.judge()],
+            "verbose": False,
+        }
+        for i in range(50)
+    ]
+
+    results = [
+        result async for result in scenario.run_many(specs, mode="loop")
+    ]
+
+    assert len(results) == 50
+    replies = [
+        str(message.get("content"))
+        for result in results
+        for message in result.messages
+        if message["role"] == "assistant"
+    ]
+    assert sorted(replies) == sorted(
+        f"{threading.get_ident()}:scenario {i}" for i in range(50)
+    )
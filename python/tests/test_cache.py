@@ -0,0 +1,505 @@
+import asyncio
+import json
+import sys
+import time
+from typing import List, cast
+import pytest
+
+import scenario
+from scenario.cache import (
+    CACHE_KEY_SCHEMA_VERSION,
+    get_cache,
+    get_cache_backend,
+    resolve_cache_key,
+    set_cache_backend,
+)
+from scenario._cache import MemoryCacheBackend, SQLiteCacheBackend
+from scenario.config import ScenarioConfig
+from scenario.judge_agent import JudgeAgent
+from scenario.scenario_executor import ScenarioExecutor
+from scenario.types import AgentInput, AgentReturnTypes, ChatCompletionMessageParam
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"))
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def scenario_with_cache(backend):
+    set_cache_backend(backend)
+
+    executor = ScenarioExecutor(
+        name="cache test",
+        description="test description",
+        agents=[],
+        cache_key="cache-test-v1",
+    )
+    executor.reset()
+
+    yield executor
+
+    set_cache_backend(get_cache())
+
+
+def test_sqlite_backend_stores_and_clears_entries(backend):
+    assert backend.get("missing") is None
+
+    backend.set("key", b"value")
+    backend.set("key", b"new value")
+
+    assert backend.get("key") == b"new value"
+    assert backend.total_size() == len(b"new value")
+
+    backend.clear()
+
+    assert backend.get("key") is None
+    assert backend.total_size() == 0
+
+
+def test_sqlite_backend_evicts_least_recently_used_entries(tmp_path):
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"), max_size_bytes=300)
+
+    for i in range(3):
+        backend.set(f"key {i}", b"x" * 100)
+    # Make key 0 the most recently used entry
+    backend._connection().execute(
+        "UPDATE entries SET accessed_at = ? WHERE key = 'key 0'", (time.time() + 1000,)
+    )
+    backend.set("key 3", b"x" * 100)
+
+    assert backend.total_size() <= 300
+    assert backend.get("key 0") is not None
+    assert backend.get("key 1") is None
+    assert backend.get("key 3") is not None
+    backend.close()
+
+
+def test_sqlite_backend_expires_entries_after_ttl(tmp_path):
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+
+    backend.set("key", b"value")
+    assert backend.get("key") == b"value"
+
+    backend._connection().execute(
+        "UPDATE entries SET created_at = ?", (time.time() - 120,)
+    )
+
+    assert backend.get("key") is None
+    assert backend.total_size() == 0
+    backend.close()
+
+
+def test_cache_is_disabled_with_empty_cache_dir(monkeypatch):
+    monkeypatch.setenv("SCENARIO_CACHE_DIR", "")
+
+    assert get_cache() is None
+
+
+@pytest.fixture
+def lazy_cache_backend(monkeypatch):
+    # scenario.cache is shadowed by the decorator on the scenario package
+    scenario_cache_module = sys.modules["scenario.cache"]
+    monkeypatch.setattr(ScenarioConfig, "default_config", None)
+    monkeypatch.setattr(scenario_cache_module, "_cache_backend", None)
+    monkeypatch.setattr(scenario_cache_module, "_cache_backend_settings", None)
+    yield
+    backend = scenario_cache_module._cache_backend
+    if backend is not None:
+        backend.close()
+
+
+def test_cache_backend_is_only_created_on_first_cached_call(
+    monkeypatch, tmp_path, lazy_cache_backend
+):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("SCENARIO_CACHE_DIR", str(cache_dir))
+
+    executor = ScenarioExecutor(
+        name="cache test", description="test description", agents=[]
+    )
+    executor.reset()
+
+    @scenario.cache()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    assert add(1, 2) == 3
+    assert not cache_dir.exists()
+
+    executor.config.cache_key = "cache-test-v1"
+    assert add(1, 2) == 3
+    assert (cache_dir / "cache.sqlite3").exists()
+
+
+def test_configure_recreates_the_cache_backend(tmp_path, lazy_cache_backend):
+    scenario.configure(cache_dir=str(tmp_path / "first"), cache_memory_size=0)
+    first_backend = get_cache_backend()
+
+    assert isinstance(first_backend, SQLiteCacheBackend)
+    assert get_cache_backend() is first_backend
+
+    scenario.configure(cache_dir=str(tmp_path / "second"))
+    second_backend = get_cache_backend()
+
+    assert isinstance(second_backend, SQLiteCacheBackend)
+    assert second_backend is not first_backend
+    assert (tmp_path / "second" / "cache.sqlite3").exists()
+
+    scenario.configure(cache_dir="")
+
+    assert get_cache_backend() is None
+
+
+def test_cached_function_is_only_called_once(scenario_with_cache, backend):
+    calls = []
+
+    @scenario.cache()
+    def add(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    assert add(1, 2) == 3
+    assert add(1, 2) == 3
+    assert add(2, 2) == 4
+
+    assert calls == [(1, 2), (2, 2)]
+
+
+@pytest.mark.asyncio
+async def test_cached_async_function_is_only_called_once(scenario_with_cache, backend):
+    calls = []
+
+    @scenario.cache()
+    async def greet(name: str) -> dict:
+        calls.append(name)
+        return {"role": "assistant", "content": f"Hello {name}"}
+
+    assert await greet("Alice") == {"role": "assistant", "content": "Hello Alice"}
+    assert await greet("Alice") == {"role": "assistant", "content": "Hello Alice"}
+
+    assert calls == ["Alice"]
+
+
+def test_messages_hash_is_extended_as_messages_are_appended(scenario_with_cache):
+    state = scenario_with_cache._state
+    assert state._messages_hash() == ""
+
+    scenario_with_cache.add_message({"role": "user", "content": "Hello"})
+    first_hash = state._messages_hash()
+    scenario_with_cache.add_message({"role": "assistant", "content": "Hi!"})
+
+    assert state._messages_hash() != first_hash
+    assert state._messages_hash_chain[0] == first_hash
+    assert len(state._messages_hash_chain) == 2
+
+
+def test_agent_input_cache_key_ignores_thread_and_trace_ids(scenario_with_cache):
+    calls = []
+
+    class EchoAgent(scenario.AgentAdapter):
+        @scenario.cache()
+        async def call(self, input: AgentInput) -> AgentReturnTypes:  # type: ignore
+            calls.append(input.thread_id)
+            return f"You said: {input.last_new_user_message_str()}"
+
+    async def run_once():
+        executor = ScenarioExecutor(
+            name="cache test",
+            description="test description",
+            agents=[],
+            cache_key="cache-test-v1",
+        )
+        executor.reset()
+        executor.add_message({"role": "user", "content": "Hello"})
+        state = executor._state
+        return await EchoAgent().call(
+            AgentInput(
+                thread_id=state.thread_id,
+                messages=cast(List[ChatCompletionMessageParam], state.messages),
+                new_messages=cast(List[ChatCompletionMessageParam], state.messages),
+                scenario_state=state,
+            )
+        )
+
+    first = asyncio.run(run_once())
+    second = asyncio.run(run_once())
+
+    assert first == second == "You said: Hello"
+    assert len(calls) == 1
+
+
+def test_cache_key_ignores_presentation_only_config(scenario_with_cache):
+    def complete(message: str) -> str:
+        return message
+
+    def resolve(**config):
+        executor = ScenarioExecutor(
+            name="cache test",
+            description="test description",
+            agents=[],
+            cache_key="cache-test-v1",
+            **config,
+        )
+        executor.reset()
+        digest, components = resolve_cache_key(
+            executor, complete, None, ("hello",), {}
+        )
+        return digest, components
+
+    quiet_digest, components = resolve(verbose=False, debug=False)
+    verbose_digest, _ = resolve(verbose=True, debug=True)
+    longer_digest, _ = resolve(verbose=False, max_turns=42)
+
+    assert quiet_digest == verbose_digest
+    assert quiet_digest != longer_digest
+    assert components["version"] == CACHE_KEY_SCHEMA_VERSION
+    assert components["args"] == {"message": "hello"}
+    assert "verbose" not in components["config"]
+
+
+def test_cache_key_includes_agent_identity_without_api_key(scenario_with_cache):
+    polite_judge = JudgeAgent(
+        model="openai/gpt-4.1-mini", api_key="secret", criteria=["Agent is polite"]
+    )
+    brief_judge = JudgeAgent(
+        model="openai/gpt-4.1-mini", api_key="secret", criteria=["Agent is brief"]
+    )
+
+    polite_digest, components = resolve_cache_key(
+        scenario_with_cache, polite_judge.call, polite_judge, (), {}
+    )
+    brief_digest, _ = resolve_cache_key(
+        scenario_with_cache, brief_judge.call, brief_judge, (), {}
+    )
+
+    assert polite_digest != brief_digest
+    assert components["agent"]["criteria"] == ["Agent is polite"]
+    assert "secret" not in json.dumps(components)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_are_coalesced(scenario_with_cache):
+    calls = []
+
+    @scenario.cache()
+    async def complete(prompt: str) -> dict:
+        calls.append(prompt)
+        await asyncio.sleep(0.05)
+        return {"role": "assistant", "content": f"Answer to {prompt}"}
+
+    results = await asyncio.gather(*[complete("same prompt") for _ in range(10)])
+
+    assert calls == ["same prompt"]
+    assert all(
+        result == {"role": "assistant", "content": "Answer to same prompt"}
+        for result in results
+    )
+    # Every caller gets its own copy of the result
+    assert len({id(result) for result in results}) == 10
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_copy_unpicklable_results(scenario_with_cache):
+    @scenario.cache()
+    async def complete(prompt: str) -> dict:
+        await asyncio.sleep(0.05)
+        # Lambdas can't be pickled, so this is never stored in the cache
+        return {"content": f"Answer to {prompt}", "on_read": lambda: None}
+
+    results = await asyncio.gather(*[complete("same prompt") for _ in range(3)])
+
+    assert [result["content"] for result in results] == ["Answer to same prompt"] * 3
+    assert len({id(result) for result in results}) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_calls_share_the_error(scenario_with_cache):
+    calls = []
+
+    @scenario.cache()
+    async def complete(prompt: str) -> str:
+        calls.append(prompt)
+        await asyncio.sleep(0.05)
+        raise ValueError("provider is down")
+
+    results = await asyncio.gather(
+        *[complete("same prompt") for _ in range(3)], return_exceptions=True
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_memory_tier_serves_repeated_lookups_and_writes_through(backend):
+    memory = MemoryCacheBackend(backend=backend, max_entries=2)
+
+    memory.set("key 0", b"value 0")
+    assert backend.get("key 0") == b"value 0"
+
+    assert memory.get("key 0") == b"value 0"
+    assert memory.get("missing") is None
+
+    memory.set("key 1", b"value 1")
+    memory.set("key 2", b"value 2")
+    # key 0 was evicted from memory, but is still served by the backend
+    assert memory.get("key 0") == b"value 0"
+
+    assert memory.stats() == {
+        "hits": 1,
+        "backend_hits": 1,
+        "misses": 1,
+        "entries": 2,
+        "size_bytes": len(b"value 0") + len(b"value 2"),
+    }
+
+
+def test_memory_tier_is_bounded_by_bytes():
+    memory = MemoryCacheBackend(max_size_bytes=10)
+
+    memory.set("small", b"12345")
+    memory.set("other", b"67890")
+    memory.set("large", b"x" * 20)
+    memory.set("last", b"abc")
+
+    assert memory.get("large") is None
+    assert memory.get("small") is None
+    assert memory.get("other") == b"67890"
+    assert memory.stats()["size_bytes"] == 8
+
+
+def test_memory_tier_keeps_values_set_while_reading_the_backend(backend):
+    memory = MemoryCacheBackend(backend=backend)
+    backend.set("key", b"stale")
+    get_entry = backend.get_entry
+
+    def get_entry_racing_a_set(key):
+        entry = get_entry(key)
+        memory.set(key, b"fresh")
+        return entry
+
+    backend.get_entry = get_entry_racing_a_set
+
+    assert memory.get("key") == b"fresh"
+    assert memory.get("key") == b"fresh"
+
+
+def test_memory_tier_expires_entries_after_ttl(tmp_path, monkeypatch):
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+    memory = MemoryCacheBackend(backend=backend, ttl_seconds=60)
+    # Only read through the memory tier, keeping the expiry of the backend entry
+    reader = MemoryCacheBackend(backend=backend)
+
+    memory.set("key", b"value")
+    assert memory.get("key") == b"value"
+    assert reader.get("key") == b"value"
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+
+    assert memory.get("key") is None
+    assert reader.get("key") is None
+    assert memory.stats()["entries"] == 0
+    backend.close()
+
+
+def test_messages_hash_is_rebuilt_when_messages_are_replaced(scenario_with_cache):
+    state = scenario_with_cache._state
+    scenario_with_cache.add_message({"role": "user", "content": "Hello"})
+    scenario_with_cache.add_message({"role": "assistant", "content": "Hi!"})
+    original_hash = state._messages_hash()
+
+    state.messages.pop()
+    scenario_with_cache.add_message({"role": "assistant", "content": "Go away"})
+    replaced_hash = state._messages_hash()
+
+    state.messages[-1] = {"role": "assistant", "content": "Goodbye"}
+    rewritten_hash = state._messages_hash()
+
+    state.messages[-1]["content"] = "Come back"
+
+    assert replaced_hash != original_hash
+    assert rewritten_hash not in (original_hash, replaced_hash)
+    assert state._messages_hash() not in (original_hash, replaced_hash, rewritten_hash)
+
+
+def test_cache_key_includes_keyword_arguments(scenario_with_cache):
+    def complete(prompt: str, temperature: float = 0.0) -> str:
+        return prompt
+
+    def resolve(*args, **kwargs):
+        digest, _ = resolve_cache_key(scenario_with_cache, complete, None, args, kwargs)
+        return digest
+
+    assert resolve("hello") != resolve("hello", temperature=1.0)
+    assert resolve("hello", temperature=1.0) == resolve("hello", 1.0)
+    assert resolve("hello") == resolve(prompt="hello", temperature=0.0)
+
+
+def test_sqlite_backend_closes_the_connections_of_exited_threads(tmp_path):
+    import sqlite3
+    import threading
+
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"))
+    connections = []
+
+    def use_backend():
+        backend.set("key", b"value")
+        connections.append(backend._connection())
+
+    thread = threading.Thread(target=use_backend)
+    thread.start()
+    thread.join()
+    connections.append(backend._connection())
+
+    backend.close()
+
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+    # The backend opens new connections when used after being closed
+    assert backend.get("key") == b"value"
+    backend.close()
+
+
+def test_sqlite_backend_close_leaves_running_threads_connections_open(tmp_path):
+    import threading
+
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"))
+    backend.set("key", b"value")
+    opened = threading.Event()
+    closed = threading.Event()
+    values = []
+
+    def use_backend():
+        values.append(backend.get("key"))
+        opened.set()
+        closed.wait(timeout=5.0)
+        values.append(backend.get("key"))
+
+    thread = threading.Thread(target=use_backend)
+    thread.start()
+    opened.wait(timeout=5.0)
+    backend.close()
+    closed.set()
+    thread.join()
+
+    assert values == [b"value", b"value"]
+    backend.close()
+
+
+def test_sqlite_backend_closes_its_connections_once_garbage_collected(tmp_path):
+    import gc
+    import sqlite3
+
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"))
+    backend.set("key", b"value")
+    connection = backend._connection()
+
+    del backend
+    gc.collect()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+import httpx
+import litellm
+import pytest
+import respx
+from litellm.types.utils import ModelResponse
+from openai import AsyncOpenAI
+from typing import cast
+
+from scenario._cassette import (
+    Cassette,
+    cassette_path,
+    install_cassette_patches,
+    scenario_cassette,
+)
+
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-recorded",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "Recorded answer"},
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+}
+
+
+@pytest.fixture
+def cassette_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCENARIO_CASSETTE_DIR", str(tmp_path))
+    return tmp_path
+
+
+async def ask_litellm(content: str = "Hello") -> ModelResponse:
+    response = await litellm.acompletion(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": content, "trace_id": "random"}],
+        mock_response="Recorded answer",
+    )
+    return cast(ModelResponse, response)
+
+
+@pytest.mark.asyncio
+async def test_replays_recorded_litellm_responses(cassette_dir, monkeypatch):
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "record")
+    with scenario_cassette("cassette test", "description"):
+        recorded = await ask_litellm()
+
+    with open(cassette_path("cassette test", "description")) as f:
+        lines = f.read().splitlines()
+    assert json.loads(lines[0]) == {"version": 1}
+    assert len(lines) == 2
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "replay")
+    with scenario_cassette("cassette test", "description"):
+        replayed = await ask_litellm()
+
+    # litellm generates a new id on every call, so the same id means it was replayed
+    assert replayed.id == recorded.id
+    assert replayed.choices[0].message.content == "Recorded answer"  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_replay_fails_on_unrecorded_requests(cassette_dir, monkeypatch):
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "replay")
+
+    with pytest.raises(Exception, match="not found in the cassette"):
+        with scenario_cassette("cassette test", "description"):
+            await ask_litellm("Never recorded")
+
+
+@pytest.mark.asyncio
+async def test_new_episodes_appends_unrecorded_requests(cassette_dir, monkeypatch):
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "record")
+    with scenario_cassette("cassette test", "description"):
+        first = await ask_litellm("First")
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "new_episodes")
+    with scenario_cassette("cassette test", "description"):
+        assert (await ask_litellm("First")).id == first.id
+        second = await ask_litellm("Second")
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "replay")
+    with scenario_cassette("cassette test", "description"):
+        assert (await ask_litellm("First")).id == first.id
+        assert (await ask_litellm("Second")).id == second.id
+
+
+@pytest.mark.asyncio
+async def test_replays_requests_with_positional_messages(cassette_dir, monkeypatch):
+    def ask(trace_id: str) -> ModelResponse:
+        response = litellm.completion(
+            "gpt-4o-mini",
+            [{"role": "user", "content": "Hello", "trace_id": trace_id}],
+            mock_response="Recorded answer",
+        )
+        return cast(ModelResponse, response)
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "record")
+    with scenario_cassette("positional test", "description"):
+        recorded = ask("first run")
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "replay")
+    with scenario_cassette("positional test", "description"):
+        assert ask("second run").id == recorded.id
+
+
+@pytest.mark.asyncio
+async def test_replay_stops_requests_bypassing_the_cassette(cassette_dir, monkeypatch):
+    install_cassette_patches()
+    # As if imported with `from litellm import acompletion` before any scenario ran
+    acompletion = getattr(
+        litellm.acompletion, "_scenario_cassette_original", litellm.acompletion
+    )
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "replay")
+    with respx.mock as mock:
+        route = mock.post("https://api.anthropic.com/v1/messages")
+        with pytest.raises(Exception, match="without going through the cassette"):
+            with scenario_cassette("escape test", "description"):
+                await acompletion(
+                    model="anthropic/claude-3-5-haiku-latest",
+                    messages=[{"role": "user", "content": "Hello"}],
+                    api_key="test-key",
+                )
+        assert route.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_records_openai_client_requests_once(cassette_dir, monkeypatch):
+    # Make litellm go through httpx, so the requests are seen by respx
+    monkeypatch.setattr(litellm, "disable_aiohttp_transport", True)
+    client = AsyncOpenAI(api_key="test-key")
+    messages = [{"role": "user", "content": "Hello"}]
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "record")
+    with respx.mock as mock:
+        route = mock.post("https://api.openai.com/v1/chat/completions").mock(
+            return_value=httpx.Response(200, json=CHAT_COMPLETION)
+        )
+        with scenario_cassette("openai test", "description"):
+            await client.chat.completions.create(
+                model="gpt-4o-mini", messages=messages  # type: ignore
+            )
+            await litellm.acompletion(
+                model="openai/gpt-4o-mini", messages=messages, api_key="test-key"
+            )
+        assert route.call_count == 2
+
+    with open(cassette_path("openai test", "description")) as f:
+        interactions = [json.loads(line) for line in f.read().splitlines()[1:]]
+    assert [interaction["type"] for interaction in interactions] == [
+        "openai",
+        "litellm",
+    ]
+
+    monkeypatch.setenv("SCENARIO_RECORD_MODE", "replay")
+    with respx.mock as mock:
+        route = mock.post("https://api.openai.com/v1/chat/completions")
+        with scenario_cassette("openai test", "description"):
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini", messages=messages  # type: ignore
+            )
+        assert route.call_count == 0
+
+    assert response.id == "chatcmpl-recorded"
+    assert response.choices[0].message.content == "Recorded answer"
+
+
+def test_concurrent_saves_of_the_same_cassette_dont_fail(cassette_dir):
+    path = cassette_path("concurrent test", "description")
+    cassettes = [Cassette(path, "record") for _ in range(4)]
+    for i, cassette in enumerate(cassettes):
+        cassette.record(f"request {i}", "litellm", "gpt-4o-mini", {"id": i})
+
+    def save_repeatedly(cassette: Cassette):
+        for _ in range(20):
+            cassette.save()
+
+    threads = [
+        threading.Thread(target=save_repeatedly, args=(cassette,))
+        for cassette in cassettes
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert os.listdir(cassette_dir) == [os.path.basename(path)]
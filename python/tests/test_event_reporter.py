@@ -1,3 +1,4 @@
+import httpx
 import pytest
 import respx
 import logging
@@ -53,3 +54,73 @@ async def test_post_event_sends_correct_request(caplog: LogCaptureFixture) -> No
         )
         # Check logs for success
         assert any("POST response status: 200" in m for m in caplog.messages)
+
+
+@pytest.mark.asyncio
+async def test_post_event_reuses_pooled_client() -> None:
+    endpoint = "https://app.langwatch.ai"
+    reporter = EventReporter(endpoint=endpoint, api_key="test-api-key")
+
+    event = ScenarioRunStartedEvent(
+        batch_run_id="batch-1",
+        scenario_id="scenario-1",
+        scenario_run_id="run-1",
+        metadata=ScenarioRunStartedEventMetadata(
+            name="test-name",
+            description="test-description",
+        ),
+        timestamp=int(time.time() * 1000),
+    )
+
+    with respx.mock as mock:
+        route = mock.post(f"{endpoint}/api/scenario-events").respond(
+            200, json={"ok": True}
+        )
+
+        await reporter.post_event(event)
+        client = reporter._client
+        await reporter.post_event(event)
+
+        assert route.call_count == 2
+        assert client is not None
+        assert reporter._client is client
+
+    await reporter.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "bus_kwargs, expected",
+    [({}, 20), ({"max_connections": 5}, 5), ({"env": "7"}, 7), ({"config": 9}, 9)],
+)
+async def test_event_bus_sizes_the_connection_pool(
+    monkeypatch: pytest.MonkeyPatch, bus_kwargs: dict, expected: int
+) -> None:
+    from scenario._events.event_bus import ScenarioEventBus
+    from scenario.config import ScenarioConfig
+
+    monkeypatch.delenv("SCENARIO_EVENTS_MAX_CONNECTIONS", raising=False)
+    monkeypatch.setattr(ScenarioConfig, "default_config", None)
+    if "env" in bus_kwargs:
+        monkeypatch.setenv("SCENARIO_EVENTS_MAX_CONNECTIONS", bus_kwargs.pop("env"))
+    if "config" in bus_kwargs:
+        ScenarioConfig.configure(events_max_connections=bus_kwargs.pop("config"))
+
+    limits = []
+    original_limits = httpx.Limits
+
+    def recording_limits(**kwargs):
+        limits.append(kwargs)
+        return original_limits(**kwargs)
+
+    monkeypatch.setattr(httpx, "Limits", recording_limits)
+
+    bus = ScenarioEventBus(sinks=[], **bus_kwargs)
+    reporter = bus._event_reporter
+    reporter._get_client()
+    await reporter.aclose()
+
+    assert limits == [
+        {"max_connections": expected, "max_keepalive_connections": expected}
+    ]
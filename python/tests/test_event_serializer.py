@@ -0,0 +1,108 @@
+import json
+import time
+
+from scenario._events import event_serializer
+from scenario._events.event_serializer import serialize_event, serialize_events
+from scenario._events.events import (
+    ScenarioMessageDeltaEvent,
+    ScenarioMessageSnapshotEvent,
+)
+from scenario._events.utils import MessageSnapshotBuilder
+from test_scenario_event_bus import make_run_events
+
+
+CONVERSATION = [
+    {"id": "m1", "role": "system", "content": "You are a helpful agent"},
+    {"id": "m2", "role": "user", "content": "Où est la gare ?", "trace_id": "t1"},
+    {
+        "id": "m3",
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [
+            {
+                "id": "call_1",
+                "type": "function",
+                "function": {"name": "find_station", "arguments": '{"city": "Paris"}'},
+            }
+        ],
+    },
+    {"id": "m4", "role": "tool", "tool_call_id": "call_1", "content": "Gare du Nord"},
+]
+
+
+def expected_bytes(event) -> bytes:
+    return json.dumps(
+        event.to_dict(), ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+def test_serialize_event_matches_generated_to_dict():
+    builder = MessageSnapshotBuilder()
+    messages, _ = builder.build(CONVERSATION)  # type: ignore
+    snapshot = ScenarioMessageSnapshotEvent(
+        batch_run_id="batch-123",
+        scenario_id="scenario-456",
+        scenario_run_id="run-1",
+        messages=messages,
+        timestamp=int(time.time() * 1000),
+    )
+    delta = ScenarioMessageDeltaEvent(
+        batch_run_id="batch-123",
+        scenario_id="scenario-456",
+        scenario_run_id="run-1",
+        messages=messages[2:],
+        base_message_count=2,
+        timestamp=int(time.time() * 1000),
+    )
+    events = [*make_run_events("run-1"), snapshot, delta]
+
+    for event in events:
+        assert serialize_event(event) == expected_bytes(event)
+    assert json.loads(serialize_events(events)) == {
+        "events": [event.to_dict() for event in events]
+    }
+
+
+def test_serialize_event_encodes_each_message_once(monkeypatch):
+    builder = MessageSnapshotBuilder()
+    encoded = []
+    dumps = event_serializer.dumps
+
+    def counting_dumps(value):
+        encoded.append(value)
+        return dumps(value)
+
+    monkeypatch.setattr(event_serializer, "dumps", counting_dumps)
+
+    for count in range(1, len(CONVERSATION) + 1):
+        messages, _ = builder.build(CONVERSATION[:count])  # type: ignore
+        serialize_event(
+            ScenarioMessageSnapshotEvent(
+                batch_run_id="batch-123",
+                scenario_id="scenario-456",
+                scenario_run_id="run-1",
+                messages=messages,
+                timestamp=int(time.time() * 1000),
+            )
+        )
+
+    encoded_messages = [value["id"] for value in encoded if "role" in value]
+    assert encoded_messages == ["m1", "m2", "m3", "m4"]
+
+
+def test_serialize_events_reuses_the_encoding_of_each_event(monkeypatch):
+    events = make_run_events("run-1")
+    encoded = [serialize_event(event) for event in events]
+    to_dict_calls = []
+    for event in events:
+        to_dict = event.to_dict
+        monkeypatch.setattr(
+            event,
+            "to_dict",
+            lambda to_dict=to_dict: to_dict_calls.append(1) or to_dict(),
+        )
+
+    batch = serialize_events(events)
+
+    assert to_dict_calls == []
+    assert batch == b'{"events":[' + b",".join(encoded) + b"]}"
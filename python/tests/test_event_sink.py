@@ -0,0 +1,226 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+import respx
+from rx import from_iterable  # type: ignore
+
+from scenario._cli import main
+from scenario._events import ScenarioEventBus
+from scenario._events.event_reporter import EventReporter
+from scenario._events.event_sink import (
+    JsonlEventSink,
+    replay_spooled_events,
+    spooled_segments,
+)
+from test_scenario_event_bus import make_run_events
+
+
+def read_segments(directory: str) -> List[Dict[str, Any]]:
+    events = []
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name)) as f:
+            events.extend(json.loads(line) for line in f)
+    return events
+
+
+def test_jsonl_event_sink_rotates_segments(tmp_path):
+    sink = JsonlEventSink(str(tmp_path), max_segment_bytes=1)
+    events = make_run_events("run-1")
+
+    sink.write(events[:2])
+    sink.write(events[2:])
+    sink.close()
+
+    names = sorted(os.listdir(tmp_path))
+    assert len(names) == 2
+    assert all(name.startswith("events-") and name.endswith(".jsonl") for name in names)
+    assert [event["type"] for event in read_segments(str(tmp_path))] == [
+        "SCENARIO_RUN_STARTED",
+        "SCENARIO_MESSAGE_SNAPSHOT",
+        "SCENARIO_RUN_FINISHED",
+    ]
+
+
+def test_jsonl_event_sink_keeps_segment_open_until_closed(tmp_path):
+    sink = JsonlEventSink(str(tmp_path))
+    sink.write(make_run_events("run-1"))
+    sink.flush()
+
+    (name,) = os.listdir(tmp_path)
+    assert name.endswith(".jsonl.open")
+    # Still being written by this process, so not ready to be replayed
+    assert spooled_segments(str(tmp_path)) == []
+
+    sink.close()
+    assert os.listdir(tmp_path) == [name[: -len(".open")]]
+
+
+def test_scenario_event_bus_writes_events_to_sinks_without_endpoint(tmp_path):
+    reporter = EventReporter(api_key="test-api-key")
+    reporter.endpoint = ""
+    bus = ScenarioEventBus(
+        event_reporter=reporter, sinks=[JsonlEventSink(str(tmp_path))]
+    )
+
+    bus.subscribe_to_events(from_iterable(make_run_events("run-1")))
+    bus.drain()
+
+    assert [event["scenarioRunId"] for event in read_segments(str(tmp_path))] == [
+        "run-1"
+    ] * 3
+
+
+@pytest.mark.asyncio
+async def test_scenario_event_bus_spools_undelivered_events(tmp_path):
+    endpoint = "https://langwatch.test"
+    spool_dir = str(tmp_path / "spool")
+    bus = ScenarioEventBus(
+        event_reporter=EventReporter(endpoint=endpoint, api_key="test-api-key"),
+        spool=JsonlEventSink(spool_dir, prefix="spool"),
+        max_batch_size=1,
+        max_retries=2,
+    )
+
+    with respx.mock as mock:
+        route = mock.post(f"{endpoint}/api/scenario-events").respond(503)
+
+        for run_id in ["run-1", "run-2"]:
+            bus.subscribe_to_events(from_iterable(make_run_events(run_id)))
+            bus.drain()
+
+    # After the first failure, events go straight to the spool
+    assert route.call_count == 2
+    spooled = read_segments(spool_dir)
+    assert [event["scenarioRunId"] for event in spooled] == ["run-1"] * 3 + [
+        "run-2"
+    ] * 3
+
+    with respx.mock as mock:
+        calls: List[str] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            event = json.loads(request.content)
+            calls.append(event["type"])
+            if event["scenarioRunId"] == "run-2":
+                return httpx.Response(502)
+            return httpx.Response(200, json={})
+
+        mock.post(f"{endpoint}/api/scenario-events/batch").respond(404)
+        mock.post(f"{endpoint}/api/scenario-events").mock(side_effect=respond)
+
+        delivered, undelivered = await replay_spooled_events(
+            spool_dir, EventReporter(endpoint=endpoint, api_key="test-api-key")
+        )
+
+    assert (delivered, undelivered) == (3, 3)
+    assert [event["scenarioRunId"] for event in read_segments(spool_dir)] == [
+        "run-2"
+    ] * 3
+    # Spooled events are sent exactly as they were first posted
+    assert calls[:3] == [event["type"] for event in spooled[:3]]
+
+
+def test_scenario_event_bus_spools_events_beyond_max_queued_events(
+    tmp_path, caplog: pytest.LogCaptureFixture
+):
+    import threading
+
+    released = threading.Event()
+    posted: List[Any] = []
+
+    class BlockingEventReporter(EventReporter):
+        def __init__(self):
+            pass
+
+        async def post_event(self, event: Any) -> Dict[str, Any]:
+            await asyncio.to_thread(released.wait, 10)
+            posted.append(event)
+            return {}
+
+        async def aclose(self) -> None:
+            pass
+
+    spool_dir = str(tmp_path / "spool")
+    bus = ScenarioEventBus(
+        event_reporter=BlockingEventReporter(),
+        spool=JsonlEventSink(spool_dir, prefix="spool"),
+        max_batch_size=1,
+        max_queued_events=1,
+    )
+
+    bus.subscribe_to_events(
+        from_iterable(make_run_events("run-1") + make_run_events("run-2"))
+    )
+    # Only the first event is held in memory while it can't be posted
+    deadline = time.monotonic() + 10
+    while bus.pending_events > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert bus.pending_events == 1
+    released.set()
+    bus.drain()
+
+    assert [event.scenario_run_id for event in posted] == ["run-1"]
+    assert [event["scenarioRunId"] for event in read_segments(spool_dir)] == [
+        "run-1"
+    ] * 2 + ["run-2"] * 3
+    assert "run `scenario events replay " + spool_dir + "`" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_events_replay_command(tmp_path, capsys: pytest.CaptureFixture[str]):
+    endpoint = "https://langwatch.test"
+    sink = JsonlEventSink(str(tmp_path), prefix="spool")
+    sink.write(make_run_events("run-1"))
+    sink.close()
+
+    with respx.mock as mock:
+        route = mock.post(f"{endpoint}/api/scenario-events/batch").respond(
+            200, json={"results": [{}, {}, {}]}
+        )
+        # The command runs its own event loop, keep it off the main thread's
+        exit_code = await asyncio.to_thread(
+            main, ["events", "replay", str(tmp_path), "--endpoint", endpoint]
+        )
+
+    assert exit_code == 0
+    assert route.call_count == 1
+    assert os.listdir(tmp_path) == []
+    assert "Replayed 3 events" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("batch_supported", [True, False])
+@pytest.mark.asyncio
+async def test_replay_keeps_rejected_events_in_the_spool(tmp_path, batch_supported):
+    endpoint = "https://langwatch.test"
+    sink = JsonlEventSink(str(tmp_path), prefix="spool")
+    sink.write(make_run_events("run-1"))
+    sink.close()
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        event = json.loads(request.content)
+        if event["type"] == "SCENARIO_MESSAGE_SNAPSHOT":
+            return httpx.Response(422, json={"error": "invalid event"})
+        return httpx.Response(200, json={})
+
+    with respx.mock as mock:
+        if batch_supported:
+            mock.post(f"{endpoint}/api/scenario-events/batch").respond(
+                200, json={"results": [{}, {"error": "invalid event"}, {}]}
+            )
+        else:
+            mock.post(f"{endpoint}/api/scenario-events/batch").respond(404)
+            mock.post(f"{endpoint}/api/scenario-events").mock(side_effect=respond)
+
+        delivered, undelivered = await replay_spooled_events(
+            str(tmp_path), EventReporter(endpoint=endpoint, api_key="test-api-key")
+        )
+
+    assert (delivered, undelivered) == (2, 1)
+    assert [event["type"] for event in read_segments(str(tmp_path))] == [
+        "SCENARIO_MESSAGE_SNAPSHOT"
+    ]
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = [
+    "litellm",
+    "langwatch",
+    "httpx",
+    "rx",
+    "rich",
+    "scenario.scenario_executor",
+    "scenario._generated.langwatch_api_client.lang_watch_api_client.models.annotation",
+]
+
+
+def import_in_subprocess(statement: str) -> dict:
+    code = f"""
+import json, sys, time
+started_at = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started_at
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("statement", ["import scenario", "import scenario.pytest_plugin"])
+def test_import_does_not_load_heavy_dependencies(statement: str):
+    imported = import_in_subprocess(statement)
+
+    assert [module for module in HEAVY_MODULES if module in imported["modules"]] == []
+
+
+@pytest.mark.skipif(
+    not os.environ.get("SCENARIO_TEST_IMPORT_TIME"),
+    reason="Timing dependent, set SCENARIO_TEST_IMPORT_TIME=1 to run it",
+)
+def test_import_is_fast():
+    imported = import_in_subprocess("import scenario")
+
+    # Very generous bound, importing everything eagerly took several seconds
+    assert imported["elapsed"] < 5.0
+
+
+def test_lazy_attributes_resolve_to_the_public_api():
+    import scenario
+    from scenario.cache import scenario_cache
+    from scenario.config import ScenarioConfig
+    from scenario.judge_agent import JudgeAgent
+
+    assert scenario.cache is scenario_cache
+    assert scenario.JudgeAgent is JudgeAgent
+    assert scenario.configure == ScenarioConfig.configure
+    assert scenario.default_config is ScenarioConfig.default_config
+    assert set(scenario.__all__) <= set(dir(scenario))
+    with pytest.raises(AttributeError):
+        scenario.does_not_exist  # type: ignore
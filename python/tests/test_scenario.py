@@ -99,8 +99,8 @@ async def test_scenario_allow_scripted_scenario():
             input: scenario.AgentInput,
         ) -> scenario.AgentReturnTypes:
             for message in input.new_messages:
-                if "trace_id" in message:
-                    del message["trace_id"]
+                message.pop("trace_id", None)  # type: ignore
+                message.pop("id", None)  # type: ignore
 
             assert input.new_messages == [
                 {
@@ -143,8 +143,8 @@ async def test_scenario_allow_scripted_scenario_with_lower_level_openai_messages
             input: scenario.AgentInput,
         ) -> scenario.AgentReturnTypes:
             for message in input.new_messages:
-                if "trace_id" in message:
-                    del message["trace_id"]
+                message.pop("trace_id", None)  # type: ignore
+                message.pop("id", None)  # type: ignore
 
             assert input.new_messages == [
                 {
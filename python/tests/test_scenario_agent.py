@@ -1,10 +1,16 @@
+import asyncio
 from typing import Any, cast
+from unittest.mock import patch
 
 import pytest
+from litellm.types.utils import ModelResponse
 from scenario.types import ScenarioResult, ChatCompletionUserMessageParamWithTrace
 
 from scenario.agent_adapter import AgentAdapter
 from scenario.types import AgentInput, AgentRole
+from scenario.judge_agent import JudgeAgent
+from scenario.user_simulator_agent import UserSimulatorAgent
+from scenario.scenario_executor import ScenarioExecutor
 
 
 @pytest.mark.asyncio
@@ -35,3 +41,67 @@ async def test_should_be_able_to_override_scenario_agent():
     agent = MyCustomTestingAgent()
     assert agent.triggers == {AgentRole.AGENT}
     assert (await agent.call(input)).success
+
+
+def _model_response(message: dict) -> ModelResponse:
+    return ModelResponse(choices=[{"message": message, "index": 0}])
+
+
+@pytest.mark.asyncio
+async def test_user_simulator_and_judge_make_concurrent_async_completions():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+
+        if kwargs["tools"]:
+            return _model_response(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "continue_test", "arguments": "{}"},
+                        }
+                    ],
+                }
+            )
+        return _model_response({"role": "assistant", "content": "hi there"})
+
+    user_simulator = UserSimulatorAgent(model="none")
+    judge = JudgeAgent(model="none", criteria=["test criteria"])
+    executor = ScenarioExecutor(
+        name="async completion test",
+        description="test description",
+        agents=[user_simulator, judge],
+    )
+    executor.reset()
+
+    input = AgentInput(
+        thread_id="1",
+        messages=[],
+        new_messages=[],
+        judgment_request=False,
+        scenario_state=executor._state,
+    )
+
+    with patch("litellm.completion") as sync_completion, patch(
+        "litellm.acompletion", side_effect=fake_acompletion
+    ) as async_completion:
+        results = await asyncio.gather(
+            *[user_simulator.call(input) for _ in range(5)],
+            *[judge.call(input) for _ in range(5)],
+        )
+
+    assert not sync_completion.called
+    assert async_completion.await_count == 10
+    assert max_in_flight == 10, "all calls should be in flight on the same loop"
+    assert results[:5] == [{"role": "user", "content": "hi there"}] * 5
+    assert results[5:] == [[]] * 5
@@ -1,6 +1,12 @@
+import asyncio
+import json
+import httpx
+import threading
 import pytest
+import respx
 import time
 from rx import from_iterable  # type: ignore
+from rx.subject.subject import Subject
 from scenario._events.events import (
     ScenarioRunStartedEvent,
     ScenarioRunStartedEventMetadata,
@@ -9,11 +15,13 @@ from scenario._events.events import (
     ScenarioRunFinishedEventResults,
     ScenarioRunFinishedEventVerdict,
     ScenarioMessageSnapshotEvent,
+    ScenarioMessageDeltaEvent,
     ScenarioEvent,
 )
-from scenario._events import ScenarioEventBus
+from scenario._events import ScenarioEventBus, flush_events, pending_events
+from scenario._events.event_bus import _flush_at_exit
 from scenario._events.messages import UserMessage
-from scenario._events.event_reporter import EventReporter
+from scenario._events.event_reporter import EventReporter, MAX_BATCH_REJECTIONS
 from typing import List, Any, Dict
 
 
@@ -25,6 +33,13 @@ class MockEventReporter(EventReporter):
         self.events.append(event)
         return {}
 
+    async def post_events(self, events: List[Any]) -> None:
+        # Events are recorded one by one
+        return None
+
+    async def aclose(self) -> None:
+        pass
+
 
 @pytest.mark.asyncio
 async def test_scenario_event_bus_basic_flow():
@@ -134,6 +149,12 @@ async def test_scenario_event_bus_handles_errors():
             self.events.append(event)
             return {}
 
+        async def post_events(self, events: List[ScenarioEvent]) -> None:
+            return None
+
+        async def aclose(self) -> None:
+            pass
+
     reporter = RetryEventReporter()
     bus = ScenarioEventBus(event_reporter=reporter, max_retries=3)
 
@@ -197,3 +218,417 @@ async def test_scenario_event_bus_handles_errors():
 
     finish_key = (scenario_run_id, "ScenarioRunFinishedEvent")
     assert reporter.attempt_counts[finish_key] == 1  # Should succeed on first try
+
+
+def make_run_events(scenario_run_id: str) -> List[ScenarioEvent]:
+    start_event = ScenarioRunStartedEvent(
+        batch_run_id="batch-123",
+        scenario_id="scenario-456",
+        scenario_run_id=scenario_run_id,
+        metadata=ScenarioRunStartedEventMetadata(
+            name="test-scenario", description="Test scenario description"
+        ),
+        timestamp=int(time.time() * 1000),
+    )
+    message_event = ScenarioMessageSnapshotEvent(
+        batch_run_id="batch-123",
+        scenario_id="scenario-456",
+        scenario_run_id=scenario_run_id,
+        messages=[UserMessage(id="1", role="user", content="Hello, how are you?")],
+        timestamp=int(time.time() * 1000),
+    )
+    finish_event = ScenarioRunFinishedEvent(
+        batch_run_id="batch-123",
+        scenario_id="scenario-456",
+        scenario_run_id=scenario_run_id,
+        status=ScenarioRunFinishedEventStatus.SUCCESS,
+        results=ScenarioRunFinishedEventResults(
+            verdict=ScenarioRunFinishedEventVerdict.SUCCESS,
+            met_criteria=["criteria1"],
+            unmet_criteria=[],
+            reasoning="Test completed successfully",
+        ),
+        timestamp=int(time.time() * 1000),
+    )
+    return [start_event, message_event, finish_event]
+
+
+def test_scenario_event_bus_posts_queued_events_in_batches():
+    endpoint = "https://langwatch.test"
+    bus = ScenarioEventBus(
+        event_reporter=EventReporter(endpoint=endpoint, api_key="test-api-key"),
+        max_linger=0.5,
+    )
+
+    with respx.mock as mock:
+        batch_route = mock.post(f"{endpoint}/api/scenario-events/batch").respond(
+            200, json={"results": [{"url": "https://langwatch.test/set"}, {}, {}]}
+        )
+        single_route = mock.post(f"{endpoint}/api/scenario-events").respond(
+            200, json={}
+        )
+
+        bus.subscribe_to_events(from_iterable(make_run_events("run-1")))
+        bus.drain()
+
+    assert batch_route.call_count == 1
+    assert single_route.call_count == 0
+    payload = json.loads(batch_route.calls[0].request.content)
+    assert [event["type"] for event in payload["events"]] == [
+        "SCENARIO_RUN_STARTED",
+        "SCENARIO_MESSAGE_SNAPSHOT",
+        "SCENARIO_RUN_FINISHED",
+    ]
+
+
+def test_scenario_event_bus_falls_back_to_single_posts_without_batch_endpoint():
+    endpoint = "https://langwatch.test"
+    reporter = EventReporter(endpoint=endpoint, api_key="test-api-key")
+
+    with respx.mock as mock:
+        batch_route = mock.post(f"{endpoint}/api/scenario-events/batch").respond(404)
+        single_route = mock.post(f"{endpoint}/api/scenario-events").respond(
+            200, json={}
+        )
+
+        for run_id in ["run-1", "run-2"]:
+            bus = ScenarioEventBus(event_reporter=reporter, max_linger=0.5)
+            bus.subscribe_to_events(from_iterable(make_run_events(run_id)))
+            bus.drain()
+
+    # The batch endpoint is only tried once
+    assert batch_route.call_count == 1
+    assert single_route.call_count == 6
+
+
+def test_scenario_event_bus_posts_rejected_batches_one_by_one():
+    endpoint = "https://langwatch.test"
+    reporter = EventReporter(endpoint=endpoint, api_key="test-api-key")
+
+    with respx.mock as mock:
+        batch_route = mock.post(f"{endpoint}/api/scenario-events/batch").respond(422)
+        single_route = mock.post(f"{endpoint}/api/scenario-events").respond(
+            200, json={}
+        )
+
+        for run_id in ["run-1", "run-2", "run-3"]:
+            bus = ScenarioEventBus(event_reporter=reporter, max_linger=0.5)
+            bus.subscribe_to_events(from_iterable(make_run_events(run_id)))
+            bus.drain()
+
+    # A single rejection may only be due to one event, but once batches keep
+    # being rejected, events are only posted one by one
+    assert batch_route.call_count == MAX_BATCH_REJECTIONS
+    assert single_route.call_count == 9
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(200, text="not json"),
+        httpx.Response(200, json={"ok": True}),
+        httpx.Response(200, json={"results": [{}]}),
+    ],
+)
+def test_scenario_event_bus_posts_events_one_by_one_on_malformed_batch_responses(
+    response: httpx.Response,
+):
+    endpoint = "https://langwatch.test"
+    bus = ScenarioEventBus(
+        event_reporter=EventReporter(endpoint=endpoint, api_key="test-api-key"),
+        max_linger=0.5,
+    )
+
+    with respx.mock as mock:
+        batch_route = mock.post(f"{endpoint}/api/scenario-events/batch").mock(
+            return_value=response
+        )
+        single_route = mock.post(f"{endpoint}/api/scenario-events").respond(
+            200, json={}
+        )
+
+        bus.subscribe_to_events(from_iterable(make_run_events("run-1")))
+        bus.drain()
+
+    # Not retried, the endpoint answered
+    assert batch_route.call_count == 1
+    assert single_route.call_count == 3
+
+
+def make_snapshot(scenario_run_id: str, content: str) -> ScenarioMessageSnapshotEvent:
+    return ScenarioMessageSnapshotEvent(
+        batch_run_id="batch-123",
+        scenario_id="scenario-456",
+        scenario_run_id=scenario_run_id,
+        messages=[UserMessage(id="1", role="user", content=content)],
+        timestamp=int(time.time() * 1000),
+    )
+
+
+class BlockingEventReporter(MockEventReporter):
+    def __init__(self):
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    async def post_event(self, event: Any) -> Dict[str, Any]:
+        if isinstance(event, ScenarioRunStartedEvent):
+            self.unblocked.wait(timeout=5.0)
+        return await super().post_event(event)
+
+
+def test_scenario_event_bus_supersedes_queued_snapshots_of_a_run():
+    reporter = BlockingEventReporter()
+    bus = ScenarioEventBus(event_reporter=reporter, max_batch_size=1)
+    start_event, _, finish_event = make_run_events("run-1")
+    other_start_event, _, other_finish_event = make_run_events("run-2")
+
+    events = Subject()
+    bus.subscribe_to_events(events)
+    events.on_next(start_event)
+    events.on_next(other_start_event)
+    for i in range(5):
+        events.on_next(make_snapshot("run-1", f"run 1 turn {i}"))
+        events.on_next(make_snapshot("run-2", f"run 2 turn {i}"))
+    events.on_next(finish_event)
+    events.on_next(other_finish_event)
+    events.on_completed()
+
+    reporter.unblocked.set()
+    bus.drain()
+
+    # Runs are posted concurrently, but each run's events stay in order
+    for run_id, run_number in [("run-1", 1), ("run-2", 2)]:
+        posted = [
+            event for event in reporter.events if event.scenario_run_id == run_id
+        ]
+        assert [event.type_ for event in posted] == [
+            "SCENARIO_RUN_STARTED",
+            "SCENARIO_MESSAGE_SNAPSHOT",
+            "SCENARIO_RUN_FINISHED",
+        ]
+        assert posted[1].messages[0].content == f"run {run_number} turn 4"
+
+
+def test_scenario_event_bus_debounces_snapshots_per_run():
+    reporter = MockEventReporter()
+    bus = ScenarioEventBus(
+        event_reporter=reporter, max_batch_size=1, snapshot_debounce=60.0
+    )
+    start_event, _, finish_event = make_run_events("run-1")
+
+    events = Subject()
+    bus.subscribe_to_events(events)
+    events.on_next(start_event)
+    events.on_next(make_snapshot("run-1", "turn 0"))
+
+    deadline = time.time() + 5.0
+    while len(reporter.events) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+
+    # Within the debounce interval, these are held back and superseded
+    events.on_next(make_snapshot("run-1", "turn 1"))
+    events.on_next(make_snapshot("run-1", "turn 2"))
+    time.sleep(0.3)
+    assert len(reporter.events) == 2
+
+    # The run finishing releases the held back snapshot right before it
+    events.on_next(finish_event)
+    events.on_completed()
+    bus.drain()
+
+    assert [event.type_ for event in reporter.events] == [
+        "SCENARIO_RUN_STARTED",
+        "SCENARIO_MESSAGE_SNAPSHOT",
+        "SCENARIO_MESSAGE_SNAPSHOT",
+        "SCENARIO_RUN_FINISHED",
+    ]
+    assert reporter.events[2].messages[0].content == "turn 2"
+
+
+def test_scenario_event_bus_merges_queued_snapshot_deltas():
+    reporter = BlockingEventReporter()
+    bus = ScenarioEventBus(event_reporter=reporter, max_batch_size=1)
+    start_event, _, finish_event = make_run_events("run-1")
+
+    def make_delta(base_message_count: int, count: int) -> ScenarioMessageDeltaEvent:
+        return ScenarioMessageDeltaEvent(
+            batch_run_id="batch-123",
+            scenario_id="scenario-456",
+            scenario_run_id="run-1",
+            messages=[
+                UserMessage(id=str(i), role="user", content=f"message {i}")
+                for i in range(base_message_count, base_message_count + count)
+            ],
+            base_message_count=base_message_count,
+            timestamp=int(time.time() * 1000),
+        )
+
+    events = Subject()
+    bus.subscribe_to_events(events)
+    events.on_next(start_event)
+    events.on_next(make_delta(2, 1))
+    events.on_next(make_delta(3, 2))
+    events.on_next(finish_event)
+    events.on_next(make_run_events("run-2")[0])
+    events.on_next(make_snapshot("run-2", "full"))
+    events.on_next(
+        ScenarioMessageDeltaEvent(
+            batch_run_id="batch-123",
+            scenario_id="scenario-456",
+            scenario_run_id="run-2",
+            messages=[UserMessage(id="2", role="user", content="appended")],
+            base_message_count=1,
+            timestamp=int(time.time() * 1000),
+        )
+    )
+    events.on_completed()
+
+    reporter.unblocked.set()
+    bus.drain()
+
+    snapshots = sorted(
+        (
+            event
+            for event in reporter.events
+            if isinstance(event, ScenarioMessageSnapshotEvent)
+        ),
+        key=lambda event: event.scenario_run_id,
+    )
+    assert len(snapshots) == 2
+
+    # Deltas waiting in the queue merge into a single delta
+    assert isinstance(snapshots[0], ScenarioMessageDeltaEvent)
+    assert snapshots[0].base_message_count == 2
+    assert [message.id for message in snapshots[0].messages] == ["2", "3", "4"]
+    assert snapshots[0].to_dict()["delta"] is True
+    assert snapshots[0].to_dict()["baseMessageCount"] == 2
+
+    # A delta on top of a waiting full snapshot makes it a full one
+    assert not isinstance(snapshots[1], ScenarioMessageDeltaEvent)
+    assert [message.content for message in snapshots[1].messages] == [
+        "full",
+        "appended",
+    ]
+
+
+class SlowEventReporter(MockEventReporter):
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def post_event(self, event: Any) -> Dict[str, Any]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.2)
+        self.in_flight -= 1
+        return await super().post_event(event)
+
+
+def test_scenario_event_bus_posts_runs_concurrently_in_order():
+    reporter = SlowEventReporter()
+    bus = ScenarioEventBus(event_reporter=reporter, max_batch_size=1, max_in_flight=3)
+
+    events = Subject()
+    bus.subscribe_to_events(events)
+    for i in range(3):
+        for event in make_run_events(f"run-{i}"):
+            events.on_next(event)
+    events.on_completed()
+
+    started_at = time.monotonic()
+    bus.drain()
+
+    # 3 events per run, each run posted sequentially but all runs at once
+    assert time.monotonic() - started_at < 1.2
+    assert reporter.max_in_flight == 3
+    assert bus.is_completed()
+    for i in range(3):
+        assert [
+            event.type_
+            for event in reporter.events
+            if event.scenario_run_id == f"run-{i}"
+        ] == [
+            "SCENARIO_RUN_STARTED",
+            "SCENARIO_MESSAGE_SNAPSHOT",
+            "SCENARIO_RUN_FINISHED",
+        ]
+
+
+def test_flush_events_waits_for_all_buses_up_to_a_timeout():
+    reporter = SlowEventReporter()
+    buses = [
+        ScenarioEventBus(event_reporter=reporter, max_batch_size=1) for _ in range(2)
+    ]
+    for i, bus in enumerate(buses):
+        events = Subject()
+        bus.subscribe_to_events(events)
+        for event in make_run_events(f"run-{i}"):
+            events.on_next(event)
+
+    assert pending_events() >= 6
+    assert not flush_events(timeout=0.05)
+    assert buses[0].pending_events > 0
+
+    assert all(bus.flush(timeout=5.0) for bus in buses)
+    assert [bus.pending_events for bus in buses] == [0, 0]
+    assert len(reporter.events) == 6
+
+
+def test_exit_flush_closes_the_reporter_http_client():
+    endpoint = "https://langwatch.test"
+    reporter = EventReporter(endpoint=endpoint, api_key="test-api-key")
+    bus = ScenarioEventBus(event_reporter=reporter)
+
+    with respx.mock as mock:
+        mock.post(f"{endpoint}/api/scenario-events/batch").respond(
+            200, json={"results": [{}, {}, {}]}
+        )
+        bus.subscribe_to_events(from_iterable(make_run_events("run-1")))
+        assert bus.flush(timeout=5.0)
+        client = reporter._client
+        assert client is not None and not client.is_closed
+
+        _flush_at_exit()
+
+    assert client.is_closed
+    assert reporter._client is None
+
+
+def test_scenario_event_bus_multiplexes_many_event_streams(monkeypatch):
+    reporter = MockEventReporter()
+    monkeypatch.setattr(ScenarioEventBus, "default_bus", None)
+    monkeypatch.setattr(
+        "scenario._events.event_bus.EventReporter", lambda **kwargs: reporter
+    )
+    bus = ScenarioEventBus.get()
+
+    assert ScenarioEventBus.get() is bus
+
+    streams = [Subject() for _ in range(2)]
+    for stream in streams:
+        bus.subscribe_to_events(stream)
+        bus.subscribe_to_events(stream)
+    for i, stream in enumerate(streams):
+        for event in make_run_events(f"run-{i}"):
+            stream.on_next(event)
+
+    streams[0].on_completed()
+    assert bus.flush(timeout=5.0)
+    assert not bus.is_completed()
+
+    streams[1].on_completed()
+    bus.drain()
+
+    assert bus.is_completed()
+    assert len(reporter.events) == 6
+    for i in range(2):
+        assert [
+            event.type_
+            for event in reporter.events
+            if event.scenario_run_id == f"run-{i}"
+        ] == [
+            "SCENARIO_RUN_STARTED",
+            "SCENARIO_MESSAGE_SNAPSHOT",
+            "SCENARIO_RUN_FINISHED",
+        ]
@@ -1,10 +1,30 @@
 import pytest
+from typing import Dict, List
+import litellm
+from litellm import acompletion
+from openai.types.chat import ChatCompletionMessageParam
 import scenario
 from scenario import JudgeAgent, UserSimulatorAgent
 from scenario.agent_adapter import AgentAdapter
-from scenario.types import AgentInput, AgentReturnTypes, AgentRole, ScenarioResult
-
+from scenario.types import (
+    AgentCallTiming,
+    AgentInput,
+    AgentReturnTypes,
+    AgentRole,
+    ChatCompletionMessageParamWithTrace,
+    ScenarioResult,
+    TimingSummary,
+)
+
+from scenario.config import ScenarioConfig
 from scenario.scenario_executor import ScenarioExecutor
+from scenario._budget import SessionSpend
+from scenario._events import (
+    MessageType,
+    ScenarioMessageSnapshotEvent,
+    convert_messages_to_api_client_messages,
+)
+from scenario._events.utils import MessageSnapshotBuilder
 
 
 class MockJudgeAgent(JudgeAgent):
@@ -33,14 +53,34 @@ class MockAgent(AgentAdapter):
         return {"role": "assistant", "content": "Hey, how can I help you?"}
 
 
-def remove_trace_ids(executor: ScenarioExecutor):
+class LiteLLMAgent(AgentAdapter):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        response = await litellm.acompletion(
+            model="openai/gpt-4o-mini",
+            messages=input.messages,
+            mock_response="Hey, how can I help you?",
+        )
+        return response.choices[0].message.content  # type: ignore
+
+
+class ImportedCompletionAgent(AgentAdapter):
+    async def call(self, input: AgentInput) -> AgentReturnTypes:
+        response = await acompletion(
+            model="openai/gpt-4o-mini",
+            messages=input.messages,
+            mock_response="Hey, how can I help you?",
+        )
+        return response.choices[0].message.content  # type: ignore
+
+
+def remove_trace_and_message_ids(executor: ScenarioExecutor):
     for message in executor._state.messages:
-        if "trace_id" in message:
-            del message["trace_id"]  # type: ignore
+        message.pop("trace_id", None)  # type: ignore
+        message.pop("id", None)  # type: ignore
     for message in executor._pending_messages.values():
         for msg in message:
-            if "trace_id" in msg:
-                del msg["trace_id"]
+            msg.pop("trace_id", None)  # type: ignore
+            msg.pop("id", None)  # type: ignore
 
 
 @pytest.mark.asyncio
@@ -68,7 +108,7 @@ async def test_advance_a_step():
     # User
     await executor.step()
 
-    remove_trace_ids(executor)
+    remove_trace_and_message_ids(executor)
     assert executor._state.messages == [
         {"role": "user", "content": "Hi, I'm a user"},
     ], "starts with the user message"
@@ -78,7 +118,7 @@ async def test_advance_a_step():
     # Assistent
     await executor.step()
 
-    remove_trace_ids(executor)
+    remove_trace_and_message_ids(executor)
     assert executor._state.messages == [
         {"role": "user", "content": "Hi, I'm a user"},
         {"role": "assistant", "content": "Hey, how can I help you?"},
@@ -89,7 +129,7 @@ async def test_advance_a_step():
     # Judge
     await executor.step()
 
-    remove_trace_ids(executor)
+    remove_trace_and_message_ids(executor)
     assert executor._state.messages == [
         {"role": "user", "content": "Hi, I'm a user"},
         {"role": "assistant", "content": "Hey, how can I help you?"},
@@ -123,13 +163,13 @@ async def test_sends_the_right_new_messages():
     class MockAgent(AgentAdapter):
         async def call(self, input: AgentInput) -> AgentReturnTypes:
             if input.scenario_state.current_turn == 0:
-                remove_trace_ids(input.scenario_state._executor)
+                remove_trace_and_message_ids(input.scenario_state._executor)
                 assert input.new_messages == [
                     {"role": "user", "content": "Hi, I'm a user"}
                 ]
                 return {"role": "assistant", "content": "Hey, how can I help you?"}
             else:
-                remove_trace_ids(input.scenario_state._executor)
+                remove_trace_and_message_ids(input.scenario_state._executor)
                 assert input.messages == [
                     {"role": "user", "content": "Hi, I'm a user"},
                     {"role": "assistant", "content": "Hey, how can I help you?"},
@@ -146,12 +186,12 @@ async def test_sends_the_right_new_messages():
             input: AgentInput,
         ) -> scenario.AgentReturnTypes:
             if input.scenario_state.current_turn == 0:
-                remove_trace_ids(input.scenario_state._executor)
+                remove_trace_and_message_ids(input.scenario_state._executor)
                 assert input.new_messages == []
                 return "Hi, I'm a user"
 
             if input.scenario_state.current_turn == 1:
-                remove_trace_ids(input.scenario_state._executor)
+                remove_trace_and_message_ids(input.scenario_state._executor)
                 assert input.messages == [
                     {"role": "user", "content": "Hi, I'm a user"},
                     {"role": "assistant", "content": "Hey, how can I help you?"},
@@ -250,3 +290,255 @@ async def test_eliminate_pending_roles_in_order_also_on_scripted_scenarios():
         AgentRole.AGENT,
         AgentRole.JUDGE,
     ], "new turn started with all roles back"
+
+
+@pytest.mark.asyncio
+async def test_emits_message_snapshot_deltas_with_periodic_full_snapshots(
+    monkeypatch,
+):
+    monkeypatch.setenv("SCENARIO_SNAPSHOT_MODE", "delta")
+    monkeypatch.setenv("SCENARIO_FULL_SNAPSHOT_INTERVAL", "3")
+
+    executor = ScenarioExecutor(
+        name="test name",
+        description="test description",
+        agents=[
+            MockAgent(),
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+        script=[
+            scenario.user(),
+            scenario.agent(),
+            scenario.user(),
+            scenario.agent(),
+            scenario.user(),
+            scenario.agent(),
+            scenario.succeed(),
+        ],
+    )
+    snapshots: List[ScenarioMessageSnapshotEvent] = []
+    executor.events.subscribe(
+        lambda event: (
+            snapshots.append(event)
+            if isinstance(event, ScenarioMessageSnapshotEvent)
+            else None
+        )
+    )
+
+    await executor.run()
+
+    # The final succeed() step adds no messages, so it sends no empty delta
+    assert len(snapshots) == 6
+    assert [
+        getattr(snapshot, "base_message_count", None) for snapshot in snapshots
+    ] == [None, 1, 2, None, 4, 5]
+    assert [len(snapshot.messages) for snapshot in snapshots] == [1, 1, 1, 4, 1, 1]
+
+    # Messages keep the same id from one snapshot to the next
+    assert [message.id for message in snapshots[3].messages] == [
+        snapshots[0].messages[0].id,
+        snapshots[1].messages[0].id,
+        snapshots[2].messages[0].id,
+        snapshots[3].messages[3].id,
+    ]
+
+
+def test_snapshot_builder_picks_up_messages_changed_in_place():
+    builder = MessageSnapshotBuilder(mode="delta")
+    conversation = [
+        {"id": "m1", "role": "user", "content": "Hi"},
+        {"id": "m2", "role": "assistant", "content": "Hey"},
+    ]
+    builder.build(conversation)  # type: ignore
+
+    conversation[1]["content"] = "Hey, how can I help?"
+    messages, base_message_count = builder.build(conversation)  # type: ignore
+
+    assert base_message_count is None
+    assert [message.id for message in messages] == ["m1", "m2"]
+    assert messages[1].content == "Hey, how can I help?"
+
+    conversation.append({"id": "m3", "role": "user", "content": "Where is the station?"})
+    messages, base_message_count = builder.build(conversation)  # type: ignore
+
+    assert base_message_count == 2
+    assert [message.id for message in messages] == ["m3"]
+
+
+def test_add_message_stamps_stable_message_ids():
+    executor = ScenarioExecutor(
+        name="test name",
+        description="test description",
+        agents=[
+            MockAgent(),
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+    )
+    executor.reset()
+
+    reused_message: ChatCompletionMessageParam = {"role": "user", "content": "Hi"}
+    executor.add_message(reused_message)
+    executor.add_message({"role": "assistant", "content": "Hey", "id": "msg-custom"})  # type: ignore
+    executor.add_message(reused_message)
+
+    ids = [message["id"] for message in executor._state.messages]  # type: ignore
+    assert ids[0] and ids[1] == "msg-custom"
+    assert len(set(ids)) == 3, "the same message added twice gets its own id"
+    assert executor._state.messages[0] is reused_message
+    assert executor._state.messages[0]["id"] == ids[0], "keeps its first id"  # type: ignore
+
+
+def test_converted_messages_are_reused_by_id():
+    messages: List[ChatCompletionMessageParamWithTrace] = [
+        {"role": "user", "content": "Hi", "id": "msg-1", "trace_id": None},
+        {"role": "assistant", "content": "Hey", "id": "msg-2", "trace_id": None},
+    ]
+    cache: Dict[str, MessageType] = {}
+
+    first = convert_messages_to_api_client_messages(messages, cache=cache)
+    second = convert_messages_to_api_client_messages(messages, cache=cache)
+
+    assert [message.id for message in first] == ["msg-1", "msg-2"]
+    assert all(a is b for a, b in zip(first, second))
+    assert set(cache.keys()) == {"msg-1", "msg-2"}
+
+
+@pytest.mark.asyncio
+async def test_records_timings_and_token_usage_of_each_agent_call():
+    executor = ScenarioExecutor(
+        name="test name",
+        description="test description",
+        agents=[
+            LiteLLMAgent(),
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+        script=[
+            scenario.user(),
+            scenario.agent(),
+            scenario.user(),
+            scenario.agent(),
+            scenario.succeed(),
+        ],
+    )
+
+    result = await executor.run()
+
+    assert result.timings is not None
+    assert [(call.turn, call.role) for call in result.timings.calls] == [
+        (0, "User"),
+        (0, "Agent"),
+        (1, "User"),
+        (1, "Agent"),
+    ]
+
+    agent_call = result.timings.calls[1]
+    assert agent_call.agent == "LiteLLMAgent"
+    assert agent_call.llm_calls == 1
+    assert agent_call.prompt_tokens > 0
+    assert agent_call.completion_tokens > 0
+    assert agent_call.cost > 0
+    assert agent_call.time_to_first_response is not None
+    assert agent_call.time_to_first_response <= agent_call.latency
+    assert result.timings.calls[0].llm_calls == 0
+    assert result.timings.calls[0].time_to_first_response is None
+
+    by_role = result.timings.by_role()
+    assert by_role["Agent"].calls == 2
+    assert by_role["Agent"].prompt_tokens == 2 * agent_call.prompt_tokens
+    assert by_role["User"].prompt_tokens == 0
+    assert list(result.timings.by_turn()) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_records_token_usage_of_completions_imported_from_litellm():
+    executor = ScenarioExecutor(
+        name="test name",
+        description="test description",
+        agents=[
+            ImportedCompletionAgent(),
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+        script=[scenario.user(), scenario.agent(), scenario.succeed()],
+    )
+
+    result = await executor.run()
+
+    assert result.timings is not None
+    agent_call = result.timings.calls[1]
+    assert agent_call.agent == "ImportedCompletionAgent"
+    assert agent_call.llm_calls == 1
+    assert agent_call.prompt_tokens > 0
+
+
+def test_timing_summary_percentiles():
+    calls = [
+        AgentCallTiming(turn=turn, role="Agent", agent="MockAgent", latency=latency)
+        for turn, latency in enumerate([1.0, 2.0, 3.0, 4.0, 5.0])
+    ]
+
+    summary = TimingSummary.of(calls)
+
+    assert summary.calls == 5
+    assert summary.latency == 15.0
+    assert summary.p50_latency == 3.0
+    assert summary.p95_latency == pytest.approx(4.8)
+    assert TimingSummary.of([]).p50_latency is None
+
+
+@pytest.mark.asyncio
+async def test_scenario_ends_once_its_token_budget_is_used_up():
+    executor = ScenarioExecutor(
+        name="test name",
+        description="test description",
+        agents=[
+            LiteLLMAgent(),
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+        script=[
+            scenario.user(),
+            scenario.agent(),
+            scenario.user(),
+            scenario.agent(),
+            scenario.succeed(),
+        ],
+        token_budget=1,
+    )
+
+    result = await executor.run()
+
+    assert not result.success
+    assert result.reasoning is not None
+    assert result.reasoning.startswith("Scenario token budget exceeded")
+    assert result.timings is not None
+    assert len(result.timings.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_scenario_ends_once_the_session_cost_budget_is_used_up(monkeypatch):
+    spend = SessionSpend()
+    spend.add(tokens=1000, cost=1.5)
+    monkeypatch.setattr(SessionSpend, "default_spend", spend)
+    monkeypatch.setattr(
+        ScenarioConfig, "default_config", ScenarioConfig(session_cost_budget=1.0)
+    )
+
+    executor = ScenarioExecutor(
+        name="test name",
+        description="test description",
+        agents=[
+            MockAgent(),
+            MockUserSimulatorAgent(model="none"),
+            MockJudgeAgent(model="none", criteria=["test criteria"]),
+        ],
+    )
+
+    result = await executor.run()
+
+    assert not result.success
+    assert result.reasoning is not None
+    assert result.reasoning.startswith("Session cost budget exceeded")
@@ -47,6 +47,13 @@ class MockEventReporter(EventReporter):
         self.posted_events.append(event)
         return {}
 
+    async def post_events(self, events: List[ScenarioEvent]) -> None:
+        """Have the events stored one by one."""
+        return None
+
+    async def aclose(self) -> None:
+        pass
+
 
 # Type alias to reduce repetition
 ExecutedEventsFixture = Tuple[List[ScenarioEvent], ScenarioExecutor]
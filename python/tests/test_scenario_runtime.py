@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import pytest
+
+import scenario
+from scenario.scenario_runtime import ScenarioRuntime
+
+
+class MockJudgeAgent(scenario.JudgeAgent):
+    async def call(self, input: scenario.AgentInput) -> scenario.AgentReturnTypes:  # type: ignore
+        return scenario.ScenarioResult(
+            success=True,
+            messages=[],
+            reasoning="test reasoning",
+            passed_criteria=["test criteria"],
+        )
+
+
+class MockUserSimulatorAgent(scenario.UserSimulatorAgent):
+    async def call(self, input: scenario.AgentInput) -> scenario.AgentReturnTypes:  # type: ignore
+        return "Hi, I'm a user"
+
+
+class ThreadRecordingAgent(scenario.AgentAdapter):
+    def __init__(self):
+        self.threads = set()
+        self.loops = set()
+
+    async def call(self, input: scenario.AgentInput) -> scenario.AgentReturnTypes:  # type: ignore
+        self.threads.add(threading.get_ident())
+        self.loops.add(id(asyncio.get_running_loop()))
+        return "Hey, how can I help you?"
+
+
+@pytest.mark.asyncio
+async def test_runtime_reuses_worker_threads_and_loops():
+    runtime = ScenarioRuntime(max_workers=2)
+
+    async def get_thread_and_loop():
+        return threading.get_ident(), id(asyncio.get_running_loop())
+
+    try:
+        results = [await runtime.run(get_thread_and_loop) for _ in range(5)]
+    finally:
+        runtime.shutdown()
+
+    threads = {thread for thread, _ in results}
+    loops = {loop for _, loop in results}
+    assert threading.get_ident() not in threads
+    assert len(threads) <= 2
+    assert len(loops) == len(threads), "each worker keeps a single loop"
+
+
+@pytest.mark.asyncio
+async def test_runtime_bounds_concurrency():
+    runtime = ScenarioRuntime(max_workers=2)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+    overlapped = threading.Event()
+
+    async def track():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+            if running >= 2:
+                overlapped.set()
+        # Hold the worker until two runs are in flight, so that the bound is
+        # reached regardless of how the runs get scheduled
+        await asyncio.to_thread(overlapped.wait, 10)
+        with lock:
+            running -= 1
+
+    try:
+        await asyncio.gather(*[runtime.run(track) for _ in range(6)])
+    finally:
+        runtime.shutdown()
+
+    assert overlapped.is_set()
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_runtime_runs_nested_work_inline():
+    runtime = ScenarioRuntime(max_workers=1)
+
+    async def inner():
+        return threading.get_ident()
+
+    async def outer():
+        return threading.get_ident(), await runtime.run(inner)
+
+    try:
+        outer_thread, inner_thread = await runtime.run(outer)
+    finally:
+        runtime.shutdown()
+
+    assert outer_thread == inner_thread
+
+
+@pytest.mark.asyncio
+async def test_runtime_refuses_work_after_shutdown():
+    runtime = ScenarioRuntime(max_workers=1)
+    runtime.shutdown()
+
+    async def noop():
+        return None
+
+    with pytest.raises(RuntimeError):
+        await runtime.run(noop)
+
+
+@pytest.mark.asyncio
+async def test_runtime_closes_worker_loops_after_shutdown_without_waiting():
+    runtime = ScenarioRuntime(max_workers=1)
+    release = threading.Event()
+
+    async def get_loop():
+        await asyncio.to_thread(release.wait, 5)
+        return asyncio.get_running_loop()
+
+    future = runtime.submit(get_loop)
+    runtime.shutdown(wait=False)
+    release.set()
+    loop = await asyncio.wrap_future(future)
+
+    for _ in range(100):
+        if loop.is_closed():
+            break
+        await asyncio.sleep(0.01)
+    assert loop.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_scenario_run_dispatches_on_configured_runtime():
+    ScenarioRuntime.configure(max_workers=1)
+    agent = ThreadRecordingAgent()
+
+    try:
+        for _ in range(3):
+            result = await scenario.run(
+                name="runtime test",
+                description="test description",
+                agents=[
+                    agent,
+                    MockUserSimulatorAgent(model="none"),
+                    MockJudgeAgent(model="none", criteria=["test criteria"]),
+                ],
+            )
+            assert result.success
+    finally:
+        ScenarioRuntime.shutdown_default()
+
+    assert len(agent.threads) == 1
+    assert len(agent.loops) == 1
+    assert threading.get_ident() not in agent.threads